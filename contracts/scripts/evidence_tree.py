@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+"""
+Merkleized Evidence Commitments for AIJudgeMarket
+
+Evidence for a market is a set of documents that grows over time. Instead of
+hashing the whole corpus into one evidence hash, each document is hashed once
+into a leaf of a persistent Merkle tree. Adding or changing a document
+re-hashes that document and the O(log n) nodes above it. Files whose size
+and mtime are unchanged are not read again.
+
+The root takes the place of the evidence hash. Its commitment is
+sha256(root || salt), as SP1Prover._compute_commitment computes for a single
+document, and any document can be shown to be part of the committed evidence
+with an inclusion proof.
+
+Hashing (SHA-256, domain-separated so a leaf can never pass as a node):
+    leaf = sha256(0x00 || sha256(document))
+    node = sha256(0x01 || left || right)
+A level with an odd number of nodes promotes its last node unchanged.
+
+Usage:
+    python3 evidence_tree.py --tree market-7.json add reports/*.pdf
+    python3 evidence_tree.py --tree market-7.json add --id tweet-1 --file -
+    python3 evidence_tree.py --tree market-7.json root --salt "secret_salt_1234"
+    python3 evidence_tree.py --tree market-7.json prove reports/a.pdf --output a.proof.json
+    python3 evidence_tree.py verify --proof a.proof.json --root 0x...
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from sp1_prover import EvidenceSource, evidence_argument, evidence_size, hash_evidence
+
+LEAF_PREFIX = b"\x00"
+NODE_PREFIX = b"\x01"
+
+# Root of a tree without documents
+EMPTY_ROOT = b"\x00" * 32
+
+
+def leaf_hash(document_hash: bytes) -> bytes:
+    """Leaf of a document, from its SHA-256"""
+    return hashlib.sha256(LEAF_PREFIX + document_hash).digest()
+
+
+def node_hash(left: bytes, right: bytes) -> bytes:
+    """Parent of two nodes"""
+    return hashlib.sha256(NODE_PREFIX + left + right).digest()
+
+
+@dataclass
+class EvidenceDocument:
+    """One document of the evidence set"""
+    id: str
+    hash: bytes  # sha256 of the document
+    size: int
+    path: Optional[str] = None  # set for documents added from a file
+    mtime_ns: Optional[int] = None
+
+    def to_dict(self) -> Dict:
+        return {"id": self.id, "hash": self.hash.hex(), "size": self.size,
+                "path": self.path, "mtime_ns": self.mtime_ns}
+
+    @classmethod
+    def from_dict(cls, d: Dict) -> "EvidenceDocument":
+        return cls(id=d["id"], hash=bytes.fromhex(d["hash"]), size=d["size"],
+                   path=d.get("path"), mtime_ns=d.get("mtime_ns"))
+
+
+@dataclass
+class InclusionProof:
+    """Path from a document's leaf to the root"""
+    document_id: str
+    index: int
+    document_hash: bytes
+    siblings: List[Tuple[bytes, bool]] = field(default_factory=list)  # (hash, sibling is on the left)
+    root: bytes = EMPTY_ROOT
+
+    def verify(self, root: Optional[bytes] = None) -> bool:
+        """True if the document hashes up to root (default: the root it was made for)"""
+        node = leaf_hash(self.document_hash)
+        for sibling, is_left in self.siblings:
+            node = node_hash(sibling, node) if is_left else node_hash(node, sibling)
+        return node == (self.root if root is None else root)
+
+    def to_dict(self) -> Dict:
+        return {
+            "document_id": self.document_id,
+            "index": self.index,
+            "document_hash": "0x" + self.document_hash.hex(),
+            "siblings": [{"hash": "0x" + h.hex(), "position": "left" if is_left else "right"}
+                         for h, is_left in self.siblings],
+            "root": "0x" + self.root.hex(),
+        }
+
+    @classmethod
+    def from_dict(cls, d: Dict) -> "InclusionProof":
+        return cls(
+            document_id=d["document_id"],
+            index=d["index"],
+            document_hash=bytes.fromhex(d["document_hash"][2:]),
+            siblings=[(bytes.fromhex(s["hash"][2:]), s["position"] == "left") for s in d["siblings"]],
+            root=bytes.fromhex(d["root"][2:]),
+        )
+
+
+class EvidenceTree:
+    """
+    Persistent Merkle tree over the documents of one market's evidence.
+
+    Documents keep their leaf position for the life of the tree, so every
+    level is stored and an update only walks one path to the root.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        """
+        Args:
+            path: JSON file the tree is loaded from (if it exists) and saved to
+        """
+        self.path = Path(path) if path else None
+        self.documents: List[EvidenceDocument] = []
+        self.levels: List[List[bytes]] = [[]]  # levels[0] are the leaves, levels[-1] the root
+        self._index: Dict[str, int] = {}
+        self.hashed_bytes = 0  # document bytes read since load
+        if self.path and self.path.exists():
+            state = json.loads(self.path.read_text())
+            self.documents = [EvidenceDocument.from_dict(d) for d in state["documents"]]
+            self.levels = [[bytes.fromhex(h) for h in level] for level in state["levels"]]
+            self._index = {doc.id: i for i, doc in enumerate(self.documents)}
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    def __contains__(self, document_id: str) -> bool:
+        return document_id in self._index
+
+    @property
+    def root(self) -> bytes:
+        """bytes32 root, used in place of the evidence hash"""
+        return self.levels[-1][0] if self.documents else EMPTY_ROOT
+
+    def commitment(self, salt: str) -> bytes:
+        """sha256(root || salt), the same scheme as SP1Prover._compute_commitment"""
+        h = hashlib.sha256()
+        h.update(self.root)
+        h.update(salt.encode())
+        return h.digest()
+
+    def add(self, document_id: str, source: EvidenceSource, record_path: bool = True) -> bool:
+        """
+        Add a document or replace its content.
+
+        A Path whose size and mtime match the stored document is not read.
+        record_path=False hashes a Path without remembering it (e.g. a
+        spooled stdin), so it is read again on the next add.
+
+        Returns:
+            True if the root changed
+        """
+        existing = self.documents[self._index[document_id]] if document_id in self._index else None
+        path, mtime_ns = None, None
+        size = evidence_size(source)
+        if isinstance(source, os.PathLike) and record_path:
+            path, mtime_ns = os.path.abspath(source), os.stat(source).st_mtime_ns
+            if existing and (existing.path, existing.mtime_ns, existing.size) == (path, mtime_ns, size):
+                return False
+        document_hash = hash_evidence(source)
+        self.hashed_bytes += size
+        return self.set_document(EvidenceDocument(document_id, document_hash, size, path, mtime_ns))
+
+    def set_document(self, document: EvidenceDocument) -> bool:
+        """
+        Insert or replace a document whose hash is already known.
+
+        Returns:
+            True if the root changed
+        """
+        index = self._index.get(document.id)
+        if index is None:
+            index = len(self.documents)
+            self.documents.append(document)
+            self.levels[0].append(b"")
+            self._index[document.id] = index
+        else:
+            unchanged = self.documents[index].hash == document.hash
+            self.documents[index] = document  # keep the new size/mtime either way
+            if unchanged:
+                return False
+        self.levels[0][index] = leaf_hash(document.hash)
+        self._update_path(index)
+        return True
+
+    def _update_path(self, index: int):
+        """Recompute the nodes above leaf index: one hash per level"""
+        level = 0
+        while len(self.levels[level]) > 1:
+            nodes = self.levels[level]
+            if level + 1 == len(self.levels):
+                self.levels.append([])
+            parent, left = index // 2, index & ~1
+            value = node_hash(nodes[left], nodes[left + 1]) if left + 1 < len(nodes) else nodes[left]
+            parents = self.levels[level + 1]
+            if parent == len(parents):
+                parents.append(value)
+            else:
+                parents[parent] = value
+            index, level = parent, level + 1
+
+    def prove(self, document_id: str) -> InclusionProof:
+        """Inclusion proof of a document against the current root"""
+        if document_id not in self._index:
+            raise KeyError(f"Document {document_id!r} is not in the evidence tree")
+        index = position = self._index[document_id]
+        siblings = []
+        for nodes in self.levels[:-1]:
+            sibling = position ^ 1
+            if sibling < len(nodes):
+                siblings.append((nodes[sibling], sibling < position))
+            position //= 2
+        return InclusionProof(document_id, index, self.documents[index].hash, siblings, self.root)
+
+    def save(self, path: Optional[Path] = None):
+        """Write the tree atomically (to path, else the one it was loaded from)"""
+        path = Path(path) if path else self.path
+        if path is None:
+            raise ValueError("No path to save the evidence tree to")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps({
+            "root": "0x" + self.root.hex(),
+            "documents": [doc.to_dict() for doc in self.documents],
+            "levels": [[h.hex() for h in level] for level in self.levels],
+        }))
+        os.replace(tmp, path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Merkleized evidence commitments for AIJudgeMarket")
+    parser.add_argument("--tree", help="Evidence tree JSON file (created on first add)")
+    subparsers = parser.add_subparsers(dest="command", help="Command to run")
+
+    add_parser = subparsers.add_parser("add", help="Add or update documents (unchanged files are skipped)")
+    add_parser.add_argument("files", nargs="*", help="Document files; the id is the path as given")
+    add_parser.add_argument("--id", help="Document id for --file/--content")
+    add_parser.add_argument("--file", help="Document file ('-' for stdin)")
+    add_parser.add_argument("--content", help="Document text")
+
+    root_parser = subparsers.add_parser("root", help="Print the root (and commitment with --salt)")
+    root_parser.add_argument("--salt", help="Salt for the commitment sha256(root || salt)")
+
+    prove_parser = subparsers.add_parser("prove", help="Inclusion proof of a document")
+    prove_parser.add_argument("document_id", help="Document id")
+    prove_parser.add_argument("--output", help="Write the proof JSON here (default: stdout)")
+
+    verify_parser = subparsers.add_parser("verify", help="Check an inclusion proof")
+    verify_parser.add_argument("--proof", required=True, help="Proof JSON file")
+    verify_parser.add_argument("--root", help="Expected root (default: the root in the proof)")
+    verify_parser.add_argument("--document", help="Also check the document file hashes to the proven leaf")
+
+    args = parser.parse_args()
+
+    if not args.command:
+        parser.print_help()
+        return
+
+    if args.command == "verify":
+        with open(args.proof) as f:
+            proof = InclusionProof.from_dict(json.load(f))
+        root = bytes.fromhex(args.root[2:] if args.root.startswith("0x") else args.root) if args.root else None
+        if args.document and hash_evidence(Path(args.document)) != proof.document_hash:
+            print(f"❌ {args.document} does not match the proven document hash")
+            sys.exit(1)
+        if not proof.verify(root):
+            print(f"❌ {proof.document_id} is not included under 0x{(root or proof.root).hex()}")
+            sys.exit(1)
+        print(f"✅ {proof.document_id} is included under 0x{(root or proof.root).hex()}")
+        return
+
+    if not args.tree:
+        parser.error(f"{args.command} requires --tree")
+    tree = EvidenceTree(Path(args.tree))
+
+    if args.command == "add":
+        sources = [(name, Path(name), True) for name in args.files]
+        if args.file or args.content is not None:
+            if not args.id:
+                parser.error("--file/--content require --id")
+            sources.append((args.id, evidence_argument(args.content, args.file), args.file != "-"))
+        if not sources:
+            parser.error("add requires files, --file or --content")
+
+        start = time.perf_counter()
+        changed = sum(tree.add(document_id, source, record_path) for document_id, source, record_path in sources)
+        tree.save()
+        print(f"✅ {changed} of {len(sources)} documents changed, {len(tree)} in tree "
+              f"({tree.hashed_bytes / 2**20:.1f} MiB hashed in {time.perf_counter() - start:.2f}s)")
+        print(f"Root: 0x{tree.root.hex()}")
+
+    elif args.command == "root":
+        print(f"Documents: {len(tree)}")
+        print(f"Root: 0x{tree.root.hex()}")
+        if args.salt:
+            print(f"Commitment: 0x{tree.commitment(args.salt).hex()}")
+
+    elif args.command == "prove":
+        try:
+            proof = tree.prove(args.document_id)
+        except KeyError as e:
+            print(f"❌ {e.args[0]}")
+            sys.exit(1)
+        output = json.dumps(proof.to_dict(), indent=2)
+        if args.output:
+            with open(args.output, "w") as f:
+                f.write(output)
+            print(f"💾 Proof for {args.document_id} ({len(proof.siblings)} siblings) written to {args.output}")
+        else:
+            print(output)
+
+
+if __name__ == "__main__":
+    main()
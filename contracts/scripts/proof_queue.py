@@ -0,0 +1,566 @@
+#!/usr/bin/env python3
+"""
+Persistent Proof Job Queue for AIJudgeMarket
+
+A SQLite-backed queue of SP1 proof jobs and the workers that drain it, so a
+preempted or restarted prover machine picks up where it left off.
+
+Lifecycle: queued -> executing -> proving -> done | failed
+- executing: the program runs in the SP1 executor first (SP1Prover.execute_*);
+  outputs that disagree with the Python computation fail the job at once,
+  without retrying, since proving it would fail the same way
+- proving: the proof itself; finished proofs also land in SP1Prover's proof
+  cache, so a job whose proof completed just before a crash finishes instantly
+  when it is claimed again
+
+A worker holds a lease on each job it runs and renews it while proving.
+Each worker thread leases under its own id (<worker id>/<thread>), so a
+sibling thread can never pass the lease check of a job it did not claim.
+A job whose lease expires (worker killed, machine preempted) is claimed
+again by the next worker. A restarted worker with the same --worker-id
+takes its own jobs back immediately, and SIGTERM (spot interruption notice)
+releases the leases and terminates the running prover host processes before
+exiting. Errors are retried with exponential backoff up to max_attempts.
+Preemptions do not count as attempts.
+
+Jobs are claimed in order of reveal deadline (jobs without one last), and a
+job whose deadline has passed is failed instead of proved.
+
+The database holds the private inputs (evidence and salts, or evidence file
+paths) and is created with mode 0600.
+
+Usage:
+    python3 proof_queue.py submit --program evidence --content-file a.txt --salt "..." --deadline 2026-10-20T12:00Z
+    python3 proof_queue.py submit --program ai-analysis --input items.jsonl
+    python3 proof_queue.py worker --output-dir proofs/ --threads 2
+    python3 proof_queue.py status
+    python3 proof_queue.py retry --id 7
+"""
+
+import argparse
+import json
+import os
+import signal
+import socket
+import sqlite3
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from sp1_prover import PROOF_MODES, SP1_BACKENDS, SP1Prover, default_cache_dir, evidence_argument
+
+JOB_STATES = ("queued", "executing", "proving", "done", "failed")
+
+PROGRAMS = ("evidence", "ai-analysis")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    program TEXT NOT NULL,
+    inputs TEXT NOT NULL,
+    label TEXT,
+    deadline REAL,
+    status TEXT NOT NULL DEFAULT 'queued',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL DEFAULT 3,
+    claims INTEGER NOT NULL DEFAULT 0,
+    worker TEXT,
+    lease_expires REAL,
+    not_before REAL NOT NULL DEFAULT 0,
+    error TEXT,
+    result TEXT,
+    created REAL NOT NULL,
+    updated REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_claim ON jobs (status, deadline, id);
+"""
+
+
+def default_queue_path() -> Path:
+    """proof_jobs.sqlite next to the proof cache"""
+    return default_cache_dir().parent / "proof_jobs.sqlite"
+
+
+def parse_deadline(value: str) -> float:
+    """Unix timestamp or ISO 8601 time (UTC if no offset)"""
+    try:
+        return float(value)
+    except ValueError:
+        moment = datetime.fromisoformat(value)
+        if moment.tzinfo is None:
+            moment = moment.replace(tzinfo=timezone.utc)
+        return moment.timestamp()
+
+
+@dataclass
+class ProofQueueJob:
+    """One row of the queue"""
+    id: int
+    program: str  # evidence | ai-analysis
+    inputs: Dict  # {"content"|"content_file", "salt"} or {"evidence"|"evidence_file", "ai_output"}
+    label: Optional[str]
+    deadline: Optional[float]
+    status: str
+    attempts: int
+    max_attempts: int
+    claims: int
+    worker: Optional[str]
+    lease_expires: Optional[float]
+    error: Optional[str]
+    result: Optional[Dict]
+    created: float
+    updated: float
+
+    @classmethod
+    def from_row(cls, row: sqlite3.Row) -> "ProofQueueJob":
+        return cls(
+            id=row["id"], program=row["program"], inputs=json.loads(row["inputs"]), label=row["label"],
+            deadline=row["deadline"], status=row["status"], attempts=row["attempts"],
+            max_attempts=row["max_attempts"], claims=row["claims"], worker=row["worker"],
+            lease_expires=row["lease_expires"], error=row["error"],
+            result=json.loads(row["result"]) if row["result"] else None,
+            created=row["created"], updated=row["updated"]
+        )
+
+    def summary(self) -> Dict:
+        """Status view without the private inputs"""
+        return {
+            "id": self.id, "label": self.label, "program": self.program, "status": self.status,
+            "deadline": self.deadline, "attempts": self.attempts, "claims": self.claims,
+            "worker": self.worker, "error": self.error, "result": self.result,
+        }
+
+
+class ProofQueue:
+    """
+    SQLite job store. Safe to share between threads (one connection each)
+    and between worker processes on one machine (WAL mode).
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path else default_queue_path()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if not self.path.exists():
+            os.close(os.open(self.path, os.O_CREAT | os.O_WRONLY, 0o600))
+        self._local = threading.local()
+        with self._db() as db:
+            db.execute("PRAGMA journal_mode=WAL")
+            db.executescript(SCHEMA)
+
+    def _db(self) -> sqlite3.Connection:
+        db = getattr(self._local, "db", None)
+        if db is None:
+            db = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            db.row_factory = sqlite3.Row
+            self._local.db = db
+        return db
+
+    def submit(
+        self,
+        program: str,
+        inputs: Dict,
+        deadline: Optional[float] = None,
+        label: Optional[str] = None,
+        max_attempts: int = 3
+    ) -> int:
+        """
+        Queue a proof job.
+
+        Args:
+            program: "evidence" or "ai-analysis"
+            inputs: Private inputs, as in a batch JSONL item
+            deadline: Reveal deadline (unix time); earlier deadlines are proved first
+
+        Returns:
+            Job id
+        """
+        if program not in PROGRAMS:
+            raise ValueError(f"Unknown program {program!r} (expected one of {', '.join(PROGRAMS)})")
+        now = time.time()
+        cursor = self._db().execute(
+            "INSERT INTO jobs (program, inputs, label, deadline, max_attempts, created, updated) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (program, json.dumps(inputs), label, deadline, max_attempts, now, now)
+        )
+        return cursor.lastrowid
+
+    def claim(self, worker: str, lease_seconds: float) -> Optional[ProofQueueJob]:
+        """
+        Lease the most urgent runnable job: queued and past its backoff, or
+        running under an expired lease. Jobs past their deadline are failed.
+        """
+        db = self._db()
+        now = time.time()
+        db.execute("BEGIN IMMEDIATE")
+        try:
+            db.execute(
+                "UPDATE jobs SET status = 'failed', error = 'Reveal deadline passed', worker = NULL, "
+                "lease_expires = NULL, updated = ? WHERE deadline < ? AND (status = 'queued' OR "
+                "(status IN ('executing', 'proving') AND lease_expires < ?))",
+                (now, now, now)
+            )
+            row = db.execute(
+                "SELECT id FROM jobs WHERE (status = 'queued' AND not_before <= ?) "
+                "OR (status IN ('executing', 'proving') AND lease_expires < ?) "
+                "ORDER BY deadline IS NULL, deadline, id LIMIT 1",
+                (now, now)
+            ).fetchone()
+            if row is None:
+                db.execute("COMMIT")
+                return None
+            db.execute(
+                "UPDATE jobs SET status = 'executing', worker = ?, lease_expires = ?, claims = claims + 1, "
+                "updated = ? WHERE id = ?",
+                (worker, now + lease_seconds, now, row["id"])
+            )
+            db.execute("COMMIT")
+        except BaseException:
+            db.execute("ROLLBACK")
+            raise
+        return self.get(row["id"])
+
+    def _update_leased(self, job_id: int, worker: str, assignments: str, params: tuple) -> bool:
+        """Update a job only while worker still holds its lease"""
+        cursor = self._db().execute(
+            f"UPDATE jobs SET {assignments}, updated = ? WHERE id = ? AND worker = ? "
+            "AND status IN ('executing', 'proving')",
+            params + (time.time(), job_id, worker)
+        )
+        return cursor.rowcount == 1
+
+    def heartbeat(self, job_id: int, worker: str, lease_seconds: float) -> bool:
+        """Extend a lease; False if it was lost to another worker"""
+        return self._update_leased(job_id, worker, "lease_expires = ?", (time.time() + lease_seconds,))
+
+    def set_status(self, job_id: int, worker: str, status: str) -> bool:
+        return self._update_leased(job_id, worker, "status = ?", (status,))
+
+    def complete(self, job_id: int, worker: str, result: Dict) -> bool:
+        return self._update_leased(
+            job_id, worker, "status = 'done', result = ?, error = NULL, worker = NULL, lease_expires = NULL",
+            (json.dumps(result),)
+        )
+
+    def fail(self, job_id: int, worker: str, error: str, retry: bool = True, backoff: float = 30.0) -> bool:
+        """
+        Record a failed attempt: back to queued after backoff * 2^(attempts-1)
+        while attempts remain (and retry is set), else failed
+        """
+        job = self.get(job_id)
+        attempts = job.attempts + 1
+        if retry and attempts < job.max_attempts:
+            return self._update_leased(
+                job_id, worker,
+                "status = 'queued', attempts = ?, error = ?, not_before = ?, worker = NULL, lease_expires = NULL",
+                (attempts, error, time.time() + backoff * 2 ** (attempts - 1))
+            )
+        return self._update_leased(
+            job_id, worker, "status = 'failed', attempts = ?, error = ?, worker = NULL, lease_expires = NULL",
+            (attempts, error)
+        )
+
+    def release(self, job_id: int, worker: str) -> bool:
+        """Give a job back without counting an attempt (shutdown, preemption)"""
+        return self._update_leased(job_id, worker, "status = 'queued', worker = NULL, lease_expires = NULL", ())
+
+    def recover(self, worker: str) -> int:
+        """Requeue jobs still leased to this worker id or any of its threads, e.g. after a restart"""
+        prefix = f"{worker}/"
+        cursor = self._db().execute(
+            "UPDATE jobs SET status = 'queued', worker = NULL, lease_expires = NULL, updated = ? "
+            "WHERE (worker = ? OR substr(worker, 1, ?) = ?) AND status IN ('executing', 'proving')",
+            (time.time(), worker, len(prefix), prefix)
+        )
+        return cursor.rowcount
+
+    def retry(self, job_id: int) -> bool:
+        """Requeue a failed job with a fresh attempt budget"""
+        cursor = self._db().execute(
+            "UPDATE jobs SET status = 'queued', attempts = 0, not_before = 0, error = NULL, updated = ? "
+            "WHERE id = ? AND status = 'failed'",
+            (time.time(), job_id)
+        )
+        return cursor.rowcount == 1
+
+    def get(self, job_id: int) -> Optional[ProofQueueJob]:
+        row = self._db().execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return ProofQueueJob.from_row(row) if row else None
+
+    def jobs(self, status: Optional[str] = None, limit: int = 100) -> List[ProofQueueJob]:
+        """Most urgent first"""
+        query = "SELECT * FROM jobs"
+        params: tuple = ()
+        if status:
+            query += " WHERE status = ?"
+            params = (status,)
+        query += " ORDER BY deadline IS NULL, deadline, id LIMIT ?"
+        return [ProofQueueJob.from_row(row) for row in self._db().execute(query, params + (limit,))]
+
+    def counts(self) -> Dict[str, int]:
+        counts = dict.fromkeys(JOB_STATES, 0)
+        for row in self._db().execute("SELECT status, COUNT(*) AS n FROM jobs GROUP BY status"):
+            counts[row["status"]] = row["n"]
+        return counts
+
+
+class ProofWorker:
+    """
+    Drains a ProofQueue with an SP1Prover. Proofs are written to
+    <output_dir>/<job id>.bin and summarized in the job's result.
+
+    Jobs are leased per thread, as f"{worker_id}/{n}".
+    """
+
+    def __init__(
+        self,
+        queue: ProofQueue,
+        prover: SP1Prover,
+        output_dir: Path,
+        worker_id: Optional[str] = None,
+        lease_seconds: float = 300.0,
+        retry_backoff: float = 30.0
+    ):
+        self.queue = queue
+        self.prover = prover
+        self.output_dir = Path(output_dir)
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self.lease_seconds = lease_seconds
+        self.retry_backoff = retry_backoff
+        self.active: Dict[int, str] = {}  # job id -> lease id
+        self.stop = threading.Event()
+        self._active_lock = threading.Lock()
+
+    def process(self, job: ProofQueueJob) -> bool:
+        """
+        Execute, prove and record one claimed job, under the lease (job.worker)
+        it was claimed with. Returns True if it is done.
+        """
+        lease = job.worker
+        with self._active_lock:
+            self.active[job.id] = lease
+        renewing = threading.Event()
+        heartbeat = threading.Thread(target=self._heartbeat, args=(job.id, lease, renewing), daemon=True)
+        heartbeat.start()
+        try:
+            if job.program == "evidence":
+                source = evidence_argument(job.inputs.get("content"), job.inputs.get("content_file"))
+                args = (source, job.inputs["salt"])
+                execute, prove = self.prover.execute_evidence, self.prover.generate_evidence_proof
+            else:
+                source = evidence_argument(job.inputs.get("evidence"), job.inputs.get("evidence_file"))
+                args = (source, job.inputs["ai_output"])
+                execute, prove = self.prover.execute_ai_analysis, self.prover.generate_ai_analysis_proof
+
+            report = execute(*args)
+            if not report.matches:
+                fields = ", ".join(report.mismatches)
+                self.queue.fail(job.id, lease, f"Execution mismatch in {fields}", retry=False)
+                return False
+            if not self.queue.set_status(job.id, lease, "proving"):
+                return False  # lease lost; the new holder proves it
+
+            start = time.perf_counter()
+            proof = prove(*args)
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            proof_file = self.output_dir / f"{job.id}.bin"
+            tmp = proof_file.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_bytes(proof.proof)
+            os.replace(tmp, proof_file)
+
+            result = {
+                "evidence_hash": "0x" + proof.evidence_hash.hex(),
+                "public_values": "0x" + proof.public_values.hex(),
+                "proof_file": str(proof_file),
+                "cycles": report.cycles,
+                "seconds": round(time.perf_counter() - start, 2),
+            }
+            if job.program == "evidence":
+                result["commitment"] = "0x" + proof.commitment.hex()
+            else:
+                result["outcome"] = proof.outcome
+                result["confidence"] = proof.confidence
+            return self.queue.complete(job.id, lease, result)
+        except Exception as e:
+            if not self.stop.is_set():
+                self.queue.fail(job.id, lease, f"{type(e).__name__}: {e}", backoff=self.retry_backoff)
+            return False
+        finally:
+            renewing.set()
+            with self._active_lock:
+                self.active.pop(job.id, None)
+
+    def _heartbeat(self, job_id: int, lease: str, done: threading.Event):
+        while not done.wait(self.lease_seconds / 3):
+            if not self.queue.heartbeat(job_id, lease, self.lease_seconds):
+                print(f"⚠️  Lost the lease on job {job_id}", file=sys.stderr)
+                return
+
+    def release_active(self) -> int:
+        """Hand every in-flight job back to the queue"""
+        with self._active_lock:
+            active = list(self.active.items())
+        return sum(self.queue.release(job_id, lease) for job_id, lease in active)
+
+    def run(self, threads: int = 1, once: bool = False, poll_interval: float = 2.0):
+        """
+        Claim and process jobs on `threads` threads until stopped, or with
+        once=True until no job is runnable.
+        """
+        recovered = self.queue.recover(self.worker_id)
+        if recovered:
+            print(f"♻️  Recovered {recovered} in-flight job(s) of {self.worker_id}", file=sys.stderr)
+
+        def loop(lease: str):
+            while not self.stop.is_set():
+                job = self.queue.claim(lease, self.lease_seconds)
+                if job is None:
+                    if once:
+                        return
+                    self.stop.wait(poll_interval)
+                    continue
+                label = f" ({job.label})" if job.label else ""
+                print(f"⏳ Job {job.id}{label}: {job.program}, claim {job.claims}", file=sys.stderr)
+                ok = self.process(job)
+                state = self.queue.get(job.id)
+                print(f"{'✅' if ok else '❌'} Job {job.id}{label}: {state.status}"
+                      f"{'' if ok else f' ({state.error})'}", file=sys.stderr)
+
+        workers = [threading.Thread(target=loop, args=(f"{self.worker_id}/{n}",), daemon=True)
+                   for n in range(threads)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            while worker.is_alive():
+                worker.join(0.5)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Persistent SP1 proof job queue for AIJudgeMarket")
+    parser.add_argument("--db", help="Queue database (default: ~/.cache/aijudge/proof_jobs.sqlite)")
+    subparsers = parser.add_subparsers(dest="command", help="Command to run")
+
+    submit_parser = subparsers.add_parser("submit", help="Queue proof jobs")
+    submit_parser.add_argument("--program", required=True, choices=PROGRAMS, help="Program to prove")
+    submit_parser.add_argument("--content", help="Evidence content (evidence)")
+    submit_parser.add_argument("--content-file", help="Evidence file (evidence)")
+    submit_parser.add_argument("--salt", help="Random salt (evidence)")
+    submit_parser.add_argument("--evidence", help="Evidence analyzed (ai-analysis)")
+    submit_parser.add_argument("--evidence-file", help="Evidence file (ai-analysis)")
+    submit_parser.add_argument("--ai-output", help="AI model output (ai-analysis)")
+    submit_parser.add_argument("--input", help="JSONL items as for sp1_prover.py batch, optionally with "
+                                               "\"deadline\" and \"id\" ('-' for stdin)")
+    submit_parser.add_argument("--deadline", help="Reveal deadline: unix time or ISO 8601 (UTC default)")
+    submit_parser.add_argument("--label", help="Free-form label, e.g. market-7")
+    submit_parser.add_argument("--max-attempts", type=int, default=3, help="Attempts before failing (default: 3)")
+
+    worker_parser = subparsers.add_parser("worker", help="Run jobs until stopped")
+    worker_parser.add_argument("--output-dir", required=True, help="Write <job id>.bin proofs here")
+    worker_parser.add_argument("--worker-id", help="Stable id to reclaim this worker's jobs after a restart "
+                                                   "(default: hostname:pid)")
+    worker_parser.add_argument("--threads", type=int, default=1, help="Jobs proved at once (default: 1)")
+    worker_parser.add_argument("--lease", type=float, default=300.0, help="Lease seconds, renewed every third "
+                                                                          "(default: 300)")
+    worker_parser.add_argument("--retry-backoff", type=float, default=30.0,
+                               help="Seconds before the first retry, doubling after (default: 30)")
+    worker_parser.add_argument("--once", action="store_true", help="Exit when no job is runnable")
+    worker_parser.add_argument("--network", default="local", choices=list(SP1_BACKENDS),
+                               help="Proving network to use")
+    worker_parser.add_argument("--proof-mode", default="groth16", choices=PROOF_MODES,
+                               help="Proof type (groth16/plonk verify on-chain)")
+    worker_parser.add_argument("--cache-dir", help="Proof cache directory (default: ~/.cache/aijudge/proofs)")
+
+    status_parser = subparsers.add_parser("status", help="Show queue counts and jobs")
+    status_parser.add_argument("--id", type=int, help="Show one job")
+    status_parser.add_argument("--state", choices=JOB_STATES, help="Only jobs in this state")
+    status_parser.add_argument("--json", action="store_true", help="Print JSON")
+
+    retry_parser = subparsers.add_parser("retry", help="Requeue a failed job")
+    retry_parser.add_argument("--id", type=int, required=True, help="Job id")
+
+    args = parser.parse_args()
+
+    if not args.command:
+        parser.print_help()
+        return
+
+    queue = ProofQueue(Path(args.db) if args.db else None)
+
+    if args.command == "submit":
+        deadline = parse_deadline(args.deadline) if args.deadline else None
+        if args.input:
+            stream = sys.stdin if args.input == "-" else open(args.input)
+            items = [json.loads(line) for line in stream if line.strip()]
+        elif args.program == "evidence":
+            items = [{"content": args.content, "content_file": args.content_file, "salt": args.salt}]
+        else:
+            items = [{"evidence": args.evidence, "evidence_file": args.evidence_file, "ai_output": args.ai_output}]
+
+        required = ("salt",) if args.program == "evidence" else ("ai_output",)
+        source = ("content", "content_file") if args.program == "evidence" else ("evidence", "evidence_file")
+        for item in items:
+            inputs = {k: v for k, v in item.items() if v is not None and k not in ("deadline", "id")}
+            if not any(k in inputs for k in source) or any(k not in inputs for k in required):
+                parser.error(f"{args.program} jobs need --{source[0]} or --{source[1].replace('_', '-')}, "
+                             f"and --{required[0].replace('_', '-')}")
+            if source[1] in inputs:
+                if inputs[source[1]] == "-":
+                    parser.error("queued jobs read evidence files when they run; stdin is not supported")
+                inputs[source[1]] = os.path.abspath(inputs[source[1]])
+            item_deadline = parse_deadline(str(item["deadline"])) if item.get("deadline") else deadline
+            job_id = queue.submit(args.program, inputs, item_deadline, item.get("id") or args.label,
+                                  args.max_attempts)
+            print(f"📤 Job {job_id} queued ({args.program})")
+
+    elif args.command == "worker":
+        prover = SP1Prover(network=args.network, proof_mode=args.proof_mode,
+                           cache_dir=Path(args.cache_dir) if args.cache_dir else None)
+        worker = ProofWorker(queue, prover, Path(args.output_dir), args.worker_id, args.lease, args.retry_backoff)
+
+        def shutdown(signum, frame):
+            worker.stop.set()
+            released = worker.release_active()
+            terminated = prover.terminate()
+            print(f"⚠️  Signal {signum}: released {released} job(s) back to the queue, "
+                  f"stopped {terminated} prover process(es)", file=sys.stderr)
+            sys.exit(128 + signum)
+
+        signal.signal(signal.SIGTERM, shutdown)
+        signal.signal(signal.SIGINT, shutdown)
+        print(f"👷 Worker {worker.worker_id} on {queue.path} ({args.threads} thread(s))", file=sys.stderr)
+        worker.run(threads=args.threads, once=args.once)
+
+    elif args.command == "status":
+        if args.id is not None:
+            job = queue.get(args.id)
+            if job is None:
+                print(f"❌ Job {args.id} not found")
+                sys.exit(1)
+            print(json.dumps(job.summary(), indent=2))
+            return
+        jobs = queue.jobs(args.state)
+        if args.json:
+            print(json.dumps({"counts": queue.counts(), "jobs": [j.summary() for j in jobs]}, indent=2))
+            return
+        print("📋 Proof Queue")
+        print("=" * 70)
+        print("  ".join(f"{state}: {n}" for state, n in queue.counts().items()))
+        print("=" * 70)
+        for job in jobs:
+            deadline = time.strftime("%Y-%m-%d %H:%M UTC", time.gmtime(job.deadline)) if job.deadline else "-"
+            print(f"{job.id:>5}  {job.status:<10} {job.program:<12} {deadline:<21} "
+                  f"{job.label or '':<14} {job.error or ''}")
+
+    elif args.command == "retry":
+        if not queue.retry(args.id):
+            print(f"❌ Job {args.id} is not failed")
+            sys.exit(1)
+        print(f"📤 Job {args.id} requeued")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,415 @@
+#!/usr/bin/env python3
+"""
+Pre-Submission Proof Verification for AIJudgeMarket
+
+Checks SP1 proofs before any gas is spent on them and reports pass/fail per
+proof, so a bad or mismatched proof is caught here instead of after it is
+mined.
+
+Each proof is checked twice:
+- public values: decoded in the layout SP1VerifierIntegration parses, with
+  the same checks it applies (valid_length, outcome <= 1, confidence <=
+  10000), and cross-checked against the evidence_hash that will be passed to
+  revealVote (reveal_vote.py --evidence-hash / --evidence-file)
+- the proof: either an eth_call of verifyEvidenceProof / verifyAIAnalysisProof
+  (or the *Batch functions for aggregated proofs) against a local or fork
+  node, sent as JSON-RPC batches; or, with no --rpc-url, offline with the SP1
+  host's `verify`, which uses the same verifying keys as the SP1 verifier
+  contracts and the vkeys of the local program builds
+
+An evidence file is turned into the expected hash with ipfs_cid.py's
+evidence_bytes32, as reveal_vote.py --evidence-file does, with the same
+--hash choice (default raw, the sha256 the programs commit).
+
+Usage:
+    python3 proof_verifier.py --program evidence --proof proof.bin --public-values 0x... --evidence-file evidence.txt
+    python3 proof_verifier.py --rpc-url http://localhost:8545 --verifier 0x... --input proofs.jsonl
+    python3 sp1_prover.py batch --program evidence --input items.jsonl | python3 proof_verifier.py --input - --program evidence
+"""
+
+import argparse
+import json
+import os
+import sys
+import urllib.request
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from sp1_prover import (
+    PROOF_MODES, SP1_BACKENDS, SP1Prover, decode_aggregated_public_values, decode_public_values
+)
+
+# ipfs_cid.py, shared with reveal_vote.py
+SKILL_SCRIPTS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..",
+                             "skills", "aijudge-market", "scripts")
+
+# --program -> (zkVM program, aggregated, SP1VerifierIntegration function selector)
+PROGRAMS = {
+    "evidence": ("sp1-evidence", False, bytes.fromhex("f06a7fa9")),  # verifyEvidenceProof(bytes,bytes)
+    "ai-analysis": ("sp1-ai-analysis", False, bytes.fromhex("7ea70284")),  # verifyAIAnalysisProof(bytes,bytes)
+    "evidence-batch": ("sp1-evidence", True, bytes.fromhex("2167a6ad")),  # verifyEvidenceProofBatch(bytes,bytes)
+    "ai-analysis-batch": ("sp1-ai-analysis", True, bytes.fromhex("108c2e38")),  # verifyAIAnalysisProofBatch(...)
+}
+
+# Custom errors of SP1VerifierIntegration and the SP1 verifier gateway / verifiers
+REVERT_ERRORS = {
+    bytes.fromhex("09bde339"): "InvalidProof",
+    bytes.fromhex("3d879ff4"): "InvalidPublicValues",
+    bytes.fromhex("da4b0096"): "InvalidProgramVKey",
+    bytes.fromhex("7fcdd1f4"): "ProofInvalid",
+    bytes.fromhex("988066a1"): "WrongVerifierSelector",
+    bytes.fromhex("f208777e"): "RouteNotFound",
+    bytes.fromhex("f31f312b"): "VerifierFrozen",
+}
+ERROR_STRING_SELECTOR = bytes.fromhex("08c379a0")  # Error(string)
+
+
+@dataclass
+class ProofCheck:
+    """One proof to verify, plus what its public values must agree with"""
+    program: str  # key of PROGRAMS
+    proof: bytes
+    public_values: bytes
+    evidence_hash: Optional[bytes] = None  # planned revealVote evidenceHash (single proofs)
+    evidence_hashes: Dict[int, bytes] = field(default_factory=dict)  # market id -> evidenceHash (batches)
+    id: Optional[str] = None
+
+
+@dataclass
+class VerificationResult:
+    """Outcome of one ProofCheck"""
+    index: int
+    id: Optional[str]
+    program: str
+    outputs: List[dict]  # decoded public values, one per proof (with market_id for batches)
+    mismatches: List[str]  # public values the contract would reject or that disagree with the reveal
+    proof_valid: Optional[bool] = None  # None if the public values could not be decoded
+    error: Optional[str] = None  # revert or verifier error
+
+    @property
+    def passed(self) -> bool:
+        return self.proof_valid is True and not self.mismatches
+
+
+def check_public_values(check: ProofCheck) -> Tuple[List[dict], List[str]]:
+    """
+    Decode a proof's public values and compare them with the contract's
+    checks and the planned reveal
+
+    Returns:
+        (outputs, mismatches); raises ValueError if they cannot be decoded
+    """
+    program, aggregated, _ = PROGRAMS[check.program]
+    if aggregated:
+        _, items = decode_aggregated_public_values(program, check.public_values)
+    else:
+        items = [(None, check.public_values)]
+
+    outputs, mismatches = [], []
+    for market_id, values in items:
+        decoded = decode_public_values(program, values)
+        label = f"market {market_id} " if market_id is not None else ""
+        if program == "sp1-evidence" and not decoded["valid_length"]:
+            mismatches.append(f"{label}valid_length is false")
+        if program == "sp1-ai-analysis" and decoded["outcome"] > 1:
+            mismatches.append(f"{label}outcome {decoded['outcome']} is not 0 or 1")
+        if program == "sp1-ai-analysis" and decoded["confidence"] > 10000:
+            mismatches.append(f"{label}confidence {decoded['confidence']} exceeds 10000")
+        expected = check.evidence_hash if market_id is None else check.evidence_hashes.get(market_id)
+        if expected is not None and decoded["evidence_hash"] != expected.hex():
+            mismatches.append(f"{label}evidence_hash 0x{decoded['evidence_hash']} != reveal 0x{expected.hex()}")
+        if market_id is not None:
+            decoded = dict(decoded, market_id=market_id)
+        outputs.append(decoded)
+
+    if aggregated:
+        missing = sorted(set(check.evidence_hashes) - {output["market_id"] for output in outputs})
+        mismatches += [f"market {market_id} is not in the batch" for market_id in missing]
+    return outputs, mismatches
+
+
+def decode_revert(data: bytes) -> str:
+    """Name of a custom error, or the message of Error(string)"""
+    if data[:4] == ERROR_STRING_SELECTOR and len(data) >= 68:
+        length = int.from_bytes(data[36:68], "big")
+        return data[68:68 + length].decode(errors="replace")
+    if data[:4] in REVERT_ERRORS:
+        return REVERT_ERRORS[data[:4]]
+    return f"revert 0x{data.hex()}" if data else "revert without data"
+
+
+def _abi_bytes(data: bytes) -> bytes:
+    """Tail encoding of a dynamic `bytes` argument"""
+    return len(data).to_bytes(32, "big") + data + b"\x00" * (-len(data) % 32)
+
+
+def encode_verify_call(program: str, proof: bytes, public_values: bytes) -> bytes:
+    """Calldata of verify*(bytes proof, bytes publicValues) for a PROGRAMS key"""
+    proof_tail = _abi_bytes(proof)
+    head = (64).to_bytes(32, "big") + (64 + len(proof_tail)).to_bytes(32, "big")
+    return PROGRAMS[program][2] + head + proof_tail + _abi_bytes(public_values)
+
+
+class ProofVerifier:
+    """
+    Verifies proofs through eth_call (rpc_url and verifier_address) or
+    offline with the SP1 host (prover)
+    """
+
+    def __init__(
+        self,
+        rpc_url: Optional[str] = None,
+        verifier_address: Optional[str] = None,
+        prover: Optional[SP1Prover] = None,
+        batch_size: int = 50,
+        timeout: float = 30.0
+    ):
+        """
+        Args:
+            rpc_url: JSON-RPC endpoint of a local or fork node; None verifies offline
+            verifier_address: SP1VerifierIntegration address (required with rpc_url)
+            prover: SP1Prover whose host, program builds and proof mode are used offline
+            batch_size: eth_calls per JSON-RPC batch request
+            timeout: Seconds per JSON-RPC request
+        """
+        if rpc_url and not verifier_address:
+            raise ValueError("verifier_address is required with rpc_url")
+        self.rpc_url = rpc_url
+        self.verifier_address = verifier_address
+        self.prover = prover if prover is not None or rpc_url else SP1Prover()
+        self.batch_size = batch_size
+        self.timeout = timeout
+        self._inner_digests: Dict[str, bytes] = {}
+
+    def verify(self, checks: List[ProofCheck]) -> List[VerificationResult]:
+        """Check every proof; results are in input order"""
+        results = []
+        for index, check in enumerate(checks):
+            try:
+                outputs, mismatches = check_public_values(check)
+            except (KeyError, ValueError) as e:
+                results.append(VerificationResult(index, check.id, check.program, [], [f"public values: {e}"]))
+                continue
+            results.append(VerificationResult(index, check.id, check.program, outputs, mismatches))
+
+        pending = [result for result in results if result.outputs]
+        if not pending:
+            return results
+        if self.rpc_url:
+            verdicts = self._eth_call([checks[result.index] for result in pending])
+        else:
+            verdicts = self._verify_offline([checks[result.index] for result in pending])
+        for result, (valid, error) in zip(pending, verdicts):
+            result.proof_valid = valid
+            result.error = error
+        return results
+
+    # ==================== ETH_CALL ====================
+
+    def _eth_call(self, checks: List[ProofCheck]) -> List[Tuple[bool, Optional[str]]]:
+        """eth_call each verify*, batch_size calls per JSON-RPC request"""
+        requests = [{
+            "jsonrpc": "2.0",
+            "id": i,
+            "method": "eth_call",
+            "params": [{
+                "to": self.verifier_address,
+                "data": "0x" + encode_verify_call(check.program, check.proof, check.public_values).hex()
+            }, "latest"]
+        } for i, check in enumerate(checks)]
+
+        verdicts = []
+        for start in range(0, len(requests), self.batch_size):
+            batch = requests[start:start + self.batch_size]
+            responses = self._post(batch)
+            if not isinstance(responses, list):
+                # Node without batch support: one request at a time
+                responses = [self._post(request) for request in batch]
+            by_id = {response.get("id"): response for response in responses}
+            for request in batch:
+                verdicts.append(self._verdict(by_id.get(request["id"])))
+        return verdicts
+
+    def _post(self, payload):
+        request = urllib.request.Request(self.rpc_url, data=json.dumps(payload).encode(),
+                                         headers={"Content-Type": "application/json"})
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            return json.load(response)
+
+    @staticmethod
+    def _verdict(response: Optional[dict]) -> Tuple[bool, Optional[str]]:
+        if response is None:
+            return False, "no response from node"
+        if "error" not in response:
+            return True, None
+        error = response["error"]
+        data = error.get("data")
+        if isinstance(data, dict):
+            data = data.get("data")
+        if isinstance(data, str) and data.startswith("0x"):
+            return False, decode_revert(bytes.fromhex(data[2:]))
+        return False, error.get("message", "eth_call failed")
+
+    # ==================== OFFLINE ====================
+
+    def _verify_offline(self, checks: List[ProofCheck]) -> List[Tuple[bool, Optional[str]]]:
+        """SP1 host `verify` against the local program builds' vkeys"""
+        mode = self.prover.proof_mode
+        if mode not in ("groth16", "plonk"):
+            return [(False, f"{mode} proofs are not verifiable on-chain")] * len(checks)
+
+        items = []
+        for check in checks:
+            program, aggregated, _ = PROGRAMS[check.program]
+            vkey = self.prover.program_vkey("sp1-aggregation" if aggregated else program)
+            items.append({"vkey": vkey, "mode": mode, "proof": "0x" + check.proof.hex(),
+                          "public_values": "0x" + check.public_values.hex()})
+        result, _ = self.prover._run_host(["verify"], [json.dumps({"proofs": items})], backend="cpu")
+
+        verdicts = []
+        for check, verdict in zip(checks, result["results"]):
+            program, aggregated, _ = PROGRAMS[check.program]
+            if not verdict["valid"]:
+                verdicts.append((False, verdict["error"]))
+            elif aggregated and decode_aggregated_public_values(program, check.public_values)[0] != \
+                    self._inner_digest(program):
+                # What verify*Batch checks against evidenceProgramDigest / aiAnalysisProgramDigest
+                verdicts.append((False, f"inner proofs are not of the local {program} build"))
+            else:
+                verdicts.append((True, None))
+        return verdicts
+
+    def _inner_digest(self, program: str) -> bytes:
+        if program not in self._inner_digests:
+            elf = self.prover._program_elf(program)
+            digest = self.prover._run_host(["vkey", "--elf", str(elf)], backend="cpu")[0]["vkey_digest"]
+            self._inner_digests[program] = bytes.fromhex(digest[2:])
+        return self._inner_digests[program]
+
+
+def _hex_bytes(value: str) -> bytes:
+    return bytes.fromhex(value[2:] if value.startswith("0x") else value)
+
+
+def _expected_hash(value: Optional[str], path: Optional[str], kind: str = "raw") -> Optional[bytes]:
+    """
+    evidence hash from a bytes32 or, exactly as reveal_vote.py --evidence-file
+    --hash kind computes it, from the file
+    """
+    if path:
+        if SKILL_SCRIPTS not in sys.path:
+            sys.path.insert(0, SKILL_SCRIPTS)
+        from ipfs_cid import evidence_bytes32
+        return _hex_bytes(evidence_bytes32(path, kind))
+    return _hex_bytes(value) if value else None
+
+
+def read_checks(stream, default_program: Optional[str], hash_kind: str = "raw") -> List[ProofCheck]:
+    """
+    JSONL records: {"program", "proof" or "proof_file", "public_values",
+    "expected_evidence_hash" or "expected_evidence_file" (single proofs),
+    "expected_evidence_hashes": {market id: bytes32} (batches), "id"}.
+    sp1_prover.py batch output is accepted as is (with --program).
+    """
+    checks = []
+    for line in stream:
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        if "proof_file" in record:
+            proof = Path(record["proof_file"]).read_bytes()
+        else:
+            proof = _hex_bytes(record["proof"])
+        checks.append(ProofCheck(
+            program=record.get("program", default_program),
+            proof=proof,
+            public_values=_hex_bytes(record["public_values"]),
+            evidence_hash=_expected_hash(record.get("expected_evidence_hash"), record.get("expected_evidence_file"),
+                                         hash_kind),
+            evidence_hashes={int(k): _hex_bytes(v) for k, v in record.get("expected_evidence_hashes", {}).items()},
+            id=str(record["id"]) if "id" in record else str(record.get("index", len(checks)))
+        ))
+    return checks
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Verify SP1 proofs before submitting them on-chain")
+    parser.add_argument("--input", help="JSONL proofs ('-' for stdin), e.g. sp1_prover.py batch output")
+    parser.add_argument("--program", choices=list(PROGRAMS),
+                        help="Proof program (default for --input records without \"program\")")
+    parser.add_argument("--proof", help="Proof file (single proof)")
+    parser.add_argument("--public-values", help="Public values hex (single proof)")
+    parser.add_argument("--evidence-hash", help="evidenceHash planned for revealVote (single proof)")
+    parser.add_argument("--evidence-file", help="Evidence file whose hash revealVote will use (single proof)")
+    parser.add_argument("--hash", choices=("raw", "unixfs"), default="raw",
+                        help="Evidence file hash, as reveal_vote.py --hash (default: raw)")
+    parser.add_argument("--rpc-url", help="Local or fork node to eth_call SP1VerifierIntegration on "
+                                          "(default: verify offline with the SP1 host)")
+    parser.add_argument("--verifier", help="SP1VerifierIntegration address (or set SP1_VERIFIER_INTEGRATION env var)")
+    parser.add_argument("--batch-size", type=int, default=50, help="eth_calls per JSON-RPC batch (default: 50)")
+    parser.add_argument("--proof-mode", default="groth16", choices=PROOF_MODES,
+                        help="Proof type, for offline verification")
+    parser.add_argument("--network", default="local", choices=list(SP1_BACKENDS),
+                        help="SP1 backend, for building vkeys offline")
+    parser.add_argument("--cache-dir", help="Proof cache directory (default: ~/.cache/aijudge/proofs)")
+    parser.add_argument("--json", action="store_true", help="One JSON object per proof")
+
+    args = parser.parse_args()
+
+    if args.input:
+        stream = sys.stdin if args.input == "-" else open(args.input)
+        checks = read_checks(stream, args.program, args.hash)
+    elif args.proof and args.public_values and args.program:
+        checks = [ProofCheck(
+            program=args.program,
+            proof=Path(args.proof).read_bytes(),
+            public_values=_hex_bytes(args.public_values),
+            evidence_hash=_expected_hash(args.evidence_hash, args.evidence_file, args.hash),
+            id=args.proof
+        )]
+    else:
+        parser.error("pass --input, or --program with --proof and --public-values")
+    for check in checks:
+        if check.program not in PROGRAMS:
+            parser.error(f"proof {check.id}: unknown program {check.program!r} (set --program)")
+
+    verifier_address = args.verifier or os.environ.get("SP1_VERIFIER_INTEGRATION")
+    if args.rpc_url and not verifier_address:
+        parser.error("--rpc-url requires --verifier or SP1_VERIFIER_INTEGRATION")
+    prover = None if args.rpc_url else SP1Prover(
+        network=args.network,
+        proof_mode=args.proof_mode,
+        cache_dir=Path(args.cache_dir) if args.cache_dir else None
+    )
+    verifier = ProofVerifier(args.rpc_url, verifier_address, prover, args.batch_size)
+
+    results = verifier.verify(checks)
+    for result in results:
+        if args.json:
+            print(json.dumps({
+                "id": result.id,
+                "program": result.program,
+                "passed": result.passed,
+                "proof_valid": result.proof_valid,
+                "error": result.error,
+                "mismatches": result.mismatches,
+                "outputs": result.outputs,
+            }), flush=True)
+        else:
+            mark = "✅" if result.passed else "❌"
+            print(f"{mark} {result.id} ({result.program}): proof "
+                  f"{'valid' if result.proof_valid else 'not checked' if result.proof_valid is None else 'INVALID'}"
+                  f"{f' ({result.error})' if result.error else ''}")
+            for mismatch in result.mismatches:
+                print(f"   {mismatch}")
+
+    failed = sum(not result.passed for result in results)
+    print(f"{len(results) - failed}/{len(results)} proofs passed", file=sys.stderr)
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
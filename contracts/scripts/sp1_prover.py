@@ -5,21 +5,121 @@ SP1 ZK Proof Generator for AIJudgeMarket
 Generates ZK proofs that can be verified on-chain without revealing
 private evidence content.
 
+Proofs are generated by the SP1 host in zkvm/script (built on first use)
+running the guest ELFs built with `cargo prove build`, and cached on disk
+by (program vkey, proof mode, hash of the private inputs): proving the same
+evidence again is free.
+
+Before proving, `execute` runs a program in the SP1 executor (no proof, well
+under a second) and checks its committed outputs against the Python mirror
+below; its cycle counts double as a benchmark for guest regressions.
+
+Evidence may be a string, a bytes-like buffer or a file path. Buffers and
+files are hashed and handed to the host in fixed-size chunks, so this
+process's memory stays flat however large the evidence bundle is.
+
+Many proofs can be generated concurrently (generate_evidence_proofs /
+generate_ai_analysis_proofs, or the batch command). Concurrency is bounded by
+available RAM divided by the measured peak RSS of a proof of that program.
+
+aggregate_evidence_proofs / aggregate_ai_analysis_proofs (or the aggregate
+command) go one step further: the per-market proofs are generated compressed
+and verified inside sp1-aggregation, whose single proof settles the whole
+batch on-chain.
+
 Usage:
     python3 sp1_prover.py evidence --content "evidence text" --salt "secret_salt"
+    python3 sp1_prover.py evidence --content-file bundle.txt --salt "secret_salt"
+    cat scraped.html | python3 sp1_prover.py ai-analysis --evidence-file - --ai-output "..."
     python3 sp1_prover.py ai-analysis --evidence "..." --ai-output "..."
+    python3 sp1_prover.py --network mock evidence --content "..." --salt "..."
+    python3 sp1_prover.py batch --program evidence --input items.jsonl --output-dir proofs/
+    python3 sp1_prover.py aggregate --program evidence --input markets.jsonl --output batch.bin
+    python3 sp1_prover.py execute --program evidence --content "..." --salt "..." --baseline cycles.json
 """
 
 import argparse
+import atexit
+import dataclasses
+import itertools
 import json
 import hashlib
+import math
 import subprocess
 import os
+import re
+import shutil
+import signal
+import struct
 import sys
-from typing import Tuple, Optional
+import tempfile
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Set, Tuple, Optional, Union
 from dataclasses import dataclass
 from pathlib import Path
 
+# --network -> SP1_PROVER backend of the host
+SP1_BACKENDS = {
+    "local": "cpu",
+    "cuda": "cuda",
+    "cloud": "network",
+    "mock": "mock",
+}
+
+# Only groth16 and plonk proofs verify on-chain through the SP1 verifier gateway
+PROOF_MODES = ("groth16", "plonk", "compressed", "core")
+
+
+# Assumed peak RSS of one proof before any has been measured (SP1 v5, CPU)
+DEFAULT_PEAK_RSS = {
+    "core": 4 * 2**30,
+    "compressed": 8 * 2**30,
+    "groth16": 16 * 2**30,
+    "plonk": 16 * 2**30,
+}
+
+# RAM left free for the OS and this process when sizing batch concurrency
+MEMORY_RESERVE = 2 * 2**30
+
+# Evidence: text, a bytes-like buffer (bytes, bytearray, memoryview, mmap) or a file path
+EvidenceSource = Union[str, bytes, bytearray, memoryview, os.PathLike]
+
+# Bytes (or characters, for str) read, hashed and written per step
+CHUNK_SIZE = 1 << 20
+
+# Largest evidence sp1-evidence accepts (it commits valid_length = len <= this)
+MAX_EVIDENCE_BYTES = 10000
+
+# Confidence grammar shared with extract_confidence in the sp1-ai-analysis
+# guest: "Confidence:" then the first word containing '%', words split on
+# ASCII whitespace and commas, the number plain ASCII decimal
+CONFIDENCE_SEPARATORS = re.compile(r"[ \t\n\r\x0c,]+")
+CONFIDENCE_NUMBER = re.compile(r"[+-]?[0-9]+(\.[0-9]+)?")
+
+# Public values as the guests commit them (commit_slice, big-endian) and
+# SP1VerifierIntegration.parse*PublicValues read them
+# evidence_hash (32) | commitment (32) | valid_length (1)
+EVIDENCE_PUBLIC_VALUES = struct.Struct(">32s32sB")
+# outcome (1) | confidence (2) | evidence_hash (32) | reasoning_hash (32)
+AI_ANALYSIS_PUBLIC_VALUES = struct.Struct(">BH32s32s")
+# sp1-aggregation: inner vkey digest (32) | count (4), then per proof
+# market_id (32, uint256) | the inner program's public values
+AGGREGATION_HEADER = struct.Struct(">32sI")
+AGGREGATED_ITEM_SIZES = {
+    "sp1-evidence": EVIDENCE_PUBLIC_VALUES.size,
+    "sp1-ai-analysis": AI_ANALYSIS_PUBLIC_VALUES.size,
+}
+
+
+def default_cache_dir() -> Path:
+    """$AIJUDGE_PROOF_CACHE, else $XDG_CACHE_HOME/aijudge/proofs, else ~/.cache/aijudge/proofs"""
+    if os.environ.get("AIJUDGE_PROOF_CACHE"):
+        return Path(os.environ["AIJUDGE_PROOF_CACHE"])
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(base) / "aijudge" / "proofs"
+
 @dataclass
 class EvidenceProof:
     """Result of evidence ZK proof generation"""
@@ -40,6 +140,279 @@ class AIAnalysisProof:
     public_values: bytes
 
 
+@dataclass
+class AggregatedProof:
+    """Result of aggregating many proofs of one program into a single recursive proof"""
+    program: str  # inner program
+    inner_vkey_digest: bytes
+    market_ids: List[int]
+    proofs: List[Any]  # EvidenceProof / AIAnalysisProof per market, each with its compressed proof
+    proof: bytes
+    public_values: bytes
+
+
+@dataclass
+class ProofJob:
+    """Inputs of one proof plus how to turn (proof, public values) into its result"""
+    program: str
+    private_inputs: dict
+    expected_public: dict
+    build: Callable[[bytes, bytes], Any]
+
+
+@dataclass
+class BatchProofResult:
+    """One finished item of a batch, in completion order"""
+    index: int  # position in the submitted items
+    proof: Optional[Any] = None  # EvidenceProof / AIAnalysisProof
+    error: Optional[str] = None
+    cached: bool = False
+    seconds: float = 0.0
+    peak_rss_mb: Optional[float] = None
+
+
+@dataclass
+class ExecutionReport:
+    """Result of running a program in the SP1 executor, without proving"""
+    program: str
+    public_values: bytes
+    outputs: dict  # decoded committed outputs
+    expected: dict  # what the Python mirror computes
+    mismatches: List[str]  # fields where they differ
+    cycles: int
+    syscalls: int
+    cycle_tracker: Dict[str, int]  # cycles per annotated span of the guest
+    seconds: float
+
+    @property
+    def matches(self) -> bool:
+        return not self.mismatches
+
+
+def available_memory() -> int:
+    """Bytes of RAM available to new processes (MemAvailable on Linux)"""
+    try:
+        with open("/proc/meminfo") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+
+
+# ==================== PUBLIC VALUES ====================
+
+def _check_bytes32(name: str, value: bytes) -> bytes:
+    if len(value) != 32:
+        raise ValueError(f"{name} must be 32 bytes, got {len(value)}")
+    return value
+
+
+def encode_evidence_public_values(evidence_hash: bytes, commitment: bytes, valid_length: bool) -> bytes:
+    """65-byte public values of sp1-evidence"""
+    return EVIDENCE_PUBLIC_VALUES.pack(
+        _check_bytes32("evidence_hash", evidence_hash),
+        _check_bytes32("commitment", commitment),
+        1 if valid_length else 0
+    )
+
+
+def decode_evidence_public_values(public_values: bytes) -> Tuple[bytes, bytes, bool]:
+    """
+    Inverse of encode_evidence_public_values
+
+    Returns:
+        (evidence_hash, commitment, valid_length); any non-zero byte is true,
+        as in parseEvidencePublicValues
+    """
+    if len(public_values) != EVIDENCE_PUBLIC_VALUES.size:
+        raise ValueError(f"Evidence public values are {len(public_values)} bytes, "
+                         f"expected {EVIDENCE_PUBLIC_VALUES.size}")
+    evidence_hash, commitment, valid_length = EVIDENCE_PUBLIC_VALUES.unpack(public_values)
+    return evidence_hash, commitment, valid_length != 0
+
+
+def encode_ai_analysis_public_values(
+    outcome: int,
+    confidence: int,
+    evidence_hash: bytes,
+    reasoning_hash: bytes
+) -> bytes:
+    """
+    67-byte public values of sp1-ai-analysis. Rejects what
+    verifyAIAnalysisProof would revert on (outcome > 1, confidence > 10000).
+    """
+    if outcome not in (0, 1):
+        raise ValueError(f"Outcome must be 0 or 1, got {outcome}")
+    if not 0 <= confidence <= 10000:
+        raise ValueError(f"Confidence must be 0-10000 basis points, got {confidence}")
+    return AI_ANALYSIS_PUBLIC_VALUES.pack(
+        outcome,
+        confidence,
+        _check_bytes32("evidence_hash", evidence_hash),
+        _check_bytes32("reasoning_hash", reasoning_hash)
+    )
+
+
+def decode_ai_analysis_public_values(public_values: bytes) -> Tuple[int, int, bytes, bytes]:
+    """
+    Inverse of encode_ai_analysis_public_values
+
+    Returns:
+        (outcome, confidence, evidence_hash, reasoning_hash)
+    """
+    if len(public_values) != AI_ANALYSIS_PUBLIC_VALUES.size:
+        raise ValueError(f"AI analysis public values are {len(public_values)} bytes, "
+                         f"expected {AI_ANALYSIS_PUBLIC_VALUES.size}")
+    return AI_ANALYSIS_PUBLIC_VALUES.unpack(public_values)
+
+
+def encode_public_values(program: str, values: dict) -> bytes:
+    """Public values of a program from ProofJob.expected_public"""
+    if program == "sp1-evidence":
+        return encode_evidence_public_values(
+            bytes.fromhex(values["evidence_hash"]), bytes.fromhex(values["commitment"]), values["valid_length"]
+        )
+    return encode_ai_analysis_public_values(
+        values["outcome"], values["confidence"],
+        bytes.fromhex(values["evidence_hash"]), bytes.fromhex(values["reasoning_hash"])
+    )
+
+
+def decode_public_values(program: str, public_values: bytes) -> dict:
+    """
+    Committed outputs of a program, in the form of ProofJob.expected_public
+    (hashes as hex, integers, valid_length as bool)
+    """
+    if program == "sp1-evidence":
+        evidence_hash, commitment, valid_length = decode_evidence_public_values(public_values)
+        return {"evidence_hash": evidence_hash.hex(), "commitment": commitment.hex(), "valid_length": valid_length}
+    # Unpacked without range checks: execute reports an out-of-range outcome as a mismatch
+    outcome, confidence, evidence_hash, reasoning_hash = decode_ai_analysis_public_values(public_values)
+    return {"outcome": outcome, "confidence": confidence,
+            "evidence_hash": evidence_hash.hex(), "reasoning_hash": reasoning_hash.hex()}
+
+
+def encode_aggregated_public_values(
+    program: str,
+    inner_vkey_digest: bytes,
+    items: List[Tuple[int, bytes]]
+) -> bytes:
+    """Public values of sp1-aggregation over (market_id, inner public values) items"""
+    size = AGGREGATED_ITEM_SIZES[program]
+    out = [AGGREGATION_HEADER.pack(_check_bytes32("inner_vkey_digest", inner_vkey_digest), len(items))]
+    for market_id, public_values in items:
+        if not 0 <= market_id < 2**64:
+            raise ValueError(f"Market id must fit in 64 bits, got {market_id}")
+        if len(public_values) != size:
+            raise ValueError(f"{program} public values are {len(public_values)} bytes, expected {size}")
+        out.append(market_id.to_bytes(32, "big") + public_values)
+    return b"".join(out)
+
+
+def decode_aggregated_public_values(program: str, public_values: bytes) -> Tuple[bytes, List[Tuple[int, bytes]]]:
+    """
+    Inverse of encode_aggregated_public_values
+
+    Returns:
+        (inner_vkey_digest, [(market_id, inner public values), ...])
+    """
+    if len(public_values) < AGGREGATION_HEADER.size:
+        raise ValueError(f"Aggregated public values are {len(public_values)} bytes, "
+                         f"expected at least {AGGREGATION_HEADER.size}")
+    inner_vkey_digest, count = AGGREGATION_HEADER.unpack_from(public_values)
+    item_size = 32 + AGGREGATED_ITEM_SIZES[program]
+    if len(public_values) != AGGREGATION_HEADER.size + count * item_size:
+        raise ValueError(f"Aggregated public values are {len(public_values)} bytes, expected "
+                         f"{AGGREGATION_HEADER.size + count * item_size} for {count} {program} proofs")
+    items = []
+    for offset in range(AGGREGATION_HEADER.size, len(public_values), item_size):
+        market_id = int.from_bytes(public_values[offset:offset + 32], "big")
+        items.append((market_id, public_values[offset + 32:offset + item_size]))
+    return inner_vkey_digest, items
+
+
+# ==================== EVIDENCE STREAMING ====================
+
+def iter_evidence_bytes(source: EvidenceSource, chunk_size: int = CHUNK_SIZE) -> Iterator[memoryview]:
+    """
+    Evidence as bytes (str as UTF-8), chunk_size at a time. Buffers are
+    sliced without copying and files are read into one reused buffer, so each
+    chunk is only valid until the next one is requested.
+    """
+    if isinstance(source, str):
+        for start in range(0, len(source), chunk_size):
+            yield memoryview(source[start:start + chunk_size].encode())
+    elif isinstance(source, os.PathLike):
+        buffer = bytearray(chunk_size)
+        view = memoryview(buffer)
+        with open(source, "rb") as f:
+            while True:
+                n = f.readinto(buffer)
+                if not n:
+                    break
+                yield view[:n]
+    else:
+        view = memoryview(source).cast("B")
+        for start in range(0, len(view), chunk_size):
+            yield view[start:start + chunk_size]
+
+
+def evidence_size(source: EvidenceSource) -> int:
+    """Size of the evidence in UTF-8 bytes, without reading files"""
+    if isinstance(source, str):
+        return sum(len(chunk) for chunk in iter_evidence_bytes(source))
+    if isinstance(source, os.PathLike):
+        return os.stat(source).st_size
+    return memoryview(source).nbytes
+
+
+def hash_evidence(source: EvidenceSource, chunk_size: int = CHUNK_SIZE) -> bytes:
+    """SHA-256 of the evidence bytes, streamed"""
+    h = hashlib.sha256()
+    for chunk in iter_evidence_bytes(source, chunk_size):
+        h.update(chunk)
+    return h.digest()
+
+
+class ProofCache:
+    """
+    Content-addressed proof store: <dir>/<vkey>/<input hash>.<mode>.json
+    (<mode>.mock for mock proofs). Only proofs and public values are stored,
+    never the private inputs.
+    """
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = Path(cache_dir)
+
+    def _path(self, vkey: str, input_hash: str, mode: str) -> Path:
+        return self.cache_dir / vkey.replace("0x", "") / f"{input_hash}.{mode}.json"
+
+    def get(self, vkey: str, input_hash: str, mode: str) -> Optional[Tuple[bytes, bytes]]:
+        path = self._path(vkey, input_hash, mode)
+        if not path.exists():
+            return None
+        try:
+            entry = json.loads(path.read_text())
+            return bytes.fromhex(entry["proof"][2:]), bytes.fromhex(entry["public_values"][2:])
+        except (ValueError, KeyError):
+            return None  # Corrupt entry: prove again and overwrite
+
+    def put(self, vkey: str, input_hash: str, mode: str, proof: bytes, public_values: bytes):
+        path = self._path(vkey, input_hash, mode)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_text(json.dumps({
+            "vkey": vkey,
+            "mode": mode,
+            "proof": "0x" + proof.hex(),
+            "public_values": "0x" + public_values.hex(),
+            "created": time.time(),
+        }))
+        os.replace(tmp, path)
+
+
 class SP1Prover:
     """
     Client for generating SP1 ZK proofs for AIJudgeMarket.
@@ -50,19 +423,42 @@ class SP1Prover:
     3. Returning proof bytes ready for on-chain verification
     """
     
-    def __init__(self, network: str = "local"):
+    def __init__(
+        self,
+        network: str = "local",
+        proof_mode: str = "groth16",
+        cache_dir: Optional[Path] = None,
+        use_cache: bool = True
+    ):
         """
         Initialize SP1 prover client.
         
         Args:
-            network: "local" for local proving, "cloud" for Succinct's service
+            network: "local" (CPU), "cuda", "cloud" for Succinct's prover network
+                (NETWORK_PRIVATE_KEY), or "mock" for SP1's mock prover
+            proof_mode: groth16 or plonk for on-chain verification; compressed or core
+            cache_dir: Proof cache directory (default: ~/.cache/aijudge/proofs)
+            use_cache: Reuse cached proofs for identical inputs
         """
+        if network not in SP1_BACKENDS:
+            raise ValueError(f"Unknown network: {network}")
+        if proof_mode not in PROOF_MODES:
+            raise ValueError(f"Unknown proof mode: {proof_mode}")
         self.network = network
+        self.proof_mode = proof_mode
         self.sp1_dir = Path(__file__).parent.parent / "zkvm"
+        # vkeys and peak RSS measurements live here even with use_cache=False
+        self.state_dir = Path(cache_dir) if cache_dir else default_cache_dir()
+        self.cache = ProofCache(self.state_dir) if use_cache else None
+        self._vkeys: Dict[str, str] = {}
+        self._state_lock = threading.Lock()
+        self._processes: Set[subprocess.Popen] = set()  # running host processes
+        # Reentrant: terminate() may run in a signal handler on a thread that holds it
+        self._processes_lock = threading.RLock()
         
     def generate_evidence_proof(
         self,
-        evidence_content: str,
+        evidence_content: EvidenceSource,
         salt: str
     ) -> EvidenceProof:
         """
@@ -75,16 +471,26 @@ class SP1Prover:
         - commitment = hash(evidence_hash + salt) (public)
         - len(evidence_content) <= 10KB (public)
         
+        sp1-evidence only accepts evidence up to 10 KB (MAX_EVIDENCE_BYTES),
+        so larger evidence raises ValueError before proving; an AI analysis
+        proof has no such ceiling and commits the same evidence hash.
+        
         Args:
-            evidence_content: The actual evidence text/data (kept private)
+            evidence_content: The actual evidence (kept private): text, a
+                bytes-like buffer or a Path to a file of any bytes (e.g. a PDF)
             salt: Random salt for commitment scheme
             
         Returns:
             EvidenceProof containing public values and proof
         """
-        # Validate inputs
-        if len(evidence_content) > 10000:
-            raise ValueError("Evidence content too large (max 10KB)")
+        job = self._evidence_job(evidence_content, salt)
+        return job.build(*self._run_sp1_prover(job.program, job.private_inputs, job.expected_public))
+
+    def _evidence_job(self, evidence_content: EvidenceSource, salt: str) -> ProofJob:
+        # Validate inputs (the guest measures length in bytes)
+        size = evidence_size(evidence_content)
+        if size > MAX_EVIDENCE_BYTES:
+            raise ValueError(f"Evidence content too large ({size} bytes, max 10KB)")
         
         if len(salt) < 16:
             raise ValueError("Salt must be at least 16 characters for security")
@@ -92,10 +498,9 @@ class SP1Prover:
         # Compute public values locally (for verification)
         evidence_hash = self._compute_hash(evidence_content)
         commitment = self._compute_commitment(evidence_hash, salt)
-        valid_length = len(evidence_content) <= 10000
+        valid_length = size <= MAX_EVIDENCE_BYTES
         
-        # Generate ZK proof using SP1
-        proof, public_values = self._run_sp1_prover(
+        return ProofJob(
             program="sp1-evidence",
             private_inputs={
                 "evidence_content": evidence_content,
@@ -105,20 +510,19 @@ class SP1Prover:
                 "evidence_hash": evidence_hash.hex(),
                 "commitment": commitment.hex(),
                 "valid_length": valid_length
-            }
-        )
-        
-        return EvidenceProof(
-            evidence_hash=evidence_hash,
-            commitment=commitment,
-            valid_length=valid_length,
-            proof=proof,
-            public_values=public_values
+            },
+            build=lambda proof, public_values: EvidenceProof(
+                evidence_hash=evidence_hash,
+                commitment=commitment,
+                valid_length=valid_length,
+                proof=proof,
+                public_values=public_values
+            )
         )
     
     def generate_ai_analysis_proof(
         self,
-        evidence: str,
+        evidence: EvidenceSource,
         ai_model_output: str
     ) -> AIAnalysisProof:
         """
@@ -130,19 +534,23 @@ class SP1Prover:
         - Reasoning is consistent with outcome (public)
         
         Args:
-            evidence: Evidence content analyzed (private)
+            evidence: Evidence content analyzed (private): text, a bytes-like
+                buffer or a Path to a file of any bytes (e.g. a PDF)
             ai_model_output: AI's analysis output (private)
             
         Returns:
             AIAnalysisProof containing public decision and proof
         """
+        job = self._ai_analysis_job(evidence, ai_model_output)
+        return job.build(*self._run_sp1_prover(job.program, job.private_inputs, job.expected_public))
+
+    def _ai_analysis_job(self, evidence: EvidenceSource, ai_model_output: str) -> ProofJob:
         # Parse AI output to extract public values
         outcome, confidence = self._parse_ai_output(ai_model_output)
         evidence_hash = self._compute_hash(evidence)
         reasoning_hash = self._compute_hash(ai_model_output)
         
-        # Generate ZK proof
-        proof, public_values = self._run_sp1_prover(
+        return ProofJob(
             program="sp1-ai-analysis",
             private_inputs={
                 "evidence": evidence,
@@ -153,21 +561,279 @@ class SP1Prover:
                 "confidence": confidence,
                 "evidence_hash": evidence_hash.hex(),
                 "reasoning_hash": reasoning_hash.hex()
-            }
+            },
+            build=lambda proof, public_values: AIAnalysisProof(
+                outcome=outcome,
+                confidence=confidence,
+                evidence_hash=evidence_hash,
+                reasoning_hash=reasoning_hash,
+                proof=proof,
+                public_values=public_values
+            )
         )
-        
-        return AIAnalysisProof(
-            outcome=outcome,
-            confidence=confidence,
-            evidence_hash=evidence_hash,
-            reasoning_hash=reasoning_hash,
+
+    # ==================== BATCH PROVING ====================
+
+    def generate_evidence_proofs(
+        self,
+        items: Iterable[Tuple[EvidenceSource, str]],
+        max_workers: Optional[int] = None
+    ) -> Iterator[BatchProofResult]:
+        """
+        Prove many (evidence_content, salt) pairs concurrently.
+
+        Args:
+            items: (evidence_content, salt) pairs
+            max_workers: Upper bound on concurrent proofs (default: CPU count)
+
+        Yields:
+            BatchProofResult per item as soon as it finishes (cache hits first)
+        """
+        return self._prove_batch([lambda c=c, s=s: self._evidence_job(c, s) for c, s in items], max_workers)
+
+    def generate_ai_analysis_proofs(
+        self,
+        items: Iterable[Tuple[EvidenceSource, str]],
+        max_workers: Optional[int] = None
+    ) -> Iterator[BatchProofResult]:
+        """
+        Prove many (evidence, ai_model_output) pairs concurrently.
+
+        Args:
+            items: (evidence, ai_model_output) pairs
+            max_workers: Upper bound on concurrent proofs (default: CPU count)
+
+        Yields:
+            BatchProofResult per item as soon as it finishes (cache hits first)
+        """
+        return self._prove_batch([lambda e=e, o=o: self._ai_analysis_job(e, o) for e, o in items], max_workers)
+
+    def concurrency_limit(self, program: str, max_workers: Optional[int] = None, memory: Optional[int] = None) -> int:
+        """
+        How many proofs of a program fit in RAM at once: (available RAM -
+        reserve) / peak RSS (measured, else a per-mode default), capped by
+        max_workers / CPU count.
+        """
+        cap = max_workers or os.cpu_count() or 1
+        peak = self._peak_rss(program) or DEFAULT_PEAK_RSS[self.proof_mode]
+        budget = (available_memory() if memory is None else memory) - MEMORY_RESERVE
+        return max(1, min(cap, int(budget // (peak * 1.1))))
+
+    def _prove_batch(
+        self,
+        job_factories: List[Callable[[], ProofJob]],
+        max_workers: Optional[int]
+    ) -> Iterator[BatchProofResult]:
+        """
+        Stream batch results. The proofs run as separate host processes;
+        threads only wait on them. Until a program's peak RSS has been
+        measured, its first proof runs alone.
+        """
+        pending: List[Tuple[int, ProofJob]] = []
+        for index, factory in enumerate(job_factories):
+            # A bad item (invalid input, missing file, build or host error) fails alone
+            try:
+                job = factory()
+                cached = self._cached_proof(job.program, job.private_inputs)
+            except ValueError as e:
+                yield BatchProofResult(index=index, error=str(e))
+                continue
+            except Exception as e:
+                yield BatchProofResult(index=index, error=f"{type(e).__name__}: {e}")
+                continue
+            if cached is not None:
+                yield BatchProofResult(index=index, proof=job.build(*cached), cached=True)
+            else:
+                pending.append((index, job))
+        if not pending:
+            return
+
+        memory = available_memory()
+        cap = max_workers or os.cpu_count() or 1
+
+        def run(job: ProofJob) -> Tuple[Any, float, int]:
+            start = time.perf_counter()
+            proof, public_values, peak_rss = self._prove(job.program, job.private_inputs, job.expected_public)
+            return job.build(proof, public_values), time.perf_counter() - start, peak_rss
+
+        running: Dict[Any, int] = {}
+        with ThreadPoolExecutor(max_workers=cap) as pool:
+            while pending or running:
+                while pending:
+                    program = pending[0][1].program
+                    measured = self._peak_rss(program) is not None
+                    limit = self.concurrency_limit(program, cap, memory) if measured else 1
+                    if len(running) >= limit:
+                        break
+                    index, job = pending.pop(0)
+                    running[pool.submit(run, job)] = index
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = running.pop(future)
+                    try:
+                        proof, seconds, peak_rss = future.result()
+                        yield BatchProofResult(index=index, proof=proof, seconds=seconds,
+                                               peak_rss_mb=round(peak_rss / 2**20, 1))
+                    except Exception as e:
+                        yield BatchProofResult(index=index, error=f"{type(e).__name__}: {e}")
+
+    # ==================== AGGREGATION ====================
+
+    def aggregate_evidence_proofs(
+        self,
+        items: Iterable[Tuple[int, EvidenceSource, str]],
+        max_workers: Optional[int] = None
+    ) -> AggregatedProof:
+        """
+        Prove many (market_id, evidence_content, salt) items and fold them into
+        one proof that verifyEvidenceProofBatch checks with a single
+        verifyProof call.
+
+        Args:
+            items: (market_id, evidence_content, salt) triples
+            max_workers: Upper bound on concurrent inner proofs (default: CPU count)
+
+        Returns:
+            AggregatedProof in this prover's proof mode
+        """
+        items = list(items)
+        return self._aggregate("sp1-evidence", [market_id for market_id, _, _ in items],
+                               [lambda c=c, s=s: self._evidence_job(c, s) for _, c, s in items], max_workers)
+
+    def aggregate_ai_analysis_proofs(
+        self,
+        items: Iterable[Tuple[int, EvidenceSource, str]],
+        max_workers: Optional[int] = None
+    ) -> AggregatedProof:
+        """
+        Prove many (market_id, evidence, ai_model_output) items and fold them
+        into one proof for verifyAIAnalysisProofBatch.
+
+        Args:
+            items: (market_id, evidence, ai_model_output) triples
+            max_workers: Upper bound on concurrent inner proofs (default: CPU count)
+
+        Returns:
+            AggregatedProof in this prover's proof mode
+        """
+        items = list(items)
+        return self._aggregate("sp1-ai-analysis", [market_id for market_id, _, _ in items],
+                               [lambda e=e, o=o: self._ai_analysis_job(e, o) for _, e, o in items], max_workers)
+
+    def _aggregate(
+        self,
+        program: str,
+        market_ids: List[int],
+        job_factories: List[Callable[[], ProofJob]],
+        max_workers: Optional[int]
+    ) -> AggregatedProof:
+        """
+        Inner proofs are compressed (recursion-friendly, cached like any other
+        proof); sp1-aggregation verifies them in the zkVM and is proven in
+        self.proof_mode.
+        """
+        if not market_ids:
+            raise ValueError("Nothing to aggregate")
+        if any(not 0 <= market_id < 2**64 for market_id in market_ids):
+            raise ValueError("Market ids must fit in 64 bits")
+
+        inner = SP1Prover(self.network, "compressed", self.state_dir, self.cache is not None)
+        proofs: List[Any] = [None] * len(market_ids)
+        for result in inner._prove_batch(job_factories, max_workers):
+            if result.error:
+                raise RuntimeError(f"Proof of market {market_ids[result.index]} failed: {result.error}")
+            proofs[result.index] = result.proof
+
+        elf = self._program_elf("sp1-aggregation")
+        vkey = self.program_vkey("sp1-aggregation")
+        h = hashlib.sha256(program.encode())
+        for market_id, proof in zip(market_ids, proofs):
+            h.update(market_id.to_bytes(32, "big") + hashlib.sha256(proof.proof).digest())
+        input_hash = h.hexdigest()
+        cached = self.cache.get(vkey, input_hash, self._cache_mode) if self.cache is not None else None
+
+        if cached is not None:
+            print(f"Using cached {self.proof_mode} aggregation of {len(proofs)} proofs ({input_hash[:16]})",
+                  file=sys.stderr)
+            proof, public_values = cached
+        else:
+            print(f"Aggregating {len(proofs)} {program} proofs ({self.proof_mode}, "
+                  f"{SP1_BACKENDS[self.network]})...", file=sys.stderr)
+            with tempfile.TemporaryDirectory(prefix="sp1-aggregate-") as tmp:
+                paths = []
+                for index, inner_proof in enumerate(proofs):
+                    path = os.path.join(tmp, f"{index}.bin")
+                    with open(path, "wb") as f:
+                        f.write(inner_proof.proof)
+                    paths.append(path)
+                batch = json.dumps({"market_ids": market_ids, "proofs": paths})
+                result, peak_rss = self._run_host(
+                    ["aggregate", "--elf", str(elf), "--inner-elf", str(self._program_elf(program)),
+                     "--mode", self.proof_mode],
+                    [batch]
+                )
+            proof = bytes.fromhex(result["proof"][2:])
+            public_values = bytes.fromhex(result["public_values"][2:])
+            self._record_peak_rss("sp1-aggregation", peak_rss)
+            expected = encode_aggregated_public_values(
+                program, bytes.fromhex(result["inner_vkey_digest"][2:]),
+                [(market_id, p.public_values) for market_id, p in zip(market_ids, proofs)]
+            )
+            if public_values != expected:
+                raise RuntimeError(f"sp1-aggregation committed {public_values.hex()}, expected {expected.hex()}")
+            if self.cache is not None:
+                self.cache.put(vkey, input_hash, self._cache_mode, proof, public_values)
+
+        inner_vkey_digest, _ = decode_aggregated_public_values(program, public_values)
+        return AggregatedProof(
+            program=program,
+            inner_vkey_digest=inner_vkey_digest,
+            market_ids=market_ids,
+            proofs=proofs,
             proof=proof,
             public_values=public_values
         )
-    
-    def _compute_hash(self, data: str) -> bytes:
-        """Compute SHA-256 hash"""
-        return hashlib.sha256(data.encode()).digest()
+
+    # ==================== EXECUTION ====================
+
+    def execute_evidence(self, evidence_content: EvidenceSource, salt: str) -> ExecutionReport:
+        """
+        Run sp1-evidence in the SP1 executor and compare its committed outputs
+        with _compute_hash / _compute_commitment. No proof is generated.
+        """
+        return self._execute(self._evidence_job(evidence_content, salt))
+
+    def execute_ai_analysis(self, evidence: EvidenceSource, ai_model_output: str) -> ExecutionReport:
+        """
+        Run sp1-ai-analysis in the SP1 executor and compare its committed
+        outputs with _parse_ai_output / _compute_hash. No proof is generated.
+        """
+        return self._execute(self._ai_analysis_job(evidence, ai_model_output))
+
+    def _execute(self, job: ProofJob) -> ExecutionReport:
+        elf = self._program_elf(job.program)
+        start = time.perf_counter()
+        # The executor is the same for every backend; cpu needs no network key
+        result, _ = self._run_host(["execute", "--elf", str(elf)], self._input_chunks(job.private_inputs),
+                                   backend="cpu")
+        seconds = time.perf_counter() - start
+        public_values = bytes.fromhex(result["public_values"][2:])
+        outputs = decode_public_values(job.program, public_values)
+        return ExecutionReport(
+            program=job.program,
+            public_values=public_values,
+            outputs=outputs,
+            expected=job.expected_public,
+            mismatches=[k for k, v in job.expected_public.items() if outputs.get(k) != v],
+            cycles=result["cycles"],
+            syscalls=result["syscalls"],
+            cycle_tracker=result["cycle_tracker"],
+            seconds=seconds
+        )
+
+    def _compute_hash(self, data: EvidenceSource) -> bytes:
+        """Compute SHA-256 hash (streamed for buffers and files)"""
+        return hash_evidence(data)
     
     def _compute_commitment(self, evidence_hash: bytes, salt: str) -> bytes:
         """Compute commitment = hash(evidence_hash + salt)"""
@@ -178,39 +844,30 @@ class SP1Prover:
     
     def _parse_ai_output(self, output: str) -> Tuple[int, int]:
         """
-        Parse AI output to extract outcome and confidence.
+        Parse AI output to extract outcome and confidence, exactly as
+        parse_ai_output in the sp1-ai-analysis guest does: ASCII-only case
+        matching, and a confidence of CONFIDENCE_NUMBER followed by '%'.
+        Anything else (nan, inf, 1e2, 1_0, non-ASCII digits) keeps the 50%
+        default.
         
         Returns:
             (outcome: 0 or 1, confidence: 0-10000 in basis points)
         """
-        output_upper = output.upper()
+        outcome = 1 if re.search("YES", output, re.IGNORECASE | re.ASCII) else 0
         
-        # Determine outcome
-        if "YES" in output_upper:
-            outcome = 1
-        elif "NO" in output_upper:
-            outcome = 0
-        else:
-            # Default to parsing first word
-            first_word = output.split()[0].upper() if output else "NO"
-            outcome = 1 if first_word == "YES" else 0
-        
-        # Extract confidence
         confidence = 5000  # Default 50%
-        if "CONFIDENCE:" in output_upper:
-            try:
-                idx = output_upper.find("CONFIDENCE:") + len("CONFIDENCE:")
-                rest = output[idx:].strip()
-                # Look for percentage
-                for word in rest.replace(",", " ").split():
-                    if "%" in word:
-                        pct = float(word.replace("%", ""))
-                        confidence = int(pct * 100)  # Convert to basis points
-                        break
-            except:
-                pass
+        match = re.search("CONFIDENCE:", output, re.IGNORECASE | re.ASCII)
+        if match:
+            # First word containing '%' decides, parsable or not
+            for word in CONFIDENCE_SEPARATORS.split(output[match.end():]):
+                if "%" in word:
+                    number = word.replace("%", "")
+                    if CONFIDENCE_NUMBER.fullmatch(number) and math.isfinite(float(number)):
+                        # Clamp before truncating, like the guest's f64 clamp + `as u16`
+                        confidence = int(max(0.0, min(float(number) * 100, 10000.0)))
+                    break
         
-        return outcome, min(confidence, 10000)
+        return outcome, confidence
     
     def _run_sp1_prover(
         self,
@@ -219,36 +876,250 @@ class SP1Prover:
         expected_public: dict
     ) -> Tuple[bytes, bytes]:
         """
-        Run SP1 prover to generate proof.
+        Run SP1 prover to generate proof (or return the cached one).
         
-        In a real implementation, this would:
-        1. Write inputs to JSON file
-        2. Run `cargo prove` in the program directory
-        3. Parse output to get proof and public values
+        Private inputs are written (in the order the guest reads them) to a
+        temporary file for the host, which proves, verifies locally and
+        prints the proof and public values.
         
-        For hackathon/demo, we return mock proofs.
+        Returns:
+            (proof bytes, public values bytes)
+        """
+        cached = self._cached_proof(program, private_inputs)
+        if cached is not None:
+            return cached
+        proof, public_values, _ = self._prove(program, private_inputs, expected_public)
+        return proof, public_values
+
+    @property
+    def _cache_mode(self) -> str:
         """
+        Cache key mode. Mock proofs verify nowhere, so they are kept apart and
+        never served to a run on a real backend (SP1_PROVER overrides --network,
+        as in _run_host).
+        """
+        backend = os.environ.get("SP1_PROVER") or SP1_BACKENDS[self.network]
+        return f"{self.proof_mode}.mock" if backend == "mock" else self.proof_mode
+
+    def _cached_proof(self, program: str, private_inputs: dict) -> Optional[Tuple[bytes, bytes]]:
         program_dir = self.sp1_dir / program
         
         if not program_dir.exists():
             raise FileNotFoundError(f"SP1 program not found: {program_dir}")
         
-        # In production, this would actually run SP1
-        # For now, return mock data
-        print(f"Running SP1 prover for {program}...")
-        print(f"Private inputs: {list(private_inputs.keys())}")
-        print(f"Expected public outputs: {expected_public}")
-        
-        # Mock proof generation
-        proof = b"MOCK_PROOF_" + program.encode() + b"_" + os.urandom(32)
-        public_values = self._encode_public_values(expected_public)
-        
-        return proof, public_values
-    
-    def _encode_public_values(self, values: dict) -> bytes:
-        """Encode public values for on-chain verification"""
-        # Simple encoding for demo - production would use proper ABI encoding
-        return json.dumps(values, sort_keys=True).encode()
+        if self.cache is None:
+            return None
+        input_hash = self._input_hash(private_inputs)
+        cached = self.cache.get(self.program_vkey(program), input_hash, self._cache_mode)
+        if cached is not None:
+            print(f"Using cached {self.proof_mode} proof for {program} ({input_hash[:16]})", file=sys.stderr)
+        return cached
+
+    def _prove(self, program: str, private_inputs: dict, expected_public: dict) -> Tuple[bytes, bytes, int]:
+        """Prove with the host, cache the result and record its peak RSS"""
+        elf = self._program_elf(program)
+        vkey = self.program_vkey(program)
+        input_hash = self._input_hash(private_inputs)
+
+        print(f"Running SP1 prover for {program} ({self.proof_mode}, {SP1_BACKENDS[self.network]})...", file=sys.stderr)
+        print(f"Private inputs: {list(private_inputs.keys())}", file=sys.stderr)
+        print(f"Expected public outputs: {expected_public}", file=sys.stderr)
+
+        result, peak_rss = self._run_host(["prove", "--elf", str(elf), "--mode", self.proof_mode],
+                                          self._input_chunks(private_inputs))
+        proof = bytes.fromhex(result["proof"][2:])
+        public_values = bytes.fromhex(result["public_values"][2:])
+        self._record_peak_rss(program, peak_rss)
+        if public_values != encode_public_values(program, expected_public):
+            raise RuntimeError(f"{program} committed {public_values.hex()}, which does not match the Python "
+                               f"computation {expected_public}; run `execute` to see which field differs")
+
+        if self.cache is not None:
+            self.cache.put(vkey, input_hash, self._cache_mode, proof, public_values)
+        return proof, public_values, peak_rss
+
+    # ==================== SP1 TOOLCHAIN ====================
+
+    def _input_chunks(self, private_inputs: dict) -> Iterator[str]:
+        """
+        Host input file content, {"inputs":[...]} with each input hex-encoded
+        bytes (the guests read raw buffers), streamed one evidence chunk at a time
+        """
+        yield '{"inputs":['
+        for i, value in enumerate(private_inputs.values()):
+            yield ',"' if i else '"'
+            for chunk in iter_evidence_bytes(value):
+                yield chunk.hex()
+            yield '"'
+        yield ']}'
+
+    def _input_hash(self, private_inputs: dict) -> str:
+        """SHA-256 of the host input; the cache key material"""
+        h = hashlib.sha256()
+        for chunk in self._input_chunks(private_inputs):
+            h.update(chunk.encode())
+        return h.hexdigest()
+
+    def _program_elf(self, program: str) -> Path:
+        """Guest ELF, built with `cargo prove build` if missing"""
+        program_dir = self.sp1_dir / program
+        cargo_toml = (program_dir / "Cargo.toml").read_text()
+        name = re.search(r'^name\s*=\s*"([^"]+)"', cargo_toml, re.MULTILINE).group(1)
+        elf = program_dir / "target" / "elf-compilation" / "riscv32im-succinct-zkvm-elf" / "release" / name
+        if not elf.exists():
+            cargo_prove = shutil.which("cargo-prove") or os.path.expanduser("~/.sp1/bin/cargo-prove")
+            if not os.path.exists(cargo_prove):
+                raise FileNotFoundError("SP1 toolchain not found; install with: curl -L https://sp1up.succinct.xyz | bash && sp1up")
+            print(f"Building {program} (cargo prove build)...", file=sys.stderr)
+            subprocess.run([cargo_prove, "prove", "build"], cwd=program_dir, check=True)
+        return elf
+
+    def _host_binary(self) -> Path:
+        """SP1 host (zkvm/script), built with `cargo build --release` if missing"""
+        host = self.sp1_dir / "script" / "target" / "release" / "aijudge-prover"
+        if not host.exists():
+            print("Building SP1 host (cargo build --release)...", file=sys.stderr)
+            subprocess.run(["cargo", "build", "--release"], cwd=self.sp1_dir / "script", check=True)
+        return host
+
+    def _run_host(
+        self,
+        args: List[str],
+        input_chunks: Optional[Iterable[str]] = None,
+        backend: Optional[str] = None
+    ) -> Tuple[dict, int]:
+        """
+        Run the host and parse its JSON result; progress logs go to stderr.
+        SP1_PROVER comes from the environment, else backend, else --network.
+
+        Returns:
+            (result, peak RSS of the host process in bytes)
+        """
+        env = dict(os.environ)
+        env.setdefault("SP1_PROVER", backend or SP1_BACKENDS[self.network])
+        input_path = None
+        try:
+            if input_chunks is not None:
+                fd, input_path = tempfile.mkstemp(prefix="sp1-input-", suffix=".json")  # mode 0600
+                with os.fdopen(fd, "w") as f:
+                    f.writelines(input_chunks)
+                args = args + ["--input", input_path]
+            process = subprocess.Popen([str(self._host_binary())] + args, env=env,
+                                       stdout=subprocess.PIPE, text=True)
+            with self._processes_lock:
+                self._processes.add(process)
+            try:
+                output = process.stdout.read()
+                process.stdout.close()
+                # wait4 reports this child's own resource usage (ru_maxrss in KiB on Linux)
+                _, status, usage = os.wait4(process.pid, 0)
+                process.returncode = os.waitstatus_to_exitcode(status)
+            finally:
+                with self._processes_lock:
+                    self._processes.discard(process)
+        finally:
+            if input_path:
+                os.remove(input_path)
+        if process.returncode != 0:
+            raise RuntimeError(f"SP1 host failed ({' '.join(args[:1])}), exit code {process.returncode}")
+        return json.loads(output.strip().splitlines()[-1]), usage.ru_maxrss * 1024
+
+    def terminate(self) -> int:
+        """
+        Send SIGTERM to every running host process (e.g. when the caller is
+        shutting down); their proofs fail with a non-zero exit code.
+
+        Returns:
+            Number of processes signalled
+        """
+        # os.kill, not Popen.terminate: its poll() could reap the child under _run_host's wait4
+        signalled = 0
+        with self._processes_lock:
+            for process in list(self._processes):
+                try:
+                    os.kill(process.pid, signal.SIGTERM)
+                    signalled += 1
+                except ProcessLookupError:
+                    pass
+        return signalled
+
+    def _peak_rss(self, program: str) -> Optional[int]:
+        """Largest measured peak RSS for this program, proof mode and backend"""
+        path = self.state_dir / "peak_rss.json"
+        if not path.exists():
+            return None
+        key = f"{program}:{self.proof_mode}:{SP1_BACKENDS[self.network]}"
+        return json.loads(path.read_text()).get(key)
+
+    def _record_peak_rss(self, program: str, peak_rss: int):
+        key = f"{program}:{self.proof_mode}:{SP1_BACKENDS[self.network]}"
+        path = self.state_dir / "peak_rss.json"
+        with self._state_lock:
+            known = json.loads(path.read_text()) if path.exists() else {}
+            if peak_rss <= known.get(key, 0):
+                return
+            known[key] = peak_rss
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(known, indent=2))
+
+    def program_vkey(self, program: str) -> str:
+        """
+        bytes32 verification key of a program (what SP1VerifierIntegration
+        stores), cached per ELF content
+        """
+        elf = self._program_elf(program)
+        elf_hash = hashlib.sha256(elf.read_bytes()).hexdigest()
+        if elf_hash in self._vkeys:
+            return self._vkeys[elf_hash]
+        with self._state_lock:
+            index = self.state_dir / "vkeys.json"
+            known = json.loads(index.read_text()) if index.exists() else {}
+            if elf_hash not in known:
+                known[elf_hash] = self._run_host(["vkey", "--elf", str(elf)])[0]["vkey"]
+                index.parent.mkdir(parents=True, exist_ok=True)
+                index.write_text(json.dumps(known, indent=2))
+            self._vkeys[elf_hash] = known[elf_hash]
+        return known[elf_hash]
+
+
+def evidence_argument(text: Optional[str], path: Optional[str]) -> Optional[EvidenceSource]:
+    """
+    Evidence from --content/--evidence text or a --*-file path. '-' spools
+    stdin to a temporary 0600 file in chunks, removed at exit.
+    """
+    if path is None:
+        return text
+    if path != "-":
+        return Path(path)
+    fd, spool = tempfile.mkstemp(prefix="sp1-evidence-")
+    atexit.register(os.remove, spool)
+    with os.fdopen(fd, "wb") as f:
+        shutil.copyfileobj(sys.stdin.buffer, f, CHUNK_SIZE)
+    return Path(spool)
+
+
+def batch_item(program: str, item: dict) -> Tuple[EvidenceSource, str]:
+    """Prover arguments of one JSONL item of the batch / aggregate commands"""
+    if program == "evidence":
+        return evidence_argument(item.get("content"), item.get("content_file")), item["salt"]
+    return evidence_argument(item.get("evidence"), item.get("evidence_file")), item["ai_output"]
+
+
+def check_cycle_baseline(report: ExecutionReport, baseline: dict, max_regression: float) -> List[str]:
+    """
+    Cycle counts of report that grew more than max_regression percent over
+    the baseline entry of its program ({"cycles", "cycle_tracker"})
+    """
+    entry = baseline.get(report.program)
+    if not entry:
+        return []
+    pairs = [("total", entry["cycles"], report.cycles)]
+    pairs += [(span, cycles, report.cycle_tracker.get(span, 0)) for span, cycles in entry["cycle_tracker"].items()]
+    return [
+        f"{name}: {old} -> {new} cycles (+{(new - old) / old * 100:.1f}%)"
+        for name, old, new in pairs
+        if old and (new - old) / old * 100 > max_regression
+    ]
 
 
 def main():
@@ -257,19 +1128,64 @@ def main():
     
     # Evidence proof command
     evidence_parser = subparsers.add_parser("evidence", help="Generate evidence proof")
-    evidence_parser.add_argument("--content", required=True, help="Evidence content (private)")
+    evidence_source = evidence_parser.add_mutually_exclusive_group(required=True)
+    evidence_source.add_argument("--content", help="Evidence content (private)")
+    evidence_source.add_argument("--content-file", help="Read evidence from a file ('-' for stdin), streamed")
     evidence_parser.add_argument("--salt", required=True, help="Random salt (private)")
     evidence_parser.add_argument("--output", help="Output file for proof")
     
     # AI analysis proof command
     ai_parser = subparsers.add_parser("ai-analysis", help="Generate AI analysis proof")
-    ai_parser.add_argument("--evidence", required=True, help="Evidence analyzed (private)")
+    ai_evidence_source = ai_parser.add_mutually_exclusive_group(required=True)
+    ai_evidence_source.add_argument("--evidence", help="Evidence analyzed (private)")
+    ai_evidence_source.add_argument("--evidence-file", help="Read evidence from a file ('-' for stdin), streamed")
     ai_parser.add_argument("--ai-output", required=True, help="AI model output (private)")
     ai_parser.add_argument("--output", help="Output file for proof")
     
+    # Batch command
+    batch_parser = subparsers.add_parser("batch", help="Prove many items concurrently (NDJSON in/out)")
+    batch_parser.add_argument("--program", required=True, choices=["evidence", "ai-analysis"],
+                              help="Program to prove")
+    batch_parser.add_argument("--input", required=True,
+                              help="JSONL items ('-' for stdin): {\"content\" or \"content_file\", \"salt\"} "
+                                   "or {\"evidence\" or \"evidence_file\", \"ai_output\"}")
+    batch_parser.add_argument("--output-dir", help="Write <index>.bin proofs here (default: hex in output)")
+    batch_parser.add_argument("--max-workers", type=int, help="Max concurrent proofs (default: CPU count)")
+    
+    # Aggregate command
+    aggregate_parser = subparsers.add_parser("aggregate", help="Prove many items and aggregate them into one "
+                                                               "recursive proof (one verifyProof per batch)")
+    aggregate_parser.add_argument("--program", required=True, choices=["evidence", "ai-analysis"],
+                                  help="Program of the inner proofs")
+    aggregate_parser.add_argument("--input", required=True,
+                                  help="JSONL items ('-' for stdin) as for batch, each with a \"market_id\"")
+    aggregate_parser.add_argument("--output", help="Output file for the aggregated proof")
+    aggregate_parser.add_argument("--max-workers", type=int, help="Max concurrent inner proofs (default: CPU count)")
+    
+    # Execute command
+    execute_parser = subparsers.add_parser("execute", help="Run a program in the SP1 executor (no proof) "
+                                                           "and check its outputs against Python")
+    execute_parser.add_argument("--program", required=True, choices=["evidence", "ai-analysis"],
+                                help="Program to execute")
+    execute_parser.add_argument("--content", help="Evidence content (evidence)")
+    execute_parser.add_argument("--content-file", help="Read evidence from a file ('-' for stdin) (evidence)")
+    execute_parser.add_argument("--salt", help="Random salt (evidence)")
+    execute_parser.add_argument("--evidence", help="Evidence analyzed (ai-analysis)")
+    execute_parser.add_argument("--evidence-file", help="Read evidence from a file ('-' for stdin) (ai-analysis)")
+    execute_parser.add_argument("--ai-output", help="AI model output (ai-analysis)")
+    execute_parser.add_argument("--baseline", help="Cycle baseline JSON; written if missing, else compared")
+    execute_parser.add_argument("--max-regression", type=float, default=5.0,
+                                help="Allowed cycle growth over the baseline in percent (default: 5)")
+    execute_parser.add_argument("--update-baseline", action="store_true", help="Overwrite this program's baseline")
+    execute_parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    
     # Network option
-    parser.add_argument("--network", default="local", choices=["local", "cloud"],
+    parser.add_argument("--network", default="local", choices=list(SP1_BACKENDS),
                        help="Proving network to use")
+    parser.add_argument("--proof-mode", default="groth16", choices=PROOF_MODES,
+                       help="Proof type (groth16/plonk verify on-chain)")
+    parser.add_argument("--cache-dir", help="Proof cache directory (default: ~/.cache/aijudge/proofs)")
+    parser.add_argument("--no-cache", action="store_true", help="Always prove, ignoring cached proofs")
     
     args = parser.parse_args()
     
@@ -277,13 +1193,19 @@ def main():
         parser.print_help()
         return
     
-    prover = SP1Prover(network=args.network)
+    prover = SP1Prover(
+        network=args.network,
+        proof_mode=args.proof_mode,
+        cache_dir=Path(args.cache_dir) if args.cache_dir else None,
+        use_cache=not args.no_cache
+    )
     
     if args.command == "evidence":
+        content = evidence_argument(args.content, args.content_file)
         print("Generating evidence proof...")
-        print(f"Evidence length: {len(args.content)} chars")
+        print(f"Evidence length: {evidence_size(content)} bytes")
         
-        proof = prover.generate_evidence_proof(args.content, args.salt)
+        proof = prover.generate_evidence_proof(content, args.salt)
         
         print(f"\n✅ Proof generated!")
         print(f"Evidence hash: 0x{proof.evidence_hash.hex()}")
@@ -298,7 +1220,7 @@ def main():
     elif args.command == "ai-analysis":
         print("Generating AI analysis proof...")
         
-        proof = prover.generate_ai_analysis_proof(args.evidence, args.ai_output)
+        proof = prover.generate_ai_analysis_proof(evidence_argument(args.evidence, args.evidence_file), args.ai_output)
         
         print(f"\n✅ Proof generated!")
         print(f"Outcome: {'YES' if proof.outcome == 1 else 'NO'}")
@@ -310,6 +1232,130 @@ def main():
                 f.write(proof.proof)
             print(f"Proof saved to: {args.output}")
 
+    
+    elif args.command == "execute":
+        if args.program == "evidence":
+            content = evidence_argument(args.content, args.content_file)
+            if content is None or args.salt is None:
+                parser.error("execute --program evidence requires --content or --content-file, and --salt")
+            report = prover.execute_evidence(content, args.salt)
+        else:
+            evidence = evidence_argument(args.evidence, args.evidence_file)
+            if evidence is None or args.ai_output is None:
+                parser.error("execute --program ai-analysis requires --evidence or --evidence-file, and --ai-output")
+            report = prover.execute_ai_analysis(evidence, args.ai_output)
+        
+        regressions = []
+        baseline = {}
+        if args.baseline and os.path.exists(args.baseline):
+            with open(args.baseline) as f:
+                baseline = json.load(f)
+        if args.baseline and (args.update_baseline or report.program not in baseline):
+            baseline[report.program] = {"cycles": report.cycles, "cycle_tracker": report.cycle_tracker}
+            with open(args.baseline, "w") as f:
+                json.dump(baseline, f, indent=2, sort_keys=True)
+        elif args.baseline:
+            regressions = check_cycle_baseline(report, baseline, args.max_regression)
+        
+        if args.json:
+            print(json.dumps({
+                "program": report.program,
+                "public_values": "0x" + report.public_values.hex(),
+                "outputs": report.outputs,
+                "mismatches": report.mismatches,
+                "cycles": report.cycles,
+                "syscalls": report.syscalls,
+                "cycle_tracker": report.cycle_tracker,
+                "seconds": round(report.seconds, 3),
+                "regressions": regressions,
+            }, indent=2))
+        else:
+            print(f"⏱️  {report.program}: {report.cycles:,} cycles, {report.syscalls:,} syscalls "
+                  f"({report.seconds:.2f}s)")
+            for span, cycles in sorted(report.cycle_tracker.items(), key=lambda kv: -kv[1]):
+                print(f"  {span:<24} {cycles:>12,}")
+            for field in report.mismatches:
+                print(f"❌ {field}: zkVM {report.outputs[field]} != Python {report.expected[field]}")
+            for regression in regressions:
+                print(f"❌ Cycle regression {regression}")
+            if report.matches and not regressions:
+                print("✅ Committed outputs match the Python computation")
+        if report.mismatches or regressions:
+            sys.exit(1)
+    
+    elif args.command == "aggregate":
+        stream = sys.stdin if args.input == "-" else open(args.input)
+        items = [json.loads(line) for line in stream if line.strip()]
+        triples = [(int(i["market_id"]),) + batch_item(args.program, i) for i in items]
+        print(f"Aggregating {len(items)} {args.program} proofs...")
+        
+        if args.program == "evidence":
+            aggregated = prover.aggregate_evidence_proofs(triples, args.max_workers)
+        else:
+            aggregated = prover.aggregate_ai_analysis_proofs(triples, args.max_workers)
+        
+        print(f"\n✅ Aggregated proof generated!")
+        print(f"Inner program vkey digest: 0x{aggregated.inner_vkey_digest.hex()}")
+        for market_id, proof in zip(aggregated.market_ids, aggregated.proofs):
+            print(f"  Market {market_id}: evidence hash 0x{proof.evidence_hash.hex()}")
+        print(f"Public values: 0x{aggregated.public_values.hex()}")
+        
+        if args.output:
+            with open(args.output, 'wb') as f:
+                f.write(aggregated.proof)
+            print(f"Proof saved to: {args.output}")
+    
+    elif args.command == "batch":
+        stream = sys.stdin if args.input == "-" else open(args.input)
+        items = [json.loads(line) for line in stream if line.strip()]
+        # Items that cannot even be read (missing "salt", ...) are reported, not fatal
+        arguments, positions, invalid = [], [], []
+        for index, item in enumerate(items):
+            try:
+                arguments.append(batch_item(args.program, item))
+                positions.append(index)
+            except (AttributeError, KeyError, OSError, ValueError) as e:
+                invalid.append(BatchProofResult(index=index, error=f"{type(e).__name__}: {e}"))
+        if args.program == "evidence":
+            proved = prover.generate_evidence_proofs(arguments, args.max_workers)
+        else:
+            proved = prover.generate_ai_analysis_proofs(arguments, args.max_workers)
+        results = itertools.chain(invalid, (
+            dataclasses.replace(result, index=positions[result.index]) for result in proved
+        ))
+        if args.output_dir:
+            os.makedirs(args.output_dir, exist_ok=True)
+        
+        print(f"Proving {len(items)} items (up to {prover.concurrency_limit(f'sp1-{args.program}', args.max_workers)} "
+              f"concurrent once peak RSS is known)...", file=sys.stderr)
+        failed = 0
+        for result in results:
+            record = {"index": result.index, "cached": result.cached, "seconds": round(result.seconds, 2),
+                      "peak_rss_mb": result.peak_rss_mb}
+            if "id" in items[result.index]:
+                record["id"] = items[result.index]["id"]
+            if result.error:
+                record["error"] = result.error
+                failed += 1
+            else:
+                proof = result.proof
+                record["evidence_hash"] = "0x" + proof.evidence_hash.hex()
+                if args.program == "evidence":
+                    record["commitment"] = "0x" + proof.commitment.hex()
+                else:
+                    record["outcome"] = proof.outcome
+                    record["confidence"] = proof.confidence
+                record["public_values"] = "0x" + proof.public_values.hex()
+                if args.output_dir:
+                    record["proof_file"] = os.path.join(args.output_dir, f"{result.index}.bin")
+                    with open(record["proof_file"], "wb") as f:
+                        f.write(proof.proof)
+                else:
+                    record["proof"] = "0x" + proof.proof.hex()
+            print(json.dumps(record), flush=True)
+        if failed:
+            print(f"❌ {failed} of {len(items)} items failed", file=sys.stderr)
+            sys.exit(1)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
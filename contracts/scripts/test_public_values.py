@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Tests for the public values encoders in sp1_prover.py: round trips, and the
+vectors SP1VerifierIntegration.t.sol parses (*FromPythonEncoder tests).
+
+Usage:
+    python3 -m unittest test_public_values
+"""
+
+import hashlib
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from sp1_prover import (
+    SP1Prover,
+    decode_aggregated_public_values,
+    decode_ai_analysis_public_values,
+    decode_evidence_public_values,
+    decode_public_values,
+    encode_aggregated_public_values,
+    encode_ai_analysis_public_values,
+    encode_evidence_public_values,
+    encode_public_values,
+)
+
+EVIDENCE = "BTC closed above 100k"
+SALT = "0123456789abcdef"
+AI_OUTPUT = "YES. Confidence: 85%"
+
+# Keep in sync with test/SP1VerifierIntegration.t.sol
+EVIDENCE_VECTOR = bytes.fromhex(
+    "ba074c21e3e51ffc32af1c84ab76e96576803e5ab28a889cff9f09ad27156989"
+    "4dc546eac6897b36f22350322f3da6cbe1774a4237aeb589b8fe0d4b32f38d21"
+    "01"
+)
+AI_ANALYSIS_VECTOR = bytes.fromhex(
+    "012134"
+    "ba074c21e3e51ffc32af1c84ab76e96576803e5ab28a889cff9f09ad27156989"
+    "d7aee46ff2b28f23c7ecb74a8efb40db520bf2285beb692e04e1ade28c7775ee"
+)
+AGGREGATED_VECTOR = bytes.fromhex(
+    "22" * 32 + "00000001"
+    + "00" * 31 + "05" + "aa" * 32 + "bb" * 32 + "01"
+)
+
+
+class PublicValuesTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.prover = SP1Prover(network="mock", cache_dir=self.tmp.name, use_cache=False)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_evidence_vector(self):
+        job = self.prover._evidence_job(EVIDENCE, SALT)
+        self.assertEqual(encode_public_values(job.program, job.expected_public), EVIDENCE_VECTOR)
+        self.assertEqual(decode_public_values(job.program, EVIDENCE_VECTOR), job.expected_public)
+
+    def test_ai_analysis_vector(self):
+        job = self.prover._ai_analysis_job(EVIDENCE, AI_OUTPUT)
+        self.assertEqual(encode_public_values(job.program, job.expected_public), AI_ANALYSIS_VECTOR)
+        self.assertEqual(decode_public_values(job.program, AI_ANALYSIS_VECTOR), job.expected_public)
+        self.assertEqual(AI_ANALYSIS_VECTOR[35:], hashlib.sha256(AI_OUTPUT.encode()).digest())
+
+    def test_aggregated_vector(self):
+        inner = encode_evidence_public_values(b"\xaa" * 32, b"\xbb" * 32, True)
+        encoded = encode_aggregated_public_values("sp1-evidence", b"\x22" * 32, [(5, inner)])
+        self.assertEqual(encoded, AGGREGATED_VECTOR)
+        self.assertEqual(decode_aggregated_public_values("sp1-evidence", encoded), (b"\x22" * 32, [(5, inner)]))
+
+    def test_evidence_round_trip(self):
+        for valid_length in (True, False):
+            values = (os.urandom(32), os.urandom(32), valid_length)
+            self.assertEqual(decode_evidence_public_values(encode_evidence_public_values(*values)), values)
+
+    def test_ai_analysis_round_trip(self):
+        for outcome, confidence in ((0, 0), (1, 10000), (1, 8500)):
+            values = (outcome, confidence, os.urandom(32), os.urandom(32))
+            self.assertEqual(decode_ai_analysis_public_values(encode_ai_analysis_public_values(*values)), values)
+
+    def test_aggregated_round_trip(self):
+        items = [(market_id, encode_ai_analysis_public_values(1, 7500, os.urandom(32), os.urandom(32)))
+                 for market_id in (0, 7, 2**64 - 1)]
+        encoded = encode_aggregated_public_values("sp1-ai-analysis", b"\x01" * 32, items)
+        self.assertEqual(decode_aggregated_public_values("sp1-ai-analysis", encoded), (b"\x01" * 32, items))
+
+    def test_encoders_reject_what_the_contract_reverts_on(self):
+        with self.assertRaises(ValueError):
+            encode_ai_analysis_public_values(2, 5000, b"\0" * 32, b"\0" * 32)
+        with self.assertRaises(ValueError):
+            encode_ai_analysis_public_values(1, 10001, b"\0" * 32, b"\0" * 32)
+        with self.assertRaises(ValueError):
+            encode_evidence_public_values(b"\0" * 31, b"\0" * 32, True)
+        with self.assertRaises(ValueError):
+            decode_aggregated_public_values("sp1-evidence", AGGREGATED_VECTOR[:-1])
+
+    def test_binary_evidence_file(self):
+        # Not UTF-8: hashed and written to the host as raw bytes
+        data = b"%PDF-1.7\n\xe2\xe3\xcf\xd3\xff\x00"
+        with tempfile.NamedTemporaryFile(dir=self.tmp.name, delete=False) as f:
+            f.write(data)
+        job = self.prover._evidence_job(Path(f.name), SALT)
+        self.assertEqual(job.expected_public["evidence_hash"], hashlib.sha256(data).hexdigest())
+        self.assertEqual("".join(self.prover._input_chunks(job.private_inputs)),
+                         '{"inputs":["%s","%s"]}' % (data.hex(), SALT.encode().hex()))
+        with open(f.name, "ab") as f:
+            f.write(b"\0" * 10000)
+        with self.assertRaises(ValueError):
+            self.prover._evidence_job(Path(f.name), SALT)
+
+    def test_confidence_clamped_like_the_guest(self):
+        self.assertEqual(self.prover._parse_ai_output("NO. Confidence: -5%"), (0, 0))
+        self.assertEqual(self.prover._parse_ai_output("YES. Confidence: 150%"), (1, 10000))
+        job = self.prover._ai_analysis_job(EVIDENCE, "NO. Confidence: -5%")
+        self.assertEqual(encode_public_values(job.program, job.expected_public)[:3], b"\x00\x00\x00")
+
+    def test_confidence_grammar_matches_the_guest(self):
+        # Same cases as test_confidence_strict_grammar in sp1-ai-analysis
+        self.assertEqual(self.prover._parse_ai_output("YES. Confidence: +42.5%"), (1, 4250))
+        for output in ("Confidence: nan%", "Confidence: inf%", "Confidence: 1e2%", "Confidence: 1_0%",
+                       "Confidence: \uff18\uff15%", "Confidence: .5%", "Confidence: 5.%",
+                       "Confidence: " + "9" * 400 + "%"):
+            self.assertEqual(self.prover._parse_ai_output(output), (0, 5000), output)
+
+
+if __name__ == "__main__":
+    unittest.main()
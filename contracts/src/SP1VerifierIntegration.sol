@@ -27,6 +27,15 @@ contract SP1VerifierIntegration {
     /// @notice Admin who can update verification keys
     address public admin;
 
+    /// @notice Program verification key of sp1-aggregation, which verifies many proofs in one
+    bytes32 public aggregationProgramVKey;
+
+    /// @notice Verification key digest of the evidence program, as committed by aggregated proofs
+    bytes32 public evidenceProgramDigest;
+
+    /// @notice Verification key digest of the AI analysis program, as committed by aggregated proofs
+    bytes32 public aiAnalysisProgramDigest;
+
     // ============================================================
     // EVENTS
     // ============================================================
@@ -35,6 +44,8 @@ contract SP1VerifierIntegration {
 
     event AIAnalysisProofVerified(uint8 indexed outcome, uint16 confidence, bytes32 indexed evidenceHash);
 
+    event ProofBatchVerified(string programType, bytes32 indexed publicValuesHash, uint256 count);
+
     event ProgramVKeyUpdated(string programType, bytes32 oldVKey, bytes32 newVKey);
 
     // ============================================================
@@ -162,6 +173,125 @@ contract SP1VerifierIntegration {
         evidenceHash = bytes32(publicValues[3:35]);
     }
 
+    // ============================================================
+    // AGGREGATED PROOF VERIFICATION
+    // ============================================================
+
+    /**
+     * @notice Verify one aggregated proof covering the evidence proofs of many markets
+     * @dev A single verifyProof call replaces one verifyEvidenceProof per market.
+     *      Reverts if any item has an invalid length, so a batch settles all or nothing.
+     * @param proof The SP1 proof bytes of sp1-aggregation
+     * @param publicValues The public values committed by sp1-aggregation
+     * @return marketIds Market of each inner proof
+     * @return evidenceHashes Evidence hash of each inner proof
+     * @return commitments Commitment of each inner proof
+     */
+    function verifyEvidenceProofBatch(bytes calldata proof, bytes calldata publicValues)
+        external
+        returns (uint256[] memory marketIds, bytes32[] memory evidenceHashes, bytes32[] memory commitments)
+    {
+        uint256 count = _verifyProofBatch(proof, publicValues, evidenceProgramDigest, 65);
+
+        marketIds = new uint256[](count);
+        evidenceHashes = new bytes32[](count);
+        commitments = new bytes32[](count);
+
+        for (uint256 i = 0; i < count; i++) {
+            // Item layout: market_id (32 bytes) | evidence public values (65 bytes)
+            uint256 offset = 36 + i * 97;
+            marketIds[i] = uint256(bytes32(publicValues[offset:offset + 32]));
+            bool validLength;
+            (evidenceHashes[i], commitments[i], validLength) =
+                parseEvidencePublicValues(publicValues[offset + 32:offset + 97]);
+
+            if (!validLength) revert InvalidPublicValues();
+
+            emit EvidenceProofVerified(evidenceHashes[i], commitments[i], validLength);
+        }
+
+        emit ProofBatchVerified("evidence", keccak256(publicValues), count);
+    }
+
+    /**
+     * @notice Verify one aggregated proof covering the AI analysis proofs of many markets
+     * @param proof The SP1 proof bytes of sp1-aggregation
+     * @param publicValues The public values committed by sp1-aggregation
+     * @return marketIds Market of each inner proof
+     * @return outcomes AI decision of each inner proof (0=No, 1=Yes)
+     * @return confidences Confidence of each inner proof (0-10000 basis points)
+     * @return evidenceHashes Hash of the evidence each inner proof analyzed
+     */
+    function verifyAIAnalysisProofBatch(bytes calldata proof, bytes calldata publicValues)
+        external
+        returns (
+            uint256[] memory marketIds,
+            uint8[] memory outcomes,
+            uint16[] memory confidences,
+            bytes32[] memory evidenceHashes
+        )
+    {
+        uint256 count = _verifyProofBatch(proof, publicValues, aiAnalysisProgramDigest, 67);
+
+        marketIds = new uint256[](count);
+        outcomes = new uint8[](count);
+        confidences = new uint16[](count);
+        evidenceHashes = new bytes32[](count);
+
+        for (uint256 i = 0; i < count; i++) {
+            // Item layout: market_id (32 bytes) | AI analysis public values (67 bytes)
+            uint256 offset = 36 + i * 99;
+            marketIds[i] = uint256(bytes32(publicValues[offset:offset + 32]));
+            (outcomes[i], confidences[i], evidenceHashes[i]) =
+                parseAIAnalysisPublicValues(publicValues[offset + 32:offset + 99]);
+
+            if (outcomes[i] > 1) revert InvalidPublicValues();
+            if (confidences[i] > 10000) revert InvalidPublicValues();
+
+            emit AIAnalysisProofVerified(outcomes[i], confidences[i], evidenceHashes[i]);
+        }
+
+        emit ProofBatchVerified("ai_analysis", keccak256(publicValues), count);
+    }
+
+    /**
+     * @notice Parse the header of aggregated public values
+     * @dev Layout: inner_vkey_digest (32 bytes) | count (4 bytes), then count items of
+     *      market_id (32 bytes) | inner public values
+     */
+    function parseAggregatedPublicValues(bytes calldata publicValues)
+        public
+        pure
+        returns (bytes32 innerVKeyDigest, uint256 count)
+    {
+        require(publicValues.length >= 36, "Invalid public values length");
+
+        innerVKeyDigest = bytes32(publicValues[0:32]);
+        count = uint32(bytes4(publicValues[32:36]));
+    }
+
+    /**
+     * @dev Verify an sp1-aggregation proof whose inner proofs are of the program with
+     *      the given digest, and return the number of items
+     */
+    function _verifyProofBatch(
+        bytes calldata proof,
+        bytes calldata publicValues,
+        bytes32 innerDigest,
+        uint256 innerLength
+    ) internal view returns (uint256 count) {
+        if (aggregationProgramVKey == bytes32(0) || innerDigest == bytes32(0)) revert InvalidProgramVKey();
+
+        // One verification for the whole batch; sp1-aggregation verified every inner proof
+        ISP1Verifier(sp1Verifier).verifyProof(aggregationProgramVKey, publicValues, proof);
+
+        bytes32 innerVKeyDigest;
+        (innerVKeyDigest, count) = parseAggregatedPublicValues(publicValues);
+
+        if (innerVKeyDigest != innerDigest) revert InvalidProgramVKey();
+        if (count == 0 || publicValues.length != 36 + count * (32 + innerLength)) revert InvalidPublicValues();
+    }
+
     // ============================================================
     // ADMIN FUNCTIONS
     // ============================================================
@@ -186,6 +316,36 @@ contract SP1VerifierIntegration {
         emit ProgramVKeyUpdated("ai_analysis", oldVKey, _newVKey);
     }
 
+    /**
+     * @notice Update the aggregation program verification key
+     * @param _newVKey The new verification key
+     */
+    function updateAggregationProgramVKey(bytes32 _newVKey) external onlyAdmin {
+        bytes32 oldVKey = aggregationProgramVKey;
+        aggregationProgramVKey = _newVKey;
+        emit ProgramVKeyUpdated("aggregation", oldVKey, _newVKey);
+    }
+
+    /**
+     * @notice Update the evidence program digest accepted inside aggregated proofs
+     * @param _newDigest The new verification key digest
+     */
+    function updateEvidenceProgramDigest(bytes32 _newDigest) external onlyAdmin {
+        bytes32 oldDigest = evidenceProgramDigest;
+        evidenceProgramDigest = _newDigest;
+        emit ProgramVKeyUpdated("evidence_digest", oldDigest, _newDigest);
+    }
+
+    /**
+     * @notice Update the AI analysis program digest accepted inside aggregated proofs
+     * @param _newDigest The new verification key digest
+     */
+    function updateAIAnalysisProgramDigest(bytes32 _newDigest) external onlyAdmin {
+        bytes32 oldDigest = aiAnalysisProgramDigest;
+        aiAnalysisProgramDigest = _newDigest;
+        emit ProgramVKeyUpdated("ai_analysis_digest", oldDigest, _newDigest);
+    }
+
     /**
      * @notice Transfer admin rights
      * @param _newAdmin The new admin address
@@ -26,12 +26,21 @@ contract SP1VerifierIntegrationTest is Test {
 
     bytes32 constant EVIDENCE_VKEY = keccak256("evidence_vkey");
     bytes32 constant AI_ANALYSIS_VKEY = keccak256("ai_analysis_vkey");
+    bytes32 constant AGGREGATION_VKEY = keccak256("aggregation_vkey");
+    bytes32 constant EVIDENCE_DIGEST = keccak256("evidence_digest");
+    bytes32 constant AI_ANALYSIS_DIGEST = keccak256("ai_analysis_digest");
 
     function setUp() public {
         mockSP1 = new MockSP1Verifier();
 
         vm.prank(admin);
         verifier = new SP1VerifierIntegration(address(mockSP1), EVIDENCE_VKEY, AI_ANALYSIS_VKEY);
+
+        vm.startPrank(admin);
+        verifier.updateAggregationProgramVKey(AGGREGATION_VKEY);
+        verifier.updateEvidenceProgramDigest(EVIDENCE_DIGEST);
+        verifier.updateAIAnalysisProgramDigest(AI_ANALYSIS_DIGEST);
+        vm.stopPrank();
     }
 
     // ================================================================
@@ -110,6 +119,20 @@ contract SP1VerifierIntegrationTest is Test {
         assertTrue(retValid);
     }
 
+    /// @dev Vector from scripts/sp1_prover.py encode_evidence_public_values
+    ///      (content "BTC closed above 100k", salt "0123456789abcdef")
+    function test_ParseEvidencePublicValuesFromPythonEncoder() public view {
+        bytes memory publicValues =
+            hex"ba074c21e3e51ffc32af1c84ab76e96576803e5ab28a889cff9f09ad271569894dc546eac6897b36f22350322f3da6cbe1774a4237aeb589b8fe0d4b32f38d2101";
+        bytes32 evidenceHash = sha256(bytes("BTC closed above 100k"));
+
+        (bytes32 retHash, bytes32 retCommit, bool retValid) = verifier.parseEvidencePublicValues(publicValues);
+        assertEq(publicValues.length, 65);
+        assertEq(retHash, evidenceHash);
+        assertEq(retCommit, sha256(abi.encodePacked(evidenceHash, "0123456789abcdef")));
+        assertTrue(retValid);
+    }
+
     function test_RevertParseEvidenceTooShort() public {
         bytes memory shortValues = new bytes(64); // Need 65
 
@@ -209,6 +232,26 @@ contract SP1VerifierIntegrationTest is Test {
         assertEq(retHash, evidenceHash);
     }
 
+    /// @dev Vector from scripts/sp1_prover.py encode_ai_analysis_public_values
+    ///      (output "YES. Confidence: 85%"); confidence is big-endian 0x2134
+    function test_ParseAIAnalysisPublicValuesFromPythonEncoder() public view {
+        bytes memory publicValues =
+            hex"012134ba074c21e3e51ffc32af1c84ab76e96576803e5ab28a889cff9f09ad27156989d7aee46ff2b28f23c7ecb74a8efb40db520bf2285beb692e04e1ade28c7775ee";
+
+        (uint8 retOutcome, uint16 retConfidence, bytes32 retHash) =
+            verifier.parseAIAnalysisPublicValues(publicValues);
+
+        assertEq(publicValues.length, 67);
+        assertEq(retOutcome, 1);
+        assertEq(retConfidence, 8500);
+        assertEq(retHash, sha256(bytes("BTC closed above 100k")));
+        assertEq(bytes32(this.slice(publicValues, 35, 67)), sha256(bytes("YES. Confidence: 85%")));
+    }
+
+    function slice(bytes calldata data, uint256 start, uint256 end) external pure returns (bytes memory) {
+        return data[start:end];
+    }
+
     function test_RevertParseAIAnalysisTooShort() public {
         bytes memory shortValues = new bytes(34); // Need 35
 
@@ -216,6 +259,135 @@ contract SP1VerifierIntegrationTest is Test {
         verifier.parseAIAnalysisPublicValues(shortValues);
     }
 
+    // ================================================================
+    // AGGREGATED PROOF VERIFICATION
+    // ================================================================
+
+    function _evidenceBatch(bytes32 digest, uint8 validByte) internal pure returns (bytes memory) {
+        // Layout: inner_vkey_digest (32) | count (4) | [market_id (32) | evidence public values (65)]...
+        return abi.encodePacked(
+            digest,
+            uint32(2),
+            uint256(3),
+            keccak256("evidence 3"),
+            keccak256("commitment 3"),
+            uint8(1),
+            uint256(7),
+            keccak256("evidence 7"),
+            keccak256("commitment 7"),
+            validByte
+        );
+    }
+
+    function test_VerifyEvidenceProofBatch() public {
+        (uint256[] memory marketIds, bytes32[] memory hashes, bytes32[] memory commitments) =
+            verifier.verifyEvidenceProofBatch("proof", _evidenceBatch(EVIDENCE_DIGEST, 1));
+
+        assertEq(marketIds.length, 2);
+        assertEq(marketIds[0], 3);
+        assertEq(marketIds[1], 7);
+        assertEq(hashes[0], keccak256("evidence 3"));
+        assertEq(hashes[1], keccak256("evidence 7"));
+        assertEq(commitments[0], keccak256("commitment 3"));
+        assertEq(commitments[1], keccak256("commitment 7"));
+    }
+
+    function test_RevertEvidenceBatchInvalidItemLength() public {
+        vm.expectRevert(SP1VerifierIntegration.InvalidPublicValues.selector);
+        verifier.verifyEvidenceProofBatch("proof", _evidenceBatch(EVIDENCE_DIGEST, 0));
+    }
+
+    function test_RevertEvidenceBatchWrongInnerProgram() public {
+        // AI analysis proofs aggregated, submitted as evidence
+        vm.expectRevert(SP1VerifierIntegration.InvalidProgramVKey.selector);
+        verifier.verifyEvidenceProofBatch("proof", _evidenceBatch(AI_ANALYSIS_DIGEST, 1));
+    }
+
+    function test_RevertEvidenceBatchCountMismatch() public {
+        bytes memory publicValues = abi.encodePacked(_evidenceBatch(EVIDENCE_DIGEST, 1), uint8(0));
+
+        vm.expectRevert(SP1VerifierIntegration.InvalidPublicValues.selector);
+        verifier.verifyEvidenceProofBatch("proof", publicValues);
+    }
+
+    function test_RevertEvidenceBatchEmpty() public {
+        vm.expectRevert(SP1VerifierIntegration.InvalidPublicValues.selector);
+        verifier.verifyEvidenceProofBatch("proof", abi.encodePacked(EVIDENCE_DIGEST, uint32(0)));
+    }
+
+    function test_RevertEvidenceBatchNotConfigured() public {
+        vm.prank(admin);
+        verifier.updateAggregationProgramVKey(bytes32(0));
+
+        vm.expectRevert(SP1VerifierIntegration.InvalidProgramVKey.selector);
+        verifier.verifyEvidenceProofBatch("proof", _evidenceBatch(EVIDENCE_DIGEST, 1));
+    }
+
+    function test_RevertEvidenceBatchSP1Failure() public {
+        mockSP1.setShouldRevert(true);
+
+        vm.expectRevert("proof verification failed");
+        verifier.verifyEvidenceProofBatch("proof", _evidenceBatch(EVIDENCE_DIGEST, 1));
+    }
+
+    function test_VerifyAIAnalysisProofBatch() public {
+        // Layout: inner_vkey_digest (32) | count (4) | [market_id (32) | AI analysis public values (67)]...
+        bytes memory publicValues = abi.encodePacked(
+            AI_ANALYSIS_DIGEST,
+            uint32(2),
+            uint256(3),
+            uint8(1),
+            uint16(8500),
+            keccak256("evidence 3"),
+            keccak256("reasoning 3"),
+            uint256(7),
+            uint8(0),
+            uint16(6000),
+            keccak256("evidence 7"),
+            keccak256("reasoning 7")
+        );
+
+        (uint256[] memory marketIds, uint8[] memory outcomes, uint16[] memory confidences, bytes32[] memory hashes) =
+            verifier.verifyAIAnalysisProofBatch("proof", publicValues);
+
+        assertEq(marketIds[1], 7);
+        assertEq(outcomes[0], 1);
+        assertEq(outcomes[1], 0);
+        assertEq(confidences[0], 8500);
+        assertEq(confidences[1], 6000);
+        assertEq(hashes[1], keccak256("evidence 7"));
+    }
+
+    function test_RevertAIAnalysisBatchInvalidConfidence() public {
+        bytes memory publicValues = abi.encodePacked(
+            AI_ANALYSIS_DIGEST, uint32(1), uint256(3), uint8(1), uint16(10001), keccak256("e"), keccak256("r")
+        );
+
+        vm.expectRevert(SP1VerifierIntegration.InvalidPublicValues.selector);
+        verifier.verifyAIAnalysisProofBatch("proof", publicValues);
+    }
+
+    /// @dev Vector from scripts/sp1_prover.py encode_aggregated_public_values
+    ///      (digest 0x22..22, market 5, evidence hash 0xaa..aa, commitment 0xbb..bb)
+    function test_ParseAggregatedPublicValuesFromPythonEncoder() public {
+        bytes memory publicValues =
+            hex"2222222222222222222222222222222222222222222222222222222222222222000000010000000000000000000000000000000000000000000000000000000000000005aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaabbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbb01";
+        bytes32 digest = bytes32(this.slice(publicValues, 0, 32));
+
+        (bytes32 retDigest, uint256 retCount) = verifier.parseAggregatedPublicValues(publicValues);
+        assertEq(publicValues.length, 36 + 97);
+        assertEq(retCount, 1);
+        assertEq(retDigest, digest);
+
+        vm.prank(admin);
+        verifier.updateEvidenceProgramDigest(digest);
+        (uint256[] memory marketIds, bytes32[] memory hashes, bytes32[] memory commitments) =
+            verifier.verifyEvidenceProofBatch("proof", publicValues);
+        assertEq(marketIds[0], 5);
+        assertEq(hashes[0], bytes32(0xaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa));
+        assertEq(commitments[0], bytes32(0xbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbb));
+    }
+
     // ================================================================
     // ADMIN FUNCTIONS
     // ================================================================
@@ -250,6 +422,29 @@ contract SP1VerifierIntegrationTest is Test {
         verifier.updateAIAnalysisProgramVKey(keccak256("new"));
     }
 
+    function test_UpdateAggregationProgram() public {
+        vm.startPrank(admin);
+        verifier.updateAggregationProgramVKey(keccak256("new_aggregation_vkey"));
+        verifier.updateEvidenceProgramDigest(keccak256("new_evidence_digest"));
+        verifier.updateAIAnalysisProgramDigest(keccak256("new_ai_digest"));
+        vm.stopPrank();
+
+        assertEq(verifier.aggregationProgramVKey(), keccak256("new_aggregation_vkey"));
+        assertEq(verifier.evidenceProgramDigest(), keccak256("new_evidence_digest"));
+        assertEq(verifier.aiAnalysisProgramDigest(), keccak256("new_ai_digest"));
+    }
+
+    function test_RevertUpdateAggregationNonAdmin() public {
+        vm.startPrank(nonAdmin);
+        vm.expectRevert(SP1VerifierIntegration.Unauthorized.selector);
+        verifier.updateAggregationProgramVKey(keccak256("new"));
+        vm.expectRevert(SP1VerifierIntegration.Unauthorized.selector);
+        verifier.updateEvidenceProgramDigest(keccak256("new"));
+        vm.expectRevert(SP1VerifierIntegration.Unauthorized.selector);
+        verifier.updateAIAnalysisProgramDigest(keccak256("new"));
+        vm.stopPrank();
+    }
+
     function test_TransferAdmin() public {
         address newAdmin = address(42);
 
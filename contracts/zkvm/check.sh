@@ -0,0 +1,45 @@
+#!/bin/bash
+# Build the SP1 programs and host, then run both programs through the SP1
+# executor and the mock prover. Run after changing anything under zkvm/.
+
+set -e
+
+cd "$(dirname "$0")"
+CARGO_PROVE=${CARGO_PROVE:-$HOME/.sp1/bin/cargo-prove}
+
+echo "================================"
+echo "AIJudgeMarket zkVM Check"
+echo "================================"
+echo ""
+
+echo "1. Unit testing programs..."
+for program in sp1-evidence sp1-ai-analysis sp1-aggregation; do
+    (cd $program && cargo test)
+done
+echo ""
+
+echo "2. Building programs..."
+for program in sp1-evidence sp1-ai-analysis sp1-aggregation; do
+    (cd $program && $CARGO_PROVE prove build)
+done
+echo ""
+
+echo "3. Building host..."
+(cd script && cargo build --release)
+echo ""
+
+echo "4. Executing and mock proving..."
+CACHE_DIR=$(mktemp -d)
+trap 'rm -rf "$CACHE_DIR"' EXIT
+PROVER="python3 ../scripts/sp1_prover.py --network mock --proof-mode core --cache-dir $CACHE_DIR"
+EVIDENCE="BTC closed above 100k"
+AI_OUTPUT="YES. Confidence: 85%"
+
+$PROVER execute --program evidence --content "$EVIDENCE" --salt 0123456789abcdef
+$PROVER execute --program ai-analysis --evidence "$EVIDENCE" --ai-output "$AI_OUTPUT"
+$PROVER evidence --content "$EVIDENCE" --salt 0123456789abcdef --output "$CACHE_DIR/evidence.bin"
+$PROVER ai-analysis --evidence "$EVIDENCE" --ai-output "$AI_OUTPUT" --output "$CACHE_DIR/ai.bin"
+
+echo ""
+echo "✓ Programs and host build; both programs execute and prove"
+echo ""
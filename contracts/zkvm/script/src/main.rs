@@ -0,0 +1,247 @@
+//! SP1 Host for the AIJudgeMarket ZK Programs
+//!
+//! Loads a guest ELF built with `cargo prove build` (sp1-evidence or
+//! sp1-ai-analysis), feeds it the private inputs and prints a JSON result on
+//! stdout, so `scripts/sp1_prover.py` can drive it as a subprocess.
+//!
+//! Input file (JSON): {"inputs": ["<hex bytes read first>", "<hex bytes read second>", ...]}
+//! Each input is hex-decoded and written to SP1Stdin in order as a raw buffer,
+//! matching the guest's `sp1_zkvm::io::read_vec()` calls, so evidence can be
+//! any bytes (not only UTF-8 text).
+//!
+//! The prover backend comes from the environment (SP1_PROVER=cpu|cuda|network|mock,
+//! NETWORK_PRIVATE_KEY for the Succinct prover network).
+//!
+//! `aggregate` instead takes compressed proofs of one inner program and proves
+//! sp1-aggregation over them:
+//! {"market_ids": [1, 2, ...], "proofs": ["<compressed proof file>", ...]}
+//!
+//! `verify` checks on-chain (Groth16/PLONK) proof bytes offline, exactly as the
+//! SP1 verifier contracts would, one result per proof:
+//! {"proofs": [{"vkey": "0x..", "mode": "groth16", "proof": "0x..", "public_values": "0x.."}, ...]}
+//!
+//! Usage:
+//!   aijudge-prover vkey      --elf <ELF>
+//!   aijudge-prover execute   --elf <ELF> --input inputs.json
+//!   aijudge-prover prove     --elf <ELF> --input inputs.json --mode groth16
+//!   aijudge-prover aggregate --elf <AGGREGATION ELF> --inner-elf <ELF> --input batch.json --mode groth16
+//!   aijudge-prover verify    --input proofs.json
+
+use std::{collections::BTreeMap, fs, path::PathBuf};
+
+use clap::{Parser, Subcommand, ValueEnum};
+use serde::Deserialize;
+use serde_json::json;
+use sp1_sdk::{
+    EnvProver, HashableKey, ProverClient, SP1Proof, SP1ProofWithPublicValues, SP1Stdin, SP1VerifyingKey,
+};
+use sp1_verifier::{Groth16Verifier, PlonkVerifier, GROTH16_VK_BYTES, PLONK_VK_BYTES};
+
+#[derive(Parser)]
+#[command(name = "aijudge-prover", about = "SP1 host for the AIJudgeMarket zkVM programs")]
+struct Cli {
+    #[command(subcommand)]
+    command: Command,
+}
+
+#[derive(Subcommand)]
+enum Command {
+    /// Print the program verification key (bytes32, as SP1VerifierIntegration stores it)
+    /// and its digest (as sp1-aggregation commits it)
+    Vkey {
+        #[arg(long)]
+        elf: PathBuf,
+    },
+    /// Run the program in the executor without proving; report public values and cycles
+    Execute {
+        #[arg(long)]
+        elf: PathBuf,
+        #[arg(long)]
+        input: PathBuf,
+    },
+    /// Generate and locally verify a proof
+    Prove {
+        #[arg(long)]
+        elf: PathBuf,
+        #[arg(long)]
+        input: PathBuf,
+        #[arg(long, value_enum, default_value_t = Mode::Groth16)]
+        mode: Mode,
+    },
+    /// Prove the aggregation program over compressed proofs of an inner program
+    Aggregate {
+        #[arg(long)]
+        elf: PathBuf,
+        #[arg(long)]
+        inner_elf: PathBuf,
+        #[arg(long)]
+        input: PathBuf,
+        #[arg(long, value_enum, default_value_t = Mode::Groth16)]
+        mode: Mode,
+    },
+    /// Verify on-chain proof bytes offline, without a node
+    Verify {
+        #[arg(long)]
+        input: PathBuf,
+    },
+}
+
+/// Proof type; only Groth16 and PLONK proofs are verifiable on-chain
+#[derive(Clone, Copy, ValueEnum)]
+enum Mode {
+    Core,
+    Compressed,
+    Plonk,
+    Groth16,
+}
+
+#[derive(Deserialize)]
+struct Input {
+    inputs: Vec<String>,
+}
+
+#[derive(Deserialize)]
+struct AggregationInput {
+    market_ids: Vec<u64>,
+    proofs: Vec<PathBuf>,
+}
+
+#[derive(Deserialize)]
+struct VerifyInput {
+    proofs: Vec<OnChainProof>,
+}
+
+#[derive(Deserialize)]
+struct OnChainProof {
+    vkey: String,
+    mode: String,
+    proof: String,
+    public_values: String,
+}
+
+/// Check one proof with the same verifying keys the SP1 verifier contracts embed
+fn verify_on_chain_proof(item: &OnChainProof) -> Result<(), Box<dyn std::error::Error>> {
+    let proof = hex::decode(item.proof.trim_start_matches("0x"))?;
+    let public_values = hex::decode(item.public_values.trim_start_matches("0x"))?;
+    match item.mode.as_str() {
+        "groth16" => Groth16Verifier::verify(&proof, &public_values, &item.vkey, *GROTH16_VK_BYTES)?,
+        "plonk" => PlonkVerifier::verify(&proof, &public_values, &item.vkey, *PLONK_VK_BYTES)?,
+        mode => return Err(format!("{mode} proofs are not verifiable on-chain").into()),
+    }
+    Ok(())
+}
+
+fn read_stdin(path: &PathBuf) -> Result<SP1Stdin, Box<dyn std::error::Error>> {
+    let input: Input = serde_json::from_str(&fs::read_to_string(path)?)?;
+    let mut stdin = SP1Stdin::new();
+    for value in &input.inputs {
+        stdin.write_vec(hex::decode(value)?);
+    }
+    Ok(stdin)
+}
+
+/// Digest of a verification key as bytes32 (each `hash_u32` word big-endian)
+fn vkey_digest(vk: &SP1VerifyingKey) -> String {
+    let bytes: Vec<u8> = vk.hash_u32().iter().flat_map(|word| word.to_be_bytes()).collect();
+    format!("0x{}", hex::encode(bytes))
+}
+
+/// Run the prover in the requested mode, verify locally and format the result
+fn prove(
+    client: &EnvProver,
+    elf: &[u8],
+    stdin: &SP1Stdin,
+    mode: Mode,
+) -> Result<serde_json::Value, Box<dyn std::error::Error>> {
+    let (pk, vk) = client.setup(elf);
+    let builder = client.prove(&pk, stdin);
+    let proof = match mode {
+        Mode::Core => builder.core().run()?,
+        Mode::Compressed => builder.compressed().run()?,
+        Mode::Plonk => builder.plonk().run()?,
+        Mode::Groth16 => builder.groth16().run()?,
+    };
+    client.verify(&proof, &vk)?;
+    // On-chain proof bytes for Groth16/PLONK; the serialized proof otherwise
+    let proof_bytes = match mode {
+        Mode::Plonk | Mode::Groth16 => proof.bytes(),
+        Mode::Core | Mode::Compressed => bincode::serialize(&proof)?,
+    };
+    Ok(json!({
+        "vkey": vk.bytes32(),
+        "proof": format!("0x{}", hex::encode(proof_bytes)),
+        "public_values": format!("0x{}", hex::encode(proof.public_values.as_slice())),
+    }))
+}
+
+fn run(cli: Cli) -> Result<serde_json::Value, Box<dyn std::error::Error>> {
+    // Offline verification needs no prover
+    if let Command::Verify { input } = &cli.command {
+        let batch: VerifyInput = serde_json::from_str(&fs::read_to_string(input)?)?;
+        let results: Vec<serde_json::Value> = batch
+            .proofs
+            .iter()
+            .map(|item| match verify_on_chain_proof(item) {
+                Ok(()) => json!({ "valid": true }),
+                Err(e) => json!({ "valid": false, "error": e.to_string() }),
+            })
+            .collect();
+        return Ok(json!({ "results": results }));
+    }
+    let client = ProverClient::from_env();
+    match cli.command {
+        Command::Vkey { elf } => {
+            let (_, vk) = client.setup(&fs::read(elf)?);
+            Ok(json!({ "vkey": vk.bytes32(), "vkey_digest": vkey_digest(&vk) }))
+        }
+        Command::Execute { elf, input } => {
+            let stdin = read_stdin(&input)?;
+            let (public_values, report) = client.execute(&fs::read(elf)?, &stdin).run()?;
+            // Spans come from the guests' cycle-tracker-report-start/end annotations
+            let cycle_tracker: BTreeMap<&String, &u64> = report.cycle_tracker.iter().collect();
+            Ok(json!({
+                "public_values": format!("0x{}", hex::encode(public_values.as_slice())),
+                "cycles": report.total_instruction_count(),
+                "syscalls": report.total_syscall_count(),
+                "cycle_tracker": cycle_tracker,
+            }))
+        }
+        Command::Prove { elf, input, mode } => prove(&client, &fs::read(elf)?, &read_stdin(&input)?, mode),
+        Command::Aggregate { elf, inner_elf, input, mode } => {
+            let batch: AggregationInput = serde_json::from_str(&fs::read_to_string(input)?)?;
+            if batch.market_ids.len() != batch.proofs.len() {
+                return Err("one market id per proof".into());
+            }
+            let (_, inner_vk) = client.setup(&fs::read(inner_elf)?);
+            let mut stdin = SP1Stdin::new();
+            let mut public_values = Vec::with_capacity(batch.proofs.len());
+            for path in &batch.proofs {
+                let proof: SP1ProofWithPublicValues = bincode::deserialize(&fs::read(path)?)?;
+                // Fail here rather than deep inside the recursion prover
+                client.verify(&proof, &inner_vk)?;
+                let SP1Proof::Compressed(reduced) = proof.proof else {
+                    return Err(format!("{} is not a compressed proof", path.display()).into());
+                };
+                stdin.write_proof(*reduced, inner_vk.vk.clone());
+                public_values.push(proof.public_values.to_vec());
+            }
+            stdin.write(&inner_vk.hash_u32());
+            stdin.write(&batch.market_ids);
+            stdin.write(&public_values);
+            let mut result = prove(&client, &fs::read(elf)?, &stdin, mode)?;
+            result["inner_vkey_digest"] = json!(vkey_digest(&inner_vk));
+            Ok(result)
+        }
+        Command::Verify { .. } => unreachable!("handled above"),
+    }
+}
+
+fn main() {
+    match run(Cli::parse()) {
+        Ok(result) => println!("{}", result),
+        Err(e) => {
+            eprintln!("error: {e}");
+            std::process::exit(1);
+        }
+    }
+}
@@ -0,0 +1,89 @@
+//! SP1 ZK Program for Aggregating AIJudgeMarket Proofs
+//!
+//! This program verifies many compressed proofs of one inner program
+//! (sp1-evidence or sp1-ai-analysis) inside the zkVM, so a whole batch of
+//! markets is settled with a single on-chain `verifyProof` call.
+//!
+//! Inputs (private):
+//!   - vkey: Digest of the inner program's verification key (`vk.hash_u32()`)
+//!   - market_ids: Market each inner proof belongs to
+//!   - public_values: Public values committed by each inner proof
+//!   - the inner proofs themselves, written by the host with `SP1Stdin::write_proof`
+//!
+//! Outputs (public), the layout SP1VerifierIntegration's batch functions read:
+//!   - inner_vkey (32 bytes): the vkey words, big-endian
+//!   - count (4 bytes, big-endian)
+//!   - per proof: market_id (32 bytes, uint256) | inner public values
+//!     (65 bytes for sp1-evidence, 67 for sp1-ai-analysis)
+
+#![no_main]
+
+use sha2::{Digest, Sha256};
+
+sp1_zkvm::entrypoint!(main);
+
+pub fn main() {
+    println!("cycle-tracker-report-start: read_inputs");
+    let vkey: [u32; 8] = sp1_zkvm::io::read();
+    let market_ids: Vec<u64> = sp1_zkvm::io::read();
+    let public_values: Vec<Vec<u8>> = sp1_zkvm::io::read();
+    println!("cycle-tracker-report-end: read_inputs");
+    assert_eq!(market_ids.len(), public_values.len(), "one market id per proof");
+
+    // Every inner proof must share one length, so the verifier can index items
+    let item_length = public_values.first().map_or(0, Vec::len);
+    assert!(public_values.iter().all(|values| values.len() == item_length), "mixed public value lengths");
+
+    // Recursive verification: the proof of this program is only valid if
+    // every inner proof (vkey, public values) was valid
+    println!("cycle-tracker-report-start: verify_proofs");
+    for values in &public_values {
+        let digest: [u8; 32] = Sha256::digest(values).into();
+        sp1_zkvm::lib::verify::verify_sp1_proof(&vkey, &digest);
+    }
+    println!("cycle-tracker-report-end: verify_proofs");
+
+    println!("cycle-tracker-report-start: commit_outputs");
+    sp1_zkvm::io::commit_slice(&vkey_bytes(&vkey));
+    sp1_zkvm::io::commit_slice(&(market_ids.len() as u32).to_be_bytes());
+    for (market_id, values) in market_ids.iter().zip(&public_values) {
+        sp1_zkvm::io::commit_slice(&market_id_bytes(*market_id));
+        sp1_zkvm::io::commit_slice(values);
+    }
+    println!("cycle-tracker-report-end: commit_outputs");
+}
+
+/// Verification key digest as bytes32 (each word big-endian)
+fn vkey_bytes(vkey: &[u32; 8]) -> [u8; 32] {
+    let mut out = [0u8; 32];
+    for (i, word) in vkey.iter().enumerate() {
+        out[i * 4..i * 4 + 4].copy_from_slice(&word.to_be_bytes());
+    }
+    out
+}
+
+/// Market id as a big-endian uint256
+fn market_id_bytes(market_id: u64) -> [u8; 32] {
+    let mut out = [0u8; 32];
+    out[24..].copy_from_slice(&market_id.to_be_bytes());
+    out
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_vkey_bytes_big_endian_words() {
+        let bytes = vkey_bytes(&[1, 2, 3, 4, 5, 6, 7, 0x01020304]);
+        assert_eq!(&bytes[0..4], &[0, 0, 0, 1]);
+        assert_eq!(&bytes[28..32], &[1, 2, 3, 4]);
+    }
+
+    #[test]
+    fn test_market_id_is_uint256() {
+        let bytes = market_id_bytes(258);
+        assert_eq!(&bytes[..30], &[0u8; 30]);
+        assert_eq!(&bytes[30..], &[1, 2]);
+    }
+}
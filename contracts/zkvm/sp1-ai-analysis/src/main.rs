@@ -8,13 +8,18 @@
 //! Here we demonstrate the structure and commitment scheme.
 //!
 //! Private Inputs:
-//!   - evidence: The evidence content to analyze
+//!   - evidence: The evidence content to analyze (any bytes, e.g. a PDF)
 //!   - ai_model_output: The AI's analysis result
 //! 
 //! Public Outputs:
 //!   - outcome: Final Yes/No decision (0=No, 1=Yes)
 //!   - confidence: AI confidence score (0-10000 basis points)
 //!   - evidence_hash: Hash of evidence for verification
+//!
+//! Parsing mirrors SP1Prover._parse_ai_output in scripts/sp1_prover.py, which
+//! `sp1_prover.py execute` checks against the committed outputs. Cycle-tracker
+//! spans (read_inputs, parse_ai_output, compute_evidence_hash, commit_outputs)
+//! give the per-function breakdown reported by the executor.
 
 #![no_main]
 
@@ -30,28 +35,38 @@ struct AIAnalysisResult {
 
 pub fn main() {
     // Read private inputs
-    let evidence: String = sp1_zkvm::io::read();
-    let ai_model_output: String = sp1_zkvm::io::read();
+    println!("cycle-tracker-report-start: read_inputs");
+    let evidence = sp1_zkvm::io::read_vec();
+    let ai_model_output = String::from_utf8(sp1_zkvm::io::read_vec()).expect("AI output is not UTF-8");
+    println!("cycle-tracker-report-end: read_inputs");
     
     // In production: Run actual AI inference here
     // For demo: Parse the mock AI output
+    println!("cycle-tracker-report-start: parse_ai_output");
     let analysis = parse_ai_output(&ai_model_output);
+    println!("cycle-tracker-report-end: parse_ai_output");
     
     // Compute evidence hash (for linking to evidence program)
+    println!("cycle-tracker-report-start: compute_evidence_hash");
     let evidence_hash = compute_hash(&evidence);
+    println!("cycle-tracker-report-end: compute_evidence_hash");
     
-    // Commit public outputs
-    sp1_zkvm::io::commit(&analysis.outcome);
-    sp1_zkvm::io::commit(&analysis.confidence);
-    sp1_zkvm::io::commit(&evidence_hash);
-    sp1_zkvm::io::commit(&analysis.reasoning_hash);
+    // Commit public outputs as raw bytes in the layout
+    // SP1VerifierIntegration.parseAIAnalysisPublicValues reads:
+    // outcome (1) | confidence (2, big-endian) | evidence_hash (32) | reasoning_hash (32)
+    println!("cycle-tracker-report-start: commit_outputs");
+    sp1_zkvm::io::commit_slice(&[analysis.outcome]);
+    sp1_zkvm::io::commit_slice(&analysis.confidence.to_be_bytes());
+    sp1_zkvm::io::commit_slice(&evidence_hash);
+    sp1_zkvm::io::commit_slice(&analysis.reasoning_hash);
+    println!("cycle-tracker-report-end: commit_outputs");
 }
 
 /// Parse AI model output (mock implementation)
 /// In production, this would actually run AI inference
 fn parse_ai_output(output: &str) -> AIAnalysisResult {
-    // Simple mock parsing: look for "YES" or "NO" in output
-    let outcome = if output.to_uppercase().contains("YES") {
+    // Simple mock parsing: look for "YES" (ASCII, any case) in output
+    let outcome = if output.to_ascii_uppercase().contains("YES") {
         1u8
     } else {
         0u8
@@ -61,7 +76,7 @@ fn parse_ai_output(output: &str) -> AIAnalysisResult {
     let confidence = extract_confidence(output);
     
     // Hash the reasoning for verification
-    let reasoning_hash = compute_hash(output);
+    let reasoning_hash = compute_hash(output.as_bytes());
     
     AIAnalysisResult {
         outcome,
@@ -71,25 +86,49 @@ fn parse_ai_output(output: &str) -> AIAnalysisResult {
 }
 
 /// Extract confidence from AI output (mock)
+///
+/// Same grammar as CONFIDENCE_SEPARATORS / CONFIDENCE_NUMBER in
+/// scripts/sp1_prover.py: after "confidence:" (ASCII, any case), the first
+/// word containing '%' (words split on ASCII whitespace and commas) must be
+/// `[+-]?[0-9]+(\.[0-9]+)?%`. Anything else, e.g. "nan%", "inf%", "1e2%"
+/// or "1_0%", keeps the 50% default.
 fn extract_confidence(output: &str) -> u16 {
-    // Look for patterns like "confidence: 85%" or "85% confident"
-    // Return default if not found
-    if let Some(idx) = output.find("confidence:") {
-        let start = idx + "confidence:".len();
-        if let Some(end) = output[start..].find('%') {
-            if let Ok(val) = output[start..start+end].trim().parse::<u16>() {
-                return val * 100; // Convert percentage to basis points
+    // to_ascii_uppercase keeps byte offsets, so idx is valid in output
+    if let Some(idx) = output.to_ascii_uppercase().find("CONFIDENCE:") {
+        let rest = &output[idx + "CONFIDENCE:".len()..];
+        let words = rest.split(|c| matches!(c, ' ' | '\t' | '\n' | '\r' | '\x0c' | ','));
+        for word in words {
+            if word.contains('%') {
+                return match parse_decimal(&word.replace('%', "")) {
+                    // Convert percentage to basis points (clamp, then truncate)
+                    Some(pct) => (pct * 100.0).clamp(0.0, 10000.0) as u16,
+                    None => 5000,
+                };
             }
         }
     }
     5000 // Default 50% confidence
 }
 
+/// `[+-]?[0-9]+(\.[0-9]+)?` as a finite f64, else None
+fn parse_decimal(number: &str) -> Option<f64> {
+    let unsigned = number.strip_prefix(['+', '-']).unwrap_or(number);
+    let (int, frac) = match unsigned.split_once('.') {
+        Some((int, frac)) => (int, Some(frac)),
+        None => (unsigned, None),
+    };
+    let is_digits = |part: &str| !part.is_empty() && part.bytes().all(|b| b.is_ascii_digit());
+    if !is_digits(int) || !frac.map_or(true, is_digits) {
+        return None;
+    }
+    number.parse::<f64>().ok().filter(|pct| pct.is_finite())
+}
+
 /// Simple hash function (placeholder for actual hash)
-fn compute_hash(data: &str) -> [u8; 32] {
+fn compute_hash(data: &[u8]) -> [u8; 32] {
     use sha2::{Digest, Sha256};
     let mut hasher = Sha256::new();
-    hasher.update(data.as_bytes());
+    hasher.update(data);
     hasher.finalize().into()
 }
 
@@ -113,9 +152,33 @@ mod tests {
         assert_eq!(result.confidence, 7000);
     }
 
+    #[test]
+    fn test_confidence_fraction_and_default() {
+        assert_eq!(extract_confidence("YES. confidence: 72.5%"), 7250);
+        assert_eq!(extract_confidence("YES. Confidence: 150%"), 10000);
+        assert_eq!(extract_confidence("YES, no confidence given"), 5000);
+    }
+
+    #[test]
+    fn test_confidence_strict_grammar() {
+        assert_eq!(extract_confidence("Confidence: -5%"), 0);
+        assert_eq!(extract_confidence("Confidence: +42.5%"), 4250);
+        for output in [
+            "Confidence: nan%",
+            "Confidence: inf%",
+            "Confidence: 1e2%",
+            "Confidence: 1_0%",
+            "Confidence: \u{ff18}\u{ff15}%",
+            "Confidence: .5%",
+            "Confidence: 5.%",
+        ] {
+            assert_eq!(extract_confidence(output), 5000, "{output}");
+        }
+    }
+
     #[test]
     fn test_hash_deterministic() {
-        let data = "Test evidence";
+        let data = b"Test evidence";
         let h1 = compute_hash(data);
         let h2 = compute_hash(data);
         assert_eq!(h1, h2);
@@ -4,12 +4,15 @@
 //! without revealing the actual content on-chain.
 //! 
 //! Inputs (private):
-//!   - evidence_content: The actual evidence text/data
+//!   - evidence_content: The actual evidence, any bytes (text, PDF, ...)
 //!   - salt: Random salt for commitment
 //! 
 //! Outputs (public):
 //!   - evidence_hash: Poseidon/hash of evidence content
 //!   - commitment: Hash of (evidence_hash + salt)
+//!
+//! Cycle-tracker spans (read_inputs, compute_evidence_hash, compute_commitment,
+//! commit_outputs) give the per-function breakdown reported by the executor.
 
 #![no_main]
 
@@ -24,33 +27,43 @@ sp1_zkvm::entrypoint!(main);
 /// Commits public outputs to the blockchain
 pub fn main() {
     // Read private inputs from the prover
-    let evidence_content: String = sp1_zkvm::io::read();
-    let salt: String = sp1_zkvm::io::read();
+    println!("cycle-tracker-report-start: read_inputs");
+    let evidence_content = sp1_zkvm::io::read_vec();
+    let salt = sp1_zkvm::io::read_vec();
+    println!("cycle-tracker-report-end: read_inputs");
     
     // Compute evidence hash (public output)
+    println!("cycle-tracker-report-start: compute_evidence_hash");
     let evidence_hash = compute_evidence_hash(&evidence_content);
+    println!("cycle-tracker-report-end: compute_evidence_hash");
     
     // Compute commitment (public output)
     // This allows the judge to commit to evidence without revealing it
+    println!("cycle-tracker-report-start: compute_commitment");
     let commitment = compute_commitment(&evidence_hash, &salt);
+    println!("cycle-tracker-report-end: compute_commitment");
     
     // Commit public values to the blockchain
-    // These can be verified without knowing the actual evidence content
-    sp1_zkvm::io::commit(&evidence_hash);
-    sp1_zkvm::io::commit(&commitment);
+    // These can be verified without knowing the actual evidence content.
+    // Raw bytes in the layout SP1VerifierIntegration.parseEvidencePublicValues reads:
+    // evidence_hash (32) | commitment (32) | valid_length (1)
+    println!("cycle-tracker-report-start: commit_outputs");
+    sp1_zkvm::io::commit_slice(&evidence_hash);
+    sp1_zkvm::io::commit_slice(&commitment);
     
     // Also commit a boolean indicating the evidence length is reasonable
     // This prevents spam with extremely large evidence
     let valid_length = evidence_content.len() <= 10000; // Max 10KB
-    sp1_zkvm::io::commit(&valid_length);
+    sp1_zkvm::io::commit_slice(&[valid_length as u8]);
+    println!("cycle-tracker-report-end: commit_outputs");
 }
 
 /// Compute SHA-256 hash of evidence content
 /// 
 /// This is deterministic and can be verified off-chain
-fn compute_evidence_hash(content: &str) -> [u8; 32] {
+fn compute_evidence_hash(content: &[u8]) -> [u8; 32] {
     let mut hasher = Sha256::new();
-    hasher.update(content.as_bytes());
+    hasher.update(content);
     hasher.finalize().into()
 }
 
@@ -60,10 +73,10 @@ fn compute_evidence_hash(content: &str) -> [u8; 32] {
 /// 1. Judge commits to evidence_hash + salt
 /// 2. Later reveals evidence_hash (and optionally salt)
 /// 3. Anyone can verify the commitment matches
-fn compute_commitment(evidence_hash: &[u8; 32], salt: &str) -> [u8; 32] {
+fn compute_commitment(evidence_hash: &[u8; 32], salt: &[u8]) -> [u8; 32] {
     let mut hasher = Sha256::new();
     hasher.update(evidence_hash);
-    hasher.update(salt.as_bytes());
+    hasher.update(salt);
     hasher.finalize().into()
 }
 
@@ -73,7 +86,7 @@ mod tests {
 
     #[test]
     fn test_evidence_hash_deterministic() {
-        let content = "Evidence: ETH price was $3500 at 12:00 UTC";
+        let content = b"Evidence: ETH price was $3500 at 12:00 UTC";
         let hash1 = compute_evidence_hash(content);
         let hash2 = compute_evidence_hash(content);
         assert_eq!(hash1, hash2);
@@ -81,16 +94,16 @@ mod tests {
 
     #[test]
     fn test_commitment_unique_per_salt() {
-        let evidence_hash = compute_evidence_hash("test evidence");
-        let commitment1 = compute_commitment(&evidence_hash, "salt1");
-        let commitment2 = compute_commitment(&evidence_hash, "salt2");
+        let evidence_hash = compute_evidence_hash(b"test evidence");
+        let commitment1 = compute_commitment(&evidence_hash, b"salt1");
+        let commitment2 = compute_commitment(&evidence_hash, b"salt2");
         assert_ne!(commitment1, commitment2);
     }
 
     #[test]
     fn test_commitment_verification() {
-        let content = "Test evidence content";
-        let salt = "my_secret_salt_123";
+        let content = b"Test evidence content";
+        let salt = b"my_secret_salt_123";
         
         let evidence_hash = compute_evidence_hash(content);
         let commitment = compute_commitment(&evidence_hash, salt);
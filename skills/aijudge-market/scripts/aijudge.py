@@ -0,0 +1,580 @@
+#!/usr/bin/env python3
+"""
+AIJudgeMarket CLI
+Single entry point for all market / judge / voting operations.
+
+One-shot commands work like the individual scripts. `shell` keeps one warm
+client (connection pool, chain ID, live config cache) for a whole sequence of
+commands, and `serve` exposes the same session over a Unix socket so that
+short-lived agent invocations can reuse it with `--daemon`.
+
+Usage:
+    python3 aijudge.py courts
+    python3 aijudge.py market --market-id 0
+    python3 aijudge.py register --stake 1000 --approve --wait
+    python3 aijudge.py commit --market-id 0 --outcome yes --wait
+
+    # Interactive / scripted session (one line per command)
+    python3 aijudge.py --rpc-url https://sepolia.base.org shell
+    aijudge> join-court --court-id 6 --wait
+    aijudge> commit --market-id 3 --outcome no
+
+    # Daemon: start once, then forward commands to it
+    python3 aijudge.py serve --socket /tmp/aijudge.sock &
+    python3 aijudge.py --daemon /tmp/aijudge.sock judge
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import secrets
+import shlex
+import socket
+import socketserver
+import sys
+import threading
+from typing import Dict, List, Optional, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from aijudge_client import AIJudgeClient, compute_commit_hash
+
+DEFAULT_RPC_URL = "https://sepolia.base.org"
+# Caller environment forwarded with --daemon requests, resolved per request
+FORWARDED_ENV = ("PRIVATE_KEY", "RPC_URL", "CONTRACT_ADDRESS")
+OUTCOMES = {"yes": 1, "no": 2, "1": 1, "2": 2}
+
+
+class CommandError(Exception):
+    """Invalid command line or a failed precondition"""
+
+
+class _ArgumentParser(argparse.ArgumentParser):
+    """ArgumentParser that raises instead of exiting, so a bad line never kills the session"""
+
+    def error(self, message):
+        raise CommandError(f"{self.prog}: {message}")
+
+
+# ==================== SESSION ====================
+
+class Session:
+    """
+    Long-lived state shared by every command: one AIJudgeClient per
+    (key, RPC, contract) so the HTTP pool and chain lookup are reused.
+    """
+
+    def __init__(self, defaults: Optional[argparse.Namespace] = None):
+        self.defaults = defaults or argparse.Namespace(private_key=None, rpc_url=None, contract=None)
+        self._clients: Dict[Tuple[str, str, str, bool], AIJudgeClient] = {}
+        self._rosters: Dict[int, object] = {}
+        self._lock = threading.Lock()
+
+    def _resolve(self, args: argparse.Namespace, name: str, env: Optional[str] = None) -> Optional[str]:
+        """
+        Command line, then the caller's environment for forwarded requests,
+        then the session's defaults and environment
+        """
+        request_env = getattr(args, "request_env", None) or {}
+        return (getattr(args, name, None) or (request_env.get(env) if env else None)
+                or getattr(self.defaults, name, None) or (os.environ.get(env) if env else None))
+
+    def client(self, args: argparse.Namespace, write: bool = False) -> AIJudgeClient:
+        private_key = self._resolve(args, "private_key", "PRIVATE_KEY")
+        if not private_key:
+            if write:
+                raise CommandError("Private key required (--private-key or PRIVATE_KEY)")
+            private_key = AIJudgeClient.READ_ONLY_KEY
+        rpc_url = self._resolve(args, "rpc_url", "RPC_URL") or DEFAULT_RPC_URL
+        contract = self._resolve(args, "contract", "CONTRACT_ADDRESS") or AIJudgeClient.DEFAULT_CONTRACT_ADDRESS
+
+        simulate = bool(getattr(args, "simulate", False) or getattr(self.defaults, "simulate", False))
+
+        key = (private_key, rpc_url, contract, simulate)
+        with self._lock:
+            if key not in self._clients:
+                client = AIJudgeClient(
+                    private_key=private_key,
+                    rpc_url=rpc_url,
+                    contract_address=contract,
+                    simulate=simulate
+                )
+                _cache_chain_id(client.w3.provider)
+                self._clients[key] = client
+            return self._clients[key]
+
+    def roster(self, args: argparse.Namespace):
+        """CourtRoster for this client, kept across commands and synced incrementally"""
+        from court_roster import CourtRoster
+
+        client = self.client(args)
+        with self._lock:
+            roster = self._rosters.get(id(client))
+            if roster is None:
+                roster = self._rosters[id(client)] = CourtRoster(
+                    client, from_block=args.from_block, state_path=args.state
+                )
+        roster.sync()
+        return roster
+
+
+def _cache_chain_id(provider):
+    """
+    web3 asks for eth_chainId before every call and transaction; the chain
+    never changes under a session, so let the HTTP providers cache it.
+    """
+    nested = getattr(provider, "providers", None) or [getattr(provider, "provider", None)]
+    for inner in nested:
+        if inner is not None:
+            _cache_chain_id(inner)
+    if hasattr(provider, "cache_allowed_requests"):
+        provider.cache_allowed_requests = True
+        provider.cacheable_requests = {"eth_chainId", "net_version"}
+
+
+# ==================== COMMANDS ====================
+
+def _outcome(value: str) -> int:
+    if value.lower() not in OUTCOMES:
+        raise CommandError(f"Invalid outcome '{value}' (use yes/no)")
+    return OUTCOMES[value.lower()]
+
+
+def _salt(value: str) -> str:
+    hex_part = value[2:] if value.startswith("0x") else value
+    if len(hex_part) != 64:
+        raise CommandError("Salt must be a 32-byte hex string")
+    try:
+        bytes.fromhex(hex_part)
+    except ValueError:
+        raise CommandError("Salt must be a 32-byte hex string")
+    return "0x" + hex_part
+
+
+def _tx(client, args, tx_hash: str) -> Dict:
+    result = {"tx_hash": tx_hash}
+    if getattr(args, "wait", False):
+        receipt = client.wait_for_transaction(tx_hash)
+        result["block_number"] = receipt["blockNumber"]
+        result["status"] = receipt["status"]
+    return result
+
+
+def cmd_courts(session, args):
+    return [{"id": i, "name": n} for i, n in AIJudgeClient.COURT_NAMES.items()]
+
+
+def cmd_commit_hash(session, args):
+    salt = _salt(args.salt)
+    return {"commit_hash": compute_commit_hash(_outcome(args.outcome), salt), "salt": salt}
+
+
+def cmd_market(session, args):
+    client = session.client(args)
+    market = client.get_market(args.market_id)
+    market["market_id"] = args.market_id
+    if args.selected_judges:
+        market["selected_judges"] = client.get_selected_judges(args.market_id)
+    return market
+
+
+def cmd_markets(session, args):
+    ids = [int(i) for i in args.market_ids.split(",")] if args.market_ids else None
+    return session.client(args).get_markets(ids)
+
+
+def cmd_judge(session, args):
+    client = session.client(args)
+    return client.get_judge(args.address or client.address)
+
+
+def cmd_vote(session, args):
+    client = session.client(args)
+    return client.get_vote(args.market_id, args.judge)
+
+
+def cmd_roster(session, args):
+    roster = session.roster(args)
+    if args.court_id is not None:
+        return roster.members(args.court_id, args.include_suspended)
+    return roster.court_stats()
+
+
+def cmd_config(session, args):
+    return session.client(args).get_config()
+
+
+def cmd_create_market(session, args):
+    if not 0 <= args.court_id <= 7:
+        raise CommandError("court-id must be between 0 and 7")
+    client = session.client(args, write=True)
+    return _tx(client, args, client.create_market(
+        question=args.question,
+        resolution_time=args.resolution_time,
+        required_judges=args.required_judges,
+        court_id=args.court_id
+    ))
+
+
+def cmd_select_judges(session, args):
+    client = session.client(args, write=True)
+    return _tx(client, args, client.select_judges(args.market_id))
+
+
+def cmd_finalize(session, args):
+    client = session.client(args, write=True)
+    return _tx(client, args, client.finalize_resolution(args.market_id))
+
+
+def cmd_approve(session, args):
+    client = session.client(args, write=True)
+    return _tx(client, args, client.approve_usdc(args.amount * 10**6))
+
+
+def cmd_register(session, args):
+    client = session.client(args, write=True)
+    result = {}
+    if args.approve:
+        # The approval must be mined before registering pulls the stake
+        result["approve"] = _tx(client, argparse.Namespace(wait=True), client.approve_usdc(args.stake * 10**6))
+    result.update(_tx(client, args, client.register_judge(args.stake)))
+    return result
+
+
+def cmd_deregister(session, args):
+    client = session.client(args, write=True)
+    return _tx(client, args, client.deregister_judge())
+
+
+def cmd_join_court(session, args):
+    client = session.client(args, write=True)
+    return _tx(client, args, client.join_court(args.court_id))
+
+
+def cmd_leave_court(session, args):
+    client = session.client(args, write=True)
+    return _tx(client, args, client.leave_court(args.court_id))
+
+
+def cmd_commit(session, args):
+    client = session.client(args, write=True)
+    salt = _salt(args.salt) if args.salt else "0x" + secrets.token_hex(32)
+    outcome = _outcome(args.outcome)
+    result = _tx(client, args, client.commit_vote(args.market_id, outcome, salt))
+    # The salt is needed to reveal; always hand it back
+    result.update({"market_id": args.market_id, "outcome": outcome, "salt": salt})
+    return result
+
+
+def cmd_reveal(session, args):
+    client = session.client(args, write=True)
+    return _tx(client, args, client.reveal_vote(
+        market_id=args.market_id,
+        outcome=_outcome(args.outcome),
+        salt=_salt(args.salt),
+        evidence_hash=args.evidence_hash,
+        rationale_hash=args.rationale_hash
+    ))
+
+
+def cmd_challenge(session, args):
+    client = session.client(args, write=True)
+    return _tx(client, args, client.challenge_resolution(args.market_id, _outcome(args.claimed_outcome)))
+
+
+# ==================== PARSER ====================
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = _ArgumentParser(prog="aijudge", description="AIJudgeMarket command line")
+    parser.add_argument("--private-key", help="Private key (or set PRIVATE_KEY env var)")
+    parser.add_argument("--rpc-url", help=f"RPC endpoint(s), comma-separated (default: {DEFAULT_RPC_URL})")
+    parser.add_argument("--contract", help="Contract address (default: CONTRACT_ADDRESS or CREATE3 address)")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    parser.add_argument("--simulate", action="store_true",
+                        help="Dry-run transactions with eth_call first; don't broadcast if they would revert")
+    parser.add_argument("--daemon", metavar="SOCKET", default=os.environ.get("AIJUDGE_SOCKET"),
+                        help="Forward the command to a running 'serve' session (or set AIJUDGE_SOCKET)")
+    sub = parser.add_subparsers(dest="command", metavar="command", parser_class=_ArgumentParser)
+
+    # Connection options may also follow the subcommand; SUPPRESS keeps
+    # the top-level values when they are not repeated there
+    common = _ArgumentParser(add_help=False)
+    common.add_argument("--private-key", default=argparse.SUPPRESS, help=argparse.SUPPRESS)
+    common.add_argument("--rpc-url", default=argparse.SUPPRESS, help=argparse.SUPPRESS)
+    common.add_argument("--contract", default=argparse.SUPPRESS, help=argparse.SUPPRESS)
+    common.add_argument("--json", action="store_true", default=argparse.SUPPRESS, help=argparse.SUPPRESS)
+    common.add_argument("--simulate", action="store_true", default=argparse.SUPPRESS, help=argparse.SUPPRESS)
+
+    def add(name, func, help_text, wait=False):
+        p = sub.add_parser(name, help=help_text, description=help_text, parents=[common])
+        p.set_defaults(func=func)
+        if wait:
+            p.add_argument("--wait", action="store_true", help="Wait for confirmation")
+        return p
+
+    add("courts", cmd_courts, "List sub-courts (offline)")
+
+    p = add("commit-hash", cmd_commit_hash, "Compute a commit hash (offline)")
+    p.add_argument("--outcome", required=True, help="yes/no")
+    p.add_argument("--salt", required=True, help="bytes32 hex salt")
+
+    p = add("market", cmd_market, "Get market details")
+    p.add_argument("--market-id", type=int, required=True)
+    p.add_argument("--selected-judges", action="store_true", help="Also list selected judges")
+
+    p = add("markets", cmd_markets, "Get several markets (default: all)")
+    p.add_argument("--market-ids", help="Comma-separated market IDs")
+
+    p = add("judge", cmd_judge, "Get judge details")
+    p.add_argument("--address", help="Judge address (default: your address)")
+
+    p = add("vote", cmd_vote, "Get a judge's vote on a market")
+    p.add_argument("--market-id", type=int, required=True)
+    p.add_argument("--judge", help="Judge address (default: your address)")
+
+    p = add("roster", cmd_roster, "Court membership from contract events (synced incrementally)")
+    p.add_argument("--court-id", type=int, help="Members of one court (default: per-court summary)")
+    p.add_argument("--include-suspended", action="store_true")
+    p.add_argument("--from-block", type=int, default=0, help="First block to scan on first use")
+    p.add_argument("--state", help="JSON file to resume from / save to")
+
+    add("config", cmd_config, "Get protocol parameters")
+
+    p = add("create-market", cmd_create_market, "Create a prediction market", wait=True)
+    p.add_argument("--question", required=True)
+    p.add_argument("--resolution-time", type=int, required=True, help="Unix timestamp")
+    p.add_argument("--required-judges", type=int, default=3)
+    p.add_argument("--court-id", type=int, default=0)
+
+    p = add("select-judges", cmd_select_judges, "Select judges for a market (MANAGER_ROLE)", wait=True)
+    p.add_argument("--market-id", type=int, required=True)
+
+    p = add("finalize", cmd_finalize, "Finalize a resolution after the challenge window", wait=True)
+    p.add_argument("--market-id", type=int, required=True)
+
+    p = add("approve", cmd_approve, "Approve USDC spending by the contract", wait=True)
+    p.add_argument("--amount", type=int, required=True, help="USDC amount")
+
+    p = add("register", cmd_register, "Register as a judge", wait=True)
+    p.add_argument("--stake", type=int, required=True, help="USDC stake")
+    p.add_argument("--approve", action="store_true", help="Approve the stake first")
+
+    add("deregister", cmd_deregister, "Deregister and withdraw stake", wait=True)
+
+    for name, func in (("join-court", cmd_join_court), ("leave-court", cmd_leave_court)):
+        p = add(name, func, f"{name.split('-')[0].capitalize()} a sub-court", wait=True)
+        p.add_argument("--court-id", type=int, required=True)
+
+    p = add("commit", cmd_commit, "Commit a vote", wait=True)
+    p.add_argument("--market-id", type=int, required=True)
+    p.add_argument("--outcome", required=True, help="yes/no")
+    p.add_argument("--salt", help="bytes32 hex salt (default: random, printed)")
+
+    p = add("reveal", cmd_reveal, "Reveal a committed vote", wait=True)
+    p.add_argument("--market-id", type=int, required=True)
+    p.add_argument("--outcome", required=True, help="yes/no")
+    p.add_argument("--salt", required=True, help="Salt used for the commit")
+    p.add_argument("--evidence-hash", default="0x" + "0" * 64)
+    p.add_argument("--rationale-hash", default="0x" + "0" * 64)
+
+    p = add("challenge", cmd_challenge, "Challenge a resolution", wait=True)
+    p.add_argument("--market-id", type=int, required=True)
+    p.add_argument("--claimed-outcome", required=True, help="yes/no")
+
+    add("shell", None, "Run commands interactively (or from stdin) with one warm session")
+
+    p = add("serve", None, "Serve a warm session on a Unix socket")
+    p.add_argument("--socket", required=True, help="Socket path")
+
+    return parser
+
+
+# ==================== EXECUTION ====================
+
+def _default(o):
+    if isinstance(o, (bytes, bytearray)):
+        return "0x" + bytes(o).hex()
+    return str(o)
+
+
+def print_result(result, as_json: bool):
+    if as_json:
+        print(json.dumps(result, default=_default))
+        return
+    rows = result if isinstance(result, list) else [result]
+    for row in rows:
+        if isinstance(row, dict):
+            if "tx_hash" in row:
+                print(f"✅ Transaction: {row['tx_hash']}")
+            for key, value in row.items():
+                if key != "tx_hash":
+                    print(f"{key}: {_default(value) if isinstance(value, (bytes, bytearray)) else value}")
+        else:
+            print(row)
+        if len(rows) > 1:
+            print("-" * 50)
+
+
+def run(
+    session: Session,
+    argv: List[str],
+    parser: Optional[argparse.ArgumentParser] = None,
+    env: Optional[Dict[str, str]] = None
+) -> int:
+    """
+    Execute one command line in the session; returns an exit code. env is
+    the caller's PRIVATE_KEY / RPC_URL / CONTRACT_ADDRESS for forwarded
+    requests.
+    """
+    parser = parser or build_parser()
+    try:
+        args = parser.parse_args(argv)
+        args.request_env = env
+        if args.command in ("shell", "serve"):
+            raise CommandError(f"'{args.command}' cannot be run inside a session")
+        if getattr(args, "func", None) is None:
+            parser.print_help()
+            return 0
+        print_result(args.func(session, args), args.json)
+        return 0
+    except SystemExit as e:
+        # --help
+        return e.code if isinstance(e.code, int) else 0
+    except CommandError as e:
+        print(f"❌ Error: {e}")
+        return 2
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        return 1
+
+
+def shell(session: Session):
+    """Read-eval-print loop; also works with commands piped on stdin"""
+    parser = build_parser()
+    interactive = sys.stdin.isatty()
+    status = 0
+    while True:
+        try:
+            line = input("aijudge> " if interactive else "")
+        except EOFError:
+            break
+        except KeyboardInterrupt:
+            print()
+            continue
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        if line in ("exit", "quit"):
+            break
+        try:
+            argv = shlex.split(line)
+        except ValueError as e:
+            print(f"❌ Error: {e}")
+            continue
+        status = run(session, argv, parser)
+    return status
+
+
+class _SessionHandler(socketserver.StreamRequestHandler):
+    """
+    One JSON request {"argv": [...], "env": {...}} per line, answered with
+    {"exit_code", "output"}
+    """
+
+    def handle(self):
+        for line in self.rfile:
+            try:
+                request = json.loads(line)
+                argv = request["argv"]
+                env = {k: v for k, v in (request.get("env") or {}).items() if k in FORWARDED_ENV}
+            except (ValueError, KeyError, TypeError, AttributeError):
+                break
+            output = io.StringIO()
+            # Commands run one at a time: stdout is redirected per command and
+            # transactions from the same key must not race for nonces
+            with self.server.lock, contextlib.redirect_stdout(output):
+                code = run(self.server.session, argv, self.server.parser, env)
+            self.wfile.write((json.dumps({"exit_code": code, "output": output.getvalue()}) + "\n").encode())
+            self.wfile.flush()
+
+
+class SessionServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path: str, session: Session):
+        if os.path.exists(path):
+            os.unlink(path)
+        super().__init__(path, _SessionHandler)
+        os.chmod(path, 0o600)
+        self.session = session
+        self.parser = build_parser()
+        self.lock = threading.Lock()
+
+
+def forward(path: str, argv: List[str]) -> Optional[int]:
+    """
+    Run argv on a serving session, with this process's key, RPC and
+    contract; None if the daemon is not reachable
+    """
+    env = {name: os.environ[name] for name in FORWARDED_ENV if os.environ.get(name)}
+    try:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.connect(path)
+    except OSError:
+        return None
+    with sock, sock.makefile("rwb") as stream:
+        stream.write((json.dumps({"argv": argv, "env": env}) + "\n").encode())
+        stream.flush()
+        reply = json.loads(stream.readline())
+    sys.stdout.write(reply["output"])
+    return reply["exit_code"]
+
+
+def _strip_daemon(argv: List[str]) -> List[str]:
+    out, skip = [], False
+    for arg in argv:
+        if skip:
+            skip = False
+        elif arg == "--daemon":
+            skip = True
+        elif not arg.startswith("--daemon="):
+            out.append(arg)
+    return out
+
+
+def main(argv: Optional[List[str]] = None):
+    argv = sys.argv[1:] if argv is None else argv
+    parser = build_parser()
+    try:
+        args = parser.parse_args(argv)
+    except CommandError as e:
+        print(f"❌ Error: {e}")
+        sys.exit(2)
+
+    if args.command == "shell":
+        sys.exit(shell(Session(args)))
+
+    if args.command == "serve":
+        server = SessionServer(args.socket, Session(args))
+        print(f"🎯 Serving aijudge session on {args.socket}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+            os.unlink(args.socket)
+        return
+
+    if args.daemon:
+        code = forward(args.daemon, _strip_daemon(argv))
+        if code is not None:
+            sys.exit(code)
+        print(f"⚠️  Daemon not reachable at {args.daemon}, running locally", file=sys.stderr)
+
+    sys.exit(run(Session(), argv, parser))
+
+
+if __name__ == "__main__":
+    main()
@@ -2,16 +2,47 @@
 """
 AIJudgeMarket Python Client
 Core client library for interacting with AIJudgeMarket smart contracts.
+
+web3 / eth_account (and the provider modules built on them) are imported
+only when a client is constructed, so offline use - court names, commit
+hashes, --help of the scripts - starts without paying for them.
 """
 
 import os
 import json
-import urllib.request
-from typing import Optional, Dict, List, Any
+from contextlib import nullcontext
+from typing import TYPE_CHECKING, Optional, Dict, List, Any, Sequence, Union
 from dataclasses import dataclass
-from web3 import Web3
-from eth_account import Account
-from eth_abi import encode
+
+from skill_config import SKILL_CONFIG_URL, SkillConfig, get_cache, parse_skill_config
+
+if TYPE_CHECKING:
+    from gas_profiler import GasProfiler
+    from instrumentation import Instrumentation
+    from rate_limiter import RateLimit
+
+
+def keccak256(data: bytes) -> bytes:
+    """keccak256 via eth_hash (a fraction of the cost of importing web3)"""
+    from eth_hash.auto import keccak
+    return keccak(data)
+
+
+def compute_commit_hash(outcome: int, salt: str) -> str:
+    """
+    Commit hash for a vote, keccak256(abi.encodePacked(uint8 outcome, bytes32 salt)).
+    Works offline; see AIJudgeClient.compute_commit_hash.
+
+    Args:
+        outcome: 1 for Yes, 2 for No (enum Outcome values)
+        salt: bytes32 hex string (with or without 0x prefix)
+
+    Returns:
+        bytes32 commit hash as 0x-prefixed hex string
+    """
+    salt_bytes = bytes.fromhex(salt.replace('0x', ''))
+    return "0x" + keccak256(bytes([outcome]) + salt_bytes).hex()
+
 
 @dataclass
 class Market:
@@ -60,8 +91,11 @@ class AIJudgeClient:
     # Default contract address (same on all chains via CREATE3)
     DEFAULT_CONTRACT_ADDRESS = "0xF7b9e8C9675d0Dbdb280A117fDf5E39fc6fb9E04"
 
+    # Placeholder key for read-only use (the all-zero key is rejected by eth-account)
+    READ_ONLY_KEY = "0x" + "00" * 31 + "01"
+
     # Live skill config URL (fetch for latest addresses and parameters)
-    SKILL_CONFIG_URL = "https://departmentofpredictions.com/skill.md"
+    SKILL_CONFIG_URL = SKILL_CONFIG_URL
 
     # Default USDC addresses per chain
     USDC_ADDRESSES = {
@@ -69,24 +103,63 @@ class AIJudgeClient:
         "base-sepolia": "0x036CbD53842c5426634e7929541eC2318f3dCF7e",
         "arc-testnet": "0x2Ed9F0618e1E40A400DdB2D96C7a2834A3A1f964"
     }
+
+    # Chain IDs and public RPC endpoints per chain
+    CHAIN_IDS = {
+        "eth-sepolia": 11155111,
+        "base-sepolia": 84532,
+        "arc-testnet": 5042002
+    }
+    RPC_URLS = {
+        "eth-sepolia": "https://sepolia.gateway.tenderly.co",
+        "base-sepolia": "https://sepolia.base.org",
+        "arc-testnet": "https://rpc.testnet.arc.network"
+    }
     
     def __init__(
         self,
         private_key: str,
-        rpc_url: str,
+        rpc_url: Union[str, Sequence[str]],
         contract_address: str,
-        usdc_address: Optional[str] = None
+        usdc_address: Optional[str] = None,
+        instrumentation: Optional['Instrumentation'] = None,
+        rate_limit: Optional[Union['RateLimit', Dict[str, 'RateLimit']]] = None,
+        simulate: bool = False,
+        gas_profiler: Optional['GasProfiler'] = None
     ):
         """
         Initialize AIJudgeMarket client
         
         Args:
             private_key: Ethereum private key (with 0x prefix)
-            rpc_url: JSON-RPC endpoint
+            rpc_url: JSON-RPC endpoint, or a list (or comma-separated string) of
+                endpoints. With several endpoints reads are routed to the fastest
+                healthy one and hedged; writes always use the first.
             contract_address: AIJudgeMarket proxy contract address
             usdc_address: Optional USDC address (auto-detected from chain)
+            instrumentation: Optional collector for per-RPC-method, per-contract-function
+                and encode/sign timings (see instrumentation.py)
+            rate_limit: Optional per-endpoint request/compute-unit budget, either one
+                RateLimit for every endpoint or a dict keyed by URL (see rate_limiter.py)
+            simulate: Dry-run every transaction with eth_call against the pending
+                block first and raise TransactionWouldRevert (naming the custom
+                error) instead of broadcasting a transaction bound to fail
+            gas_profiler: Optional collector fed with gas used, effective gas price
+                and calldata size of every receipt passed through
+                wait_for_transaction (see gas_profiler.py)
         """
-        self.w3 = Web3(Web3.HTTPProvider(rpc_url))
+        from web3 import Web3
+        from eth_account import Account
+
+        self.instrumentation = instrumentation
+        self.rate_limit = rate_limit
+        self.simulate = simulate
+        self.gas_profiler = gas_profiler
+        # Sent tx hash -> (function, tags, calldata), consumed by wait_for_transaction
+        self._profiled_txs: Dict[str, tuple] = {}
+        self._event_topics: Optional[Dict[str, str]] = None
+        self._chain_id: Optional[int] = None
+        self.w3 = Web3(self._build_provider(rpc_url))
         self.account = Account.from_key(private_key)
         self.address = self.account.address
         
@@ -106,14 +179,10 @@ class AIJudgeClient:
         else:
             # Auto-detect from chain ID
             chain_id = self.w3.eth.chain_id
-            if chain_id == 11155111:  # Ethereum Sepolia
-                self.usdc_address = self.USDC_ADDRESSES["eth-sepolia"]
-            elif chain_id == 84532:  # Base Sepolia
-                self.usdc_address = self.USDC_ADDRESSES["base-sepolia"]
-            elif chain_id == 5042002:  # ARC Testnet
-                self.usdc_address = self.USDC_ADDRESSES["arc-testnet"]
-            else:
+            chain = next((name for name, cid in self.CHAIN_IDS.items() if cid == chain_id), None)
+            if chain is None:
                 raise ValueError(f"Unknown chain ID: {chain_id}. Please specify USDC address.")
+            self.usdc_address = self.USDC_ADDRESSES[chain]
         
         # Minimal ERC20 ABI for USDC
         usdc_abi = [
@@ -123,42 +192,246 @@ class AIJudgeClient:
         ]
         self.usdc = self.w3.eth.contract(address=self.usdc_address, abi=usdc_abi)
     
+    def _build_provider(self, rpc_url: Union[str, Sequence[str]]):
+        """Single HTTP provider, or a RoutingProvider for several endpoints"""
+        from rpc_router import RoutingProvider
+
+        if isinstance(rpc_url, str):
+            rpc_url = [u.strip() for u in rpc_url.split(',') if u.strip()]
+        rpc_urls = list(rpc_url)
+        providers = [self._build_endpoint_provider(u, routed=len(rpc_urls) > 1) for u in rpc_urls]
+
+        if len(rpc_urls) == 1:
+            return providers[0]
+        return RoutingProvider(rpc_urls, providers=providers)
+
+    def _build_endpoint_provider(self, url: str, routed: bool):
+        """HTTP provider for one endpoint, with optional instrumentation and rate limiting"""
+        from web3 import Web3
+        from instrumentation import InstrumentedHTTPProvider
+        from rate_limiter import RateLimitedProvider
+        from rpc_router import make_http_provider
+
+        limit = self.rate_limit.get(url) if isinstance(self.rate_limit, dict) else self.rate_limit
+
+        if not routed and limit is None:
+            # Plain single endpoint: keep web3's own retry behaviour
+            if self.instrumentation is not None:
+                return InstrumentedHTTPProvider(url, self.instrumentation)
+            return Web3.HTTPProvider(url)
+
+        if self.instrumentation is not None:
+            provider = make_http_provider(url, InstrumentedHTTPProvider, instrumentation=self.instrumentation)
+        else:
+            provider = make_http_provider(url)
+        if limit is not None:
+            provider = RateLimitedProvider(provider, limit)
+        return provider
+
+    def priority(self, level: int):
+        """
+        Context manager setting the scheduling priority of enclosed RPC requests
+        (only has an effect with rate_limit). Use Priority.CRITICAL for reveal-window
+        reads and Priority.BULK for scans.
+        """
+        from rate_limiter import request_priority
+        return request_priority(level)
+
     @staticmethod
-    def fetch_live_config(url: Optional[str] = None) -> str:
+    def fetch_live_config(
+        url: Optional[str] = None,
+        max_age: float = 300,
+        stale_while_revalidate: bool = False,
+        cache_dir: Optional[str] = None
+    ) -> str:
         """
         Fetch the latest skill configuration from the remote URL.
-        Returns the raw markdown content. Agents should parse this for
-        up-to-date contract addresses, chain configs, and parameters.
+        Returns the raw markdown content (see load_live_config for the parsed form).
+
+        The document is cached on disk (~/.cache/aijudge) and revalidated with
+        ETag/If-Modified-Since once older than max_age. If the server cannot be
+        reached the last cached copy is returned; with no copy at all, "".
 
         Args:
             url: Override URL (defaults to departmentofpredictions.com/skill.md)
+            max_age: Seconds a cached copy is used without contacting the server
+            stale_while_revalidate: Return a stale cached copy immediately and
+                refresh it in the background (avoids blocking agent start-up)
+            cache_dir: Override cache directory
+        """
+        return get_cache(cache_dir).fetch(
+            url or AIJudgeClient.SKILL_CONFIG_URL,
+            max_age=max_age,
+            stale_while_revalidate=stale_while_revalidate
+        )
+
+    @staticmethod
+    def load_live_config(
+        url: Optional[str] = None,
+        max_age: float = 300,
+        stale_while_revalidate: bool = True,
+        cache_dir: Optional[str] = None
+    ) -> SkillConfig:
+        """
+        Live skill config parsed into contract address, chains (ID, RPC, USDC)
+        and protocol parameters. Same caching as fetch_live_config.
+        """
+        return parse_skill_config(AIJudgeClient.fetch_live_config(
+            url, max_age=max_age, stale_while_revalidate=stale_while_revalidate, cache_dir=cache_dir
+        ))
+
+    @classmethod
+    def from_live_config(
+        cls,
+        private_key: str,
+        chain: str = "eth-sepolia",
+        config: Optional[SkillConfig] = None,
+        **kwargs
+    ) -> 'AIJudgeClient':
         """
-        config_url = url or AIJudgeClient.SKILL_CONFIG_URL
+        Build a client from the live config: contract, RPC and USDC addresses
+        for the given chain (falling back to the built-in defaults for anything
+        the config does not list).
+
+        Args:
+            private_key: Ethereum private key
+            chain: Chain name (eth-sepolia, base-sepolia, arc-testnet) or chain ID
+            config: Already-loaded SkillConfig (default: load_live_config())
+            kwargs: Passed through to AIJudgeClient (instrumentation, rate_limit, ...)
+        """
+        config = config or cls.load_live_config()
+        entry = config.chain(chain)
+        name = entry.name if entry else chain
+        rpc_url = kwargs.pop('rpc_url', None) or (entry.rpc_url if entry else None) or cls.RPC_URLS.get(name)
+        if not rpc_url:
+            raise ValueError(f"Unknown chain: {chain}")
+        return cls(
+            private_key=private_key,
+            rpc_url=rpc_url,
+            contract_address=kwargs.pop('contract_address', None) or config.contract_address or cls.DEFAULT_CONTRACT_ADDRESS,
+            usdc_address=kwargs.pop('usdc_address', None) or (entry.usdc_address if entry else None) or cls.USDC_ADDRESSES.get(name),
+            **kwargs
+        )
+
+    def _span(self, kind: str, name: str):
+        """Timing context for instrumentation (no-op when not instrumented)"""
+        if self.instrumentation is None:
+            return nullcontext()
+        return self.instrumentation.span(kind, name)
+
+    def _simulate(self, fn_name: str, tx: Dict):
+        """
+        eth_call the exact transaction against the pending block; raise
+        TransactionWouldRevert with the decoded custom error if it reverts.
+        """
+        from revert_decoder import TransactionWouldRevert, decode_exception
+
+        call = {k: tx[k] for k in ('from', 'to', 'data', 'value', 'gas') if k in tx}
         try:
-            req = urllib.request.Request(config_url, headers={"User-Agent": "AIJudgeClient/1.0"})
-            with urllib.request.urlopen(req, timeout=10) as resp:
-                return resp.read().decode("utf-8")
+            self.w3.eth.call(call, 'pending')
         except Exception as e:
-            print(f"Warning: Could not fetch live config from {config_url}: {e}")
-            return ""
-
-    def _send_transaction(self, function, value: int = 0) -> str:
-        """Send a transaction and return tx hash"""
-        tx = function.build_transaction({
-            'from': self.address,
-            'nonce': self.w3.eth.get_transaction_count(self.address),
-            'gas': 500000,
-            'gasPrice': self.w3.eth.gas_price,
-            'value': value
-        })
-        
-        signed_tx = self.account.sign_transaction(tx)
-        tx_hash = self.w3.eth.send_raw_transaction(signed_tx.rawTransaction)
-        return self.w3.to_hex(tx_hash)
+            revert = decode_exception(e)
+            if revert is None:
+                raise
+            raise TransactionWouldRevert(fn_name, revert) from e
+
+    def _send_transaction(
+        self,
+        function,
+        value: int = 0,
+        gas: int = 500000,
+        simulate: Optional[bool] = None
+    ) -> str:
+        """
+        Send a transaction and return tx hash
+
+        Args:
+            simulate: Override the client's pre-flight simulation setting for this call
+        """
+        from rate_limiter import Priority, request_priority
+
+        with self._span("contract", function.fn_name), request_priority(Priority.TX):
+            nonce = self.w3.eth.get_transaction_count(self.address)
+            gas_price = self.w3.eth.gas_price
+            if self._chain_id is None:
+                self._chain_id = self.w3.eth.chain_id
+            # Every field build_transaction would otherwise fetch is supplied,
+            # so the encode span covers ABI encoding only, no RPC round trips
+            with self._span("phase", "encode"):
+                tx = function.build_transaction({
+                    'from': self.address,
+                    'nonce': nonce,
+                    'gas': gas,
+                    'gasPrice': gas_price,
+                    'chainId': self._chain_id,
+                    'value': value
+                })
+            arg_names = [i['name'] for i in function.abi.get('inputs', [])]
+            return self._sign_and_send(function.fn_name, tx, arg_names, function.args, simulate)
+
+    def _send_precompiled(
+        self,
+        fn_name: str,
+        args: Sequence[Any],
+        value: int = 0,
+        gas: int = 500000,
+        simulate: Optional[bool] = None
+    ) -> str:
+        """
+        Send a transaction for a static-argument contract function through its
+        precompiled encoder (see calldata.py) instead of ContractFunction
+
+        Args:
+            fn_name: Contract function name (commitVote, revealVote, ...)
+            args: Arguments in ABI order, bytes32 values as bytes
+        """
+        from calldata import build_transaction, precompiled
+        from rate_limiter import Priority, request_priority
+
+        encoder = precompiled(fn_name)
+        with self._span("contract", fn_name), request_priority(Priority.TX):
+            nonce = self.w3.eth.get_transaction_count(self.address)
+            gas_price = self.w3.eth.gas_price
+            if self._chain_id is None:
+                self._chain_id = self.w3.eth.chain_id
+            with self._span("phase", "encode"):
+                tx = build_transaction(
+                    self.contract.address, encoder.encode(*args), self.address,
+                    nonce, gas, gas_price, self._chain_id, value
+                )
+            return self._sign_and_send(fn_name, tx, encoder.arg_names, args, simulate)
+
+    def _sign_and_send(
+        self,
+        fn_name: str,
+        tx: Dict,
+        arg_names: Sequence[str],
+        args: Sequence[Any],
+        simulate: Optional[bool]
+    ) -> str:
+        """Simulate (if enabled), sign and broadcast a built transaction"""
+        if self.simulate if simulate is None else simulate:
+            with self._span("phase", "simulate"):
+                self._simulate(fn_name, tx)
+
+        with self._span("phase", "sign"):
+            signed_tx = self.account.sign_transaction(tx)
+        # eth-account >= 0.13 renamed rawTransaction -> raw_transaction
+        raw_tx = getattr(signed_tx, 'raw_transaction', None) or signed_tx.rawTransaction
+        tx_hash = self.w3.to_hex(self.w3.eth.send_raw_transaction(raw_tx))
+        if self.gas_profiler is not None:
+            from gas_profiler import tags_for_call
+            self._profiled_txs[tx_hash.lower()] = (
+                fn_name,
+                tags_for_call(arg_names, args),
+                bytes.fromhex(tx['data'][2:])
+            )
+        return tx_hash
     
     def _call(self, function) -> Any:
         """Call a view function"""
-        return function.call({'from': self.address})
+        with self._span("contract", function.fn_name):
+            return function.call({'from': self.address})
     
     # ==================== MARKET OPERATIONS ====================
     
@@ -208,6 +481,21 @@ class AIJudgeClient:
             'court_id': result[16] if len(result) > 16 else 0
         }
     
+    def get_market_count(self) -> int:
+        """Total number of markets created"""
+        return self._call(self.contract.functions.getMarketCount())
+
+    def get_markets(self, market_ids: Optional[Sequence[int]] = None) -> List[Dict]:
+        """Get several markets (all markets if no IDs given), each tagged with market_id"""
+        if market_ids is None:
+            market_ids = range(self.get_market_count())
+        markets = []
+        for market_id in market_ids:
+            market = self.get_market(market_id)
+            market['market_id'] = market_id
+            markets.append(market)
+        return markets
+
     def select_judges(self, market_id: int) -> str:
         """Trigger judge selection for a market (requires MANAGER_ROLE)"""
         func = self.contract.functions.selectJudgesForMarket(market_id)
@@ -215,8 +503,7 @@ class AIJudgeClient:
     
     def finalize_resolution(self, market_id: int) -> str:
         """Finalize market resolution after challenge window"""
-        func = self.contract.functions.finalizeResolution(market_id)
-        return self._send_transaction(func)
+        return self._send_precompiled('finalizeResolution', (market_id,))
     
     # ==================== JUDGE OPERATIONS ====================
     
@@ -283,9 +570,7 @@ class AIJudgeClient:
         """
         # Contract uses: keccak256(abi.encodePacked(outcome, salt))
         # outcome is uint8 (enum), salt is bytes32
-        salt_bytes = bytes.fromhex(salt.replace('0x', ''))
-        packed = bytes([outcome]) + salt_bytes
-        return self.w3.keccak(packed).hex()
+        return compute_commit_hash(outcome, salt)
     
     def commit_vote(self, market_id: int, outcome: int, salt: str) -> str:
         """
@@ -296,9 +581,10 @@ class AIJudgeClient:
             outcome: 1 for Yes, 0 for No (must match salt when revealing)
             salt: Random salt string (keep secret until reveal)
         """
+        from calldata import to_bytes32
+
         commit_hash = self.compute_commit_hash(outcome, salt)
-        func = self.contract.functions.commitVote(market_id, commit_hash)
-        return self._send_transaction(func)
+        return self._send_precompiled('commitVote', (market_id, to_bytes32(commit_hash)))
     
     def reveal_vote(
         self,
@@ -318,20 +604,16 @@ class AIJudgeClient:
             evidence_hash: Optional IPFS hash of evidence
             rationale_hash: Optional IPFS hash of AI rationale
         """
-        # Convert string hashes to bytes32 if needed
-        if evidence_hash.startswith('0x'):
-            evidence_hash = evidence_hash[2:]
-        if rationale_hash.startswith('0x'):
-            rationale_hash = rationale_hash[2:]
-            
-        func = self.contract.functions.revealVote(
+        from calldata import to_bytes32
+
+        # Salt is decoded as in compute_commit_hash so the reveal matches the commit
+        return self._send_precompiled('revealVote', (
             market_id,
             outcome,
-            salt.encode(),
-            bytes.fromhex(evidence_hash),
-            bytes.fromhex(rationale_hash)
-        )
-        return self._send_transaction(func)
+            to_bytes32(salt),
+            to_bytes32(evidence_hash),
+            to_bytes32(rationale_hash)
+        ))
     
     def get_vote(self, market_id: int, judge_address: Optional[str] = None) -> Dict:
         """Get vote details for a judge on a market"""
@@ -389,9 +671,85 @@ class AIJudgeClient:
         """Get list of all available courts"""
         return [{'id': i, 'name': n} for i, n in self.COURT_NAMES.items()]
     
+    def get_config(self) -> Dict:
+        """Get protocol parameters (stakes in USDC base units, windows in seconds)"""
+        result = self._call(self.contract.functions.getConfig())
+        return {
+            'min_judge_stake': result[0],
+            'challenge_stake': result[1],
+            'challenge_window': result[2],
+            'protocol_fee_basis_points': result[3],
+            'slash_percentage': result[4],
+            'commit_reveal_window': result[5]
+        }
+
     def wait_for_transaction(self, tx_hash: str, timeout: int = 120) -> Dict:
-        """Wait for transaction receipt"""
-        return self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=timeout)
+        """Wait for transaction receipt (and record its gas with the gas profiler, if set)"""
+        receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=timeout)
+        if self.gas_profiler is not None:
+            self._profile_receipt(self.w3.to_hex(receipt['transactionHash']), receipt)
+        return receipt
+
+    # ==================== GAS PROFILING ====================
+
+    def _receipt_events(self, receipt: Dict) -> List[tuple]:
+        """(event name, args) for the market contract's logs in a receipt"""
+        if self._event_topics is None:
+            self._event_topics = {}
+            for entry in self.contract.abi:
+                if entry.get('type') == 'event':
+                    signature = f"{entry['name']}({','.join(i['type'] for i in entry['inputs'])})"
+                    self._event_topics[self.w3.to_hex(self.w3.keccak(text=signature))] = entry['name']
+        events = []
+        for log in receipt.get('logs', []):
+            if log['address'] != self.contract.address or not log['topics']:
+                continue
+            name = self._event_topics.get(self.w3.to_hex(log['topics'][0]))
+            if name is None:
+                continue
+            try:
+                events.append((name, getattr(self.contract.events, name)().process_log(log)['args']))
+            except Exception:
+                events.append((name, {}))
+        return events
+
+    def _profile_receipt(self, tx_hash: str, receipt: Dict):
+        """Feed one receipt to the gas profiler"""
+        from gas_profiler import tags_for_call, tags_for_events
+
+        sent = self._profiled_txs.pop(tx_hash.lower(), None)
+        if sent is not None:
+            fn_name, tags, calldata = sent
+        else:
+            # Not sent by this client: recover function and calldata from the transaction
+            tx = self.w3.eth.get_transaction(tx_hash)
+            calldata = bytes(tx['input'])
+            fn_name, tags = 'unknown', {}
+            if tx.get('to') == self.contract.address:
+                try:
+                    func, params = self.contract.decode_function_input(calldata)
+                    fn_name = func.fn_name
+                    tags = tags_for_call(params.keys(), params.values())
+                except Exception:
+                    pass
+
+        tags.update(tags_for_events(self._receipt_events(receipt)))
+        market_courts = self.gas_profiler.market_courts
+        if 'market_id' in tags:
+            if 'court_id' in tags:
+                market_courts[tags['market_id']] = tags['court_id']
+            else:
+                if tags['market_id'] not in market_courts:
+                    try:
+                        market_courts[tags['market_id']] = self.get_market(tags['market_id'])['court_id']
+                    except Exception:
+                        pass
+                if tags['market_id'] in market_courts:
+                    tags['court_id'] = market_courts[tags['market_id']]
+
+        if self._chain_id is None:
+            self._chain_id = self.w3.eth.chain_id
+        self.gas_profiler.observe(tx_hash, fn_name, receipt, calldata, tags, self._chain_id)
 
 
 if __name__ == "__main__":
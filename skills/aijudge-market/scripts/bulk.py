@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+AIJudgeMarket Bulk Reads
+Shared NDJSON streaming mode for the read scripts (get_market.py,
+get_judge.py, ...).
+
+Keys (market IDs, addresses) are read from a file or stdin, one per line,
+fetched concurrently in batches, and written as one JSON object per line as
+soon as each batch completes, in input order. A key that fails, or a line
+that does not parse, produces a record with an "error" field instead of
+aborting the stream.
+
+Example:
+    seq 0 499 | python3 get_market.py --ids-from - > markets.ndjson
+    python3 get_judge.py --addresses-from judges.txt --workers 16 | jq .stake
+"""
+
+import json
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, IO, Iterable, Iterator, List, Optional, TypeVar, Union
+
+T = TypeVar("T")
+
+
+def add_bulk_arguments(parser, source_flag: str, source_help: str):
+    """Add the shared bulk-mode options to a script's parser"""
+    parser.add_argument(source_flag, metavar="FILE",
+                        help=f"{source_help}, one per line ('-' for stdin); writes NDJSON")
+    parser.add_argument("--batch-size", type=int, default=50,
+                        help="Keys fetched per batch in bulk mode (default: 50)")
+    parser.add_argument("--workers", type=int, default=8,
+                        help="Concurrent requests in bulk mode (default: 8)")
+
+
+@dataclass(frozen=True)
+class InvalidKey:
+    """An input line that could not be parsed; written as an error record"""
+    input: str
+    error: str
+
+
+def read_keys(source: str, parse: Callable[[str], T]) -> Iterator[Union[T, InvalidKey]]:
+    """
+    Yield parsed keys from a file path or '-' (stdin). Blank lines and
+    '#' comments are skipped; integer ranges like '10-19' expand when
+    parse is int. A line that fails to parse yields an InvalidKey.
+    """
+    stream = sys.stdin if source == "-" else open(source, "r")
+    try:
+        for line in stream:
+            line = line.split("#", 1)[0].strip()
+            if not line:
+                continue
+            try:
+                if parse is int and "-" in line.lstrip("-"):
+                    start, end = line.split("-", 1)
+                    keys = range(int(start), int(end) + 1)
+                else:
+                    keys = [parse(line)]
+            except ValueError as e:
+                yield InvalidKey(line, f"{type(e).__name__}: {e}")
+                continue
+            yield from keys
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+
+
+def _batches(keys: Iterable[T], size: int) -> Iterator[List[T]]:
+    batch = []
+    for key in keys:
+        batch.append(key)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def to_json(record: Dict) -> str:
+    """One NDJSON line; bytes become 0x-hex"""
+    return json.dumps(record, default=lambda o: "0x" + bytes(o).hex() if isinstance(o, (bytes, bytearray)) else str(o))
+
+
+def stream_ndjson(
+    keys: Iterable[T],
+    fetch: Callable[[T], Dict],
+    key_name: str,
+    batch_size: int = 50,
+    workers: int = 8,
+    out: Optional[IO] = None
+) -> Dict[str, int]:
+    """
+    Fetch every key concurrently (batch by batch) and write NDJSON records.
+
+    Args:
+        keys: Keys to fetch (consumed lazily, so stdin can be streamed);
+            InvalidKey entries become {"input": ..., "error": ...} records
+        fetch: key -> record dict (runs in a worker thread)
+        key_name: Field holding the key in each record (e.g. 'market_id')
+        batch_size: Keys per batch; output is flushed after each batch
+        workers: Thread pool size
+
+    Returns:
+        Counts of records written and errors
+    """
+    out = out or sys.stdout
+    counts = {"records": 0, "errors": 0}
+
+    def run(key) -> Dict[str, Any]:
+        if isinstance(key, InvalidKey):
+            return {"input": key.input, "error": key.error}
+        try:
+            return {key_name: key, **fetch(key)}
+        except Exception as e:
+            return {key_name: key, "error": f"{type(e).__name__}: {e}"}
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for batch in _batches(keys, batch_size):
+            for record in pool.map(run, batch):
+                out.write(to_json(record) + "\n")
+                counts["records"] += 1
+                counts["errors"] += "error" in record
+            out.flush()
+    return counts
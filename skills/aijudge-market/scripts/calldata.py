@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+AIJudgeMarket Precompiled Calldata
+Encoders for the write hot path (commitVote, revealVote, finalizeResolution).
+
+web3's ContractFunction.build_transaction resolves the ABI entry, normalizes
+every argument and fetches eth_chainId on each call. These functions take
+only static ABI types, so their calldata is a cached 4-byte selector
+followed by a fixed-layout eth_abi.encode of the arguments, and the
+transaction dict is assembled directly.
+
+Example:
+    data = encode_reveal_vote(7, 1, salt, evidence_hash, rationale_hash)
+    tx = build_transaction(contract_address, data, sender, nonce, 200000, gas_price, chain_id)
+"""
+
+import json
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, Tuple, Union
+
+DEFAULT_ABI_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'references', 'contract_abi.json')
+
+ZERO_BYTES32 = b"\x00" * 32
+
+Bytes32 = Union[bytes, str]
+
+
+@dataclass(frozen=True)
+class PrecompiledFunction:
+    """A contract function with its selector and argument types resolved once"""
+    name: str
+    selector: bytes
+    types: Tuple[str, ...]
+    arg_names: Tuple[str, ...]
+
+    def encode(self, *args: Any) -> bytes:
+        """selector + ABI-encoded arguments"""
+        from eth_abi import encode
+        return self.selector + encode(self.types, args)
+
+
+@lru_cache(maxsize=32)
+def precompiled(name: str, abi_path: str = DEFAULT_ABI_PATH) -> PrecompiledFunction:
+    """PrecompiledFunction for a function in the contract ABI (cached per name)"""
+    from eth_hash.auto import keccak
+
+    with open(abi_path, "r") as f:
+        abi = json.load(f)
+    entry = next((e for e in abi if e.get("type") == "function" and e.get("name") == name), None)
+    if entry is None:
+        raise ValueError(f"Function {name} not found in {abi_path}")
+    types = tuple(i["type"] for i in entry["inputs"])
+    if any(t.startswith("tuple") or t.endswith("]") or t in ("string", "bytes") for t in types):
+        raise ValueError(f"{name} has dynamic arguments; use contract.functions.{name}")
+    return PrecompiledFunction(
+        name=name,
+        selector=keccak(f"{name}({','.join(types)})".encode())[:4],
+        types=types,
+        arg_names=tuple(i["name"] for i in entry["inputs"]),
+    )
+
+
+def to_bytes32(value: Bytes32) -> bytes:
+    """bytes32 from bytes or a hex string (with or without 0x prefix)"""
+    if isinstance(value, str):
+        value = bytes.fromhex(value[2:] if value.startswith("0x") else value)
+    if len(value) != 32:
+        raise ValueError(f"Expected 32 bytes, got {len(value)}")
+    return bytes(value)
+
+
+# ==================== HOT PATH ENCODERS ====================
+
+def encode_commit_vote(market_id: int, commit_hash: Bytes32) -> bytes:
+    """Calldata for commitVote(uint256 marketId, bytes32 commitHash)"""
+    return precompiled("commitVote").encode(market_id, to_bytes32(commit_hash))
+
+
+def encode_reveal_vote(
+    market_id: int,
+    outcome: int,
+    salt: Bytes32,
+    evidence_hash: Bytes32 = ZERO_BYTES32,
+    rationale_hash: Bytes32 = ZERO_BYTES32
+) -> bytes:
+    """
+    Calldata for revealVote(uint256 marketId, uint8 outcome, bytes32 salt,
+    bytes32 evidenceHash, bytes32 rationaleHash). The salt is decoded the same
+    way as in compute_commit_hash, so the reveal matches the commit.
+    """
+    return precompiled("revealVote").encode(
+        market_id, outcome, to_bytes32(salt), to_bytes32(evidence_hash), to_bytes32(rationale_hash)
+    )
+
+
+def encode_finalize_resolution(market_id: int) -> bytes:
+    """Calldata for finalizeResolution(uint256 marketId)"""
+    return precompiled("finalizeResolution").encode(market_id)
+
+
+def build_transaction(
+    to: str,
+    data: bytes,
+    sender: str,
+    nonce: int,
+    gas: int,
+    gas_price: int,
+    chain_id: int,
+    value: int = 0
+) -> Dict:
+    """
+    Legacy transaction dict, as ContractFunction.build_transaction returns it
+    for the client's {'from', 'nonce', 'gas', 'gasPrice', 'value'} params
+
+    Args:
+        to: Checksummed contract address
+        data: Calldata from one of the encoders
+        sender: Checksummed sender address
+    """
+    return {
+        'to': to,
+        'data': '0x' + data.hex(),
+        'from': sender,
+        'nonce': nonce,
+        'gas': gas,
+        'gasPrice': gas_price,
+        'value': value,
+        'chainId': chain_id,
+    }
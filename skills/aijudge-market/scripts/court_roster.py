@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+"""
+AIJudgeMarket Court Roster
+Materialized membership of all 8 courts, with stake and reputation per
+member, built by replaying contract events instead of calling getJudge +
+getJudgeCourts for every judge.
+
+Events applied (in block / log order):
+  JudgeRegistered    -> new member of General (0) with stake and reputation
+  CourtJoined/Left   -> court membership
+  JudgeDeregistered  -> removed from every court
+  JudgeSuspended     -> kept in its courts but marked Suspended (not selectable)
+  JudgeReinstated    -> Active again
+  SlashApplied       -> stake reduced
+
+Reputation boosts from reward distribution are not evented per judge, so
+judges selected (JudgeSelected) for a market that later emits
+RewardsDistributed are re-read with getJudge - only those judges, once.
+
+The roster syncs incrementally from the last processed block and can be
+persisted to JSON, so later runs only fetch new logs.
+
+Example:
+    roster = CourtRoster(client, state_path="roster.json")
+    roster.sync()
+    for member in roster.members(court_id=6):
+        print(member['address'], member['stake'], member['reputation_score'])
+
+Usage:
+    python3 court_roster.py --from-block 7000000
+    python3 court_roster.py --court-id 6 --state roster.json
+"""
+
+import argparse
+import json
+import os
+import sys
+from typing import Dict, List, Optional, Set
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from aijudge_client import AIJudgeClient
+
+ROSTER_EVENTS = (
+    "JudgeRegistered",
+    "JudgeDeregistered",
+    "JudgeSuspended",
+    "JudgeReinstated",
+    "CourtJoined",
+    "CourtLeft",
+    "SlashApplied",
+    "JudgeSelected",
+    "RewardsDistributed",
+)
+
+
+def _event_topic(client: AIJudgeClient, name: str) -> str:
+    abi = next(e for e in client.contract.abi if e.get("type") == "event" and e.get("name") == name)
+    signature = f"{name}({','.join(i['type'] for i in abi['inputs'])})"
+    return client.w3.to_hex(client.w3.keccak(text=signature))
+
+
+class CourtRoster:
+    """
+    Event-sourced court membership.
+
+    Args:
+        client: AIJudgeClient (read-only key is fine)
+        from_block: First block to scan (the contract's deployment block is ideal)
+        chunk_size: Block range per eth_getLogs request
+        confirmations: Stay this many blocks behind head to avoid reorged logs
+        state_path: Optional JSON file to load from and save to after each sync
+    """
+
+    def __init__(
+        self,
+        client: AIJudgeClient,
+        from_block: int = 0,
+        chunk_size: int = 10000,
+        confirmations: int = 0,
+        state_path: Optional[str] = None
+    ):
+        self.client = client
+        self.chunk_size = chunk_size
+        self.confirmations = confirmations
+        self.state_path = state_path
+        self.next_block = from_block
+        self.judges: Dict[str, Dict] = {}
+        # Selected judges of markets whose rewards have not been distributed yet
+        self.pending_markets: Dict[int, List[str]] = {}
+        self._topics = {_event_topic(client, name): name for name in ROSTER_EVENTS}
+
+        if state_path and os.path.exists(state_path):
+            self.load(state_path)
+
+    # ==================== EVENT REPLAY ====================
+
+    def _fetch_logs(self, from_block: int, to_block: int) -> List:
+        logs = self.client.w3.eth.get_logs({
+            "address": self.client.contract.address,
+            "fromBlock": from_block,
+            "toBlock": to_block,
+            "topics": [list(self._topics)],
+        })
+        return sorted(logs, key=lambda log: (log["blockNumber"], log["logIndex"]))
+
+    def _decode(self, log):
+        topic = log["topics"][0]
+        name = self._topics["0x" + bytes(topic).hex() if not isinstance(topic, str) else topic]
+        return name, getattr(self.client.contract.events, name)().process_log(log)["args"]
+
+    def apply(self, name: str, args: Dict, block: int) -> Optional[int]:
+        """
+        Apply one decoded event. Returns a market ID whose judges need a
+        reputation refresh, if any.
+        """
+        judge = args.get("judge")
+        if name == "JudgeRegistered":
+            self.judges[judge] = {
+                "stake": args["stake"],
+                "reputation_score": args["reputationScore"],
+                "status": "Active",
+                "court_ids": [0],
+                "registered_block": block,
+            }
+        elif name == "JudgeDeregistered":
+            self.judges.pop(judge, None)
+        elif judge is not None and judge not in self.judges:
+            # Registered before from_block: fully re-read at the end of sync()
+            self.judges[judge] = {"stake": None, "reputation_score": None, "status": "Unknown",
+                                  "court_ids": [0], "registered_block": None}
+        if name == "CourtJoined":
+            courts = self.judges[judge]["court_ids"]
+            if args["courtId"] not in courts:
+                courts.append(args["courtId"])
+        elif name == "CourtLeft":
+            courts = self.judges[judge]["court_ids"]
+            if args["courtId"] in courts:
+                courts.remove(args["courtId"])
+        elif name == "JudgeSuspended":
+            self.judges[judge]["status"] = "Suspended"
+        elif name == "JudgeReinstated":
+            self.judges[judge]["status"] = "Active"
+        elif name == "SlashApplied":
+            if self.judges[judge]["stake"] is not None:
+                self.judges[judge]["stake"] -= args["amount"]
+        elif name == "JudgeSelected":
+            self.pending_markets.setdefault(args["marketId"], []).append(judge)
+        elif name == "RewardsDistributed":
+            return args["marketId"]
+        return None
+
+    def sync(self, to_block: Optional[int] = None) -> int:
+        """
+        Fetch and apply all roster events since the last sync.
+
+        Returns:
+            Number of events applied
+        """
+        head = self.client.w3.eth.block_number - self.confirmations
+        to_block = head if to_block is None else min(to_block, head)
+        applied = 0
+        stale: Set[str] = set()
+
+        start = self.next_block
+        while start <= to_block:
+            end = min(start + self.chunk_size - 1, to_block)
+            for log in self._fetch_logs(start, end):
+                name, args = self._decode(log)
+                rewarded = self.apply(name, args, log["blockNumber"])
+                if rewarded is not None:
+                    stale.update(self.pending_markets.pop(rewarded, []))
+                applied += 1
+            start = end + 1
+            self.next_block = start
+
+        unknown = [a for a, j in self.judges.items() if j["status"] == "Unknown"]
+        self.refresh(unknown, courts=True)
+        self.refresh(stale - set(unknown))
+
+        if self.state_path:
+            self.save(self.state_path)
+        return applied
+
+    def refresh(self, addresses, courts: bool = False) -> None:
+        """
+        Re-read stake, reputation and status for specific judges (one getJudge
+        each; plus getJudgeCourts with courts=True)
+        """
+        for address in addresses:
+            if address not in self.judges:
+                continue
+            raw = self.client._call(self.client.contract.functions.getJudge(address))
+            status = ["Inactive", "Active", "Suspended"][raw[3]]
+            if status == "Inactive":
+                self.judges.pop(address)
+                continue
+            entry = self.judges[address]
+            entry["stake"] = raw[0]
+            entry["reputation_score"] = raw[5]
+            entry["status"] = status
+            if courts:
+                entry["court_ids"] = list(self.client._call(self.client.contract.functions.getJudgeCourts(address)))
+
+    # ==================== QUERIES ====================
+
+    def _member(self, address: str, entry: Dict) -> Dict:
+        return {
+            "address": address,
+            "stake": entry["stake"] / 10**6 if entry["stake"] is not None else None,  # USDC, as get_judge
+            "reputation_score": entry["reputation_score"],
+            "status": entry["status"],
+            "court_ids": sorted(entry["court_ids"]),
+        }
+
+    def members(self, court_id: int, include_suspended: bool = False) -> List[Dict]:
+        """Members of one court, highest reputation first"""
+        result = [
+            self._member(address, entry)
+            for address, entry in self.judges.items()
+            if court_id in entry["court_ids"] and (include_suspended or entry["status"] == "Active")
+        ]
+        return sorted(result, key=lambda m: (-(m["reputation_score"] or 0), m["address"]))
+
+    def rosters(self, include_suspended: bool = False) -> Dict[int, List[Dict]]:
+        """Members of every court"""
+        return {court_id: self.members(court_id, include_suspended) for court_id in AIJudgeClient.COURT_NAMES}
+
+    def court_stats(self) -> List[Dict]:
+        """Per-court size, total stake and reputation spread (active members only)"""
+        stats = []
+        for court_id, name in AIJudgeClient.COURT_NAMES.items():
+            members = self.members(court_id)
+            stakes = [m["stake"] for m in members if m["stake"] is not None]
+            reputations = [m["reputation_score"] for m in members if m["reputation_score"] is not None]
+            stats.append({
+                "court_id": court_id,
+                "name": name,
+                "members": len(members),
+                "total_stake": sum(stakes),
+                "mean_reputation": sum(reputations) / len(reputations) if reputations else None,
+                "max_reputation": max(reputations) if reputations else None,
+            })
+        return stats
+
+    # ==================== PERSISTENCE ====================
+
+    def save(self, path: str):
+        state = {
+            "contract": self.client.contract.address,
+            "next_block": self.next_block,
+            "judges": self.judges,
+            "pending_markets": {str(k): v for k, v in self.pending_markets.items()},
+        }
+        tmp = path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(state, f)
+        os.replace(tmp, path)
+
+    def load(self, path: str):
+        with open(path, "r") as f:
+            state = json.load(f)
+        if state.get("contract") != self.client.contract.address:
+            raise ValueError(f"Roster state in {path} belongs to contract {state.get('contract')}")
+        self.next_block = state["next_block"]
+        self.judges = state["judges"]
+        self.pending_markets = {int(k): v for k, v in state["pending_markets"].items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Court membership from contract events")
+    parser.add_argument("--court-id", type=int, help="Show members of one court (default: summary of all)")
+    parser.add_argument("--include-suspended", action="store_true", help="Also list suspended members")
+    parser.add_argument("--from-block", type=int, default=0, help="First block to scan (deployment block)")
+    parser.add_argument("--chunk-size", type=int, default=10000, help="Blocks per eth_getLogs request")
+    parser.add_argument("--state", help="JSON file to resume from / save to")
+    parser.add_argument("--rpc-url", default="https://sepolia.base.org", help="RPC endpoint")
+    parser.add_argument("--contract", help="Contract address")
+    parser.add_argument("--json", action="store_true", help="Print JSON")
+
+    args = parser.parse_args()
+
+    contract_address = args.contract or os.environ.get("CONTRACT_ADDRESS") or AIJudgeClient.DEFAULT_CONTRACT_ADDRESS
+
+    try:
+        client = AIJudgeClient(
+            private_key=AIJudgeClient.READ_ONLY_KEY,
+            rpc_url=args.rpc_url,
+            contract_address=contract_address
+        )
+        roster = CourtRoster(client, from_block=args.from_block, chunk_size=args.chunk_size, state_path=args.state)
+        applied = roster.sync()
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        sys.exit(1)
+
+    if args.court_id is not None:
+        result = roster.members(args.court_id, args.include_suspended)
+    else:
+        result = roster.court_stats()
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+        return
+
+    print("\n" + "=" * 60)
+    print(f"⚖️  Court Roster ({applied} new events, synced to block {roster.next_block - 1})")
+    print("=" * 60)
+    if args.court_id is not None:
+        print(f"{AIJudgeClient.COURT_NAMES.get(args.court_id, '?')} (ID: {args.court_id}) - {len(result)} members")
+        for m in result:
+            stake = f"{m['stake']:.2f}" if m["stake"] is not None else "?"
+            print(f"  {m['address']}  stake {stake:>10} USDC  rep {m['reputation_score']}  {m['status']}")
+    else:
+        for s in result:
+            mean = f"{s['mean_reputation']:.0f}" if s["mean_reputation"] is not None else "-"
+            print(f"  {s['court_id']} {s['name']:<14} {s['members']:>4} judges  "
+                  f"{s['total_stake']:>12.2f} USDC  mean rep {mean}")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,386 @@
+#!/usr/bin/env python3
+"""
+AIJudgeMarket Gas Profiler
+Gas used, effective gas price and calldata size of every receipt the client
+waits for, grouped by contract function and by the parameters that drive
+cost (court, required judges, judges selected / slashed in the transaction).
+
+Samples are appended to an NDJSON history file tagged with a run label
+(e.g. the contract version), so runs before and after an upgrade can be
+compared.
+
+Tags recorded per sample:
+  court_id          createMarket/joinCourt argument, or the market's court
+  required_judges   createMarket argument
+  selected_judges   JudgeSelected events in the receipt
+  slashed           SlashApplied events in the receipt
+  rewarded_judges   judgeCount of RewardsDistributed in the receipt
+
+Example:
+    profiler = GasProfiler(history_path="gas_history.ndjson", run="v2.1")
+    client = AIJudgeClient(..., gas_profiler=profiler)
+    client.wait_for_transaction(client.select_judges(7))
+
+    for row in profiler.report(group_by=("function", "selected_judges")):
+        print(row["function"], row["selected_judges"], row["gas_used"]["p50"])
+
+Usage:
+    python3 gas_profiler.py --history gas_history.ndjson
+    python3 gas_profiler.py --history gas_history.ndjson --group-by function,court_id
+    python3 gas_profiler.py --history gas_history.ndjson --compare v2.0 v2.1
+    python3 gas_profiler.py --history gas_history.ndjson --trend selectJudgesForMarket --bucket day
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Function arguments recorded as tags (ABI input name -> tag)
+ARG_TAGS = {
+    "courtId": "court_id",
+    "requiredJudges": "required_judges",
+    "marketId": "market_id",
+}
+
+# Receipt events counted as tags (event name -> tag)
+EVENT_TAGS = {
+    "JudgeSelected": "selected_judges",
+    "SlashApplied": "slashed",
+}
+
+BUCKETS = {"hour": 3600, "day": 86400, "week": 7 * 86400}
+
+
+@dataclass
+class GasSample:
+    """One mined transaction"""
+    tx_hash: str
+    function: str
+    gas_used: int
+    effective_gas_price: int  # wei
+    calldata_bytes: int
+    calldata_gas: int  # intrinsic calldata cost: 16 per non-zero byte, 4 per zero byte
+    block_number: int
+    status: int
+    timestamp: float
+    run: str = ""
+    chain_id: Optional[int] = None
+    tags: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def cost_wei(self) -> int:
+        return self.gas_used * self.effective_gas_price
+
+    def to_dict(self) -> Dict:
+        data = asdict(self)
+        data["cost_wei"] = self.cost_wei
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "GasSample":
+        data = {k: v for k, v in data.items() if k != "cost_wei"}
+        return cls(**data)
+
+
+def calldata_gas(data: bytes) -> int:
+    """Intrinsic gas charged for calldata (EIP-2028)"""
+    zeros = data.count(0)
+    return 4 * zeros + 16 * (len(data) - zeros)
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    idx = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[idx]
+
+
+def _summary(samples: List[GasSample]) -> Dict:
+    gas = [s.gas_used for s in samples]
+    prices = [s.effective_gas_price for s in samples]
+    costs = [s.cost_wei for s in samples]
+    calldata = [s.calldata_bytes for s in samples]
+    return {
+        "count": len(samples),
+        "reverted": sum(1 for s in samples if s.status != 1),
+        "gas_used": {
+            "mean": int(statistics.mean(gas)),
+            "p50": int(_percentile(gas, 50)),
+            "p90": int(_percentile(gas, 90)),
+            "p99": int(_percentile(gas, 99)),
+            "max": max(gas),
+        },
+        "effective_gas_price_gwei": {
+            "mean": round(statistics.mean(prices) / 1e9, 4),
+            "p50": round(_percentile(prices, 50) / 1e9, 4),
+            "p90": round(_percentile(prices, 90) / 1e9, 4),
+        },
+        "cost_eth": {
+            "mean": statistics.mean(costs) / 1e18,
+            "p90": _percentile(costs, 90) / 1e18,
+            "total": sum(costs) / 1e18,
+        },
+        "calldata_bytes_mean": round(statistics.mean(calldata), 1),
+        "calldata_gas_share": round(sum(s.calldata_gas for s in samples) / sum(gas), 4) if sum(gas) else 0.0,
+    }
+
+
+class GasProfiler:
+    """
+    Thread-safe collector of per-transaction gas samples.
+
+    Args:
+        history_path: NDJSON file; existing samples are loaded and new ones appended
+        run: Label stored with every new sample (default: start time, UTC)
+    """
+
+    def __init__(self, history_path: Optional[str] = None, run: Optional[str] = None):
+        self.history_path = history_path
+        self.run = run or time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+        self.samples: List[GasSample] = []
+        # Market ID -> court ID, learned from MarketCreatedWithCourt or getMarket
+        self.market_courts: Dict[int, int] = {}
+        self._lock = threading.Lock()
+
+        if history_path and os.path.exists(history_path):
+            self.samples = load_history(history_path)
+
+    def record(self, sample: GasSample):
+        """Add a sample (and append it to the history file)"""
+        if not sample.run:
+            sample.run = self.run
+        with self._lock:
+            self.samples.append(sample)
+            if self.history_path:
+                with open(self.history_path, "a") as f:
+                    f.write(json.dumps(sample.to_dict()) + "\n")
+
+    def observe(
+        self,
+        tx_hash: str,
+        function: str,
+        receipt: Dict,
+        calldata: bytes,
+        tags: Optional[Dict[str, Any]] = None,
+        chain_id: Optional[int] = None
+    ) -> GasSample:
+        """Build a sample from a receipt and record it"""
+        sample = GasSample(
+            tx_hash=tx_hash,
+            function=function,
+            gas_used=int(receipt["gasUsed"]),
+            effective_gas_price=int(receipt.get("effectiveGasPrice") or 0),
+            calldata_bytes=len(calldata),
+            calldata_gas=calldata_gas(calldata),
+            block_number=int(receipt["blockNumber"]),
+            status=int(receipt["status"]),
+            timestamp=time.time(),
+            chain_id=chain_id,
+            tags=dict(tags or {}),
+        )
+        self.record(sample)
+        return sample
+
+    # ==================== REPORTING ====================
+
+    def select(self, function: Optional[str] = None, runs: Optional[Sequence[str]] = None) -> List[GasSample]:
+        with self._lock:
+            samples = list(self.samples)
+        return [
+            s for s in samples
+            if (function is None or s.function == function) and (runs is None or s.run in runs)
+        ]
+
+    def report(
+        self,
+        group_by: Sequence[str] = ("function",),
+        function: Optional[str] = None,
+        runs: Optional[Sequence[str]] = None
+    ) -> List[Dict]:
+        """
+        Percentiles per group.
+
+        Args:
+            group_by: Sample fields or tags to group on (function, run, court_id,
+                selected_judges, ...); a sample missing a tag groups under None
+            function: Only this contract function
+            runs: Only these run labels
+
+        Returns:
+            One row per group, most expensive (total cost) first
+        """
+        groups: Dict[Tuple, List[GasSample]] = {}
+        for s in self.select(function, runs):
+            key = tuple(_field(s, name) for name in group_by)
+            groups.setdefault(key, []).append(s)
+        rows = [{**dict(zip(group_by, key)), **_summary(samples)} for key, samples in groups.items()]
+        return sorted(rows, key=lambda r: -r["cost_eth"]["total"])
+
+    def trend(self, function: Optional[str] = None, bucket: str = "day") -> List[Dict]:
+        """Mean gas and cost per time bucket (hour, day or week), oldest first"""
+        width = BUCKETS[bucket]
+        buckets: Dict[int, List[GasSample]] = {}
+        for s in self.select(function):
+            buckets.setdefault(int(s.timestamp // width) * width, []).append(s)
+        return [
+            {
+                "start": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(start)),
+                "count": len(samples),
+                "gas_used_mean": int(statistics.mean(s.gas_used for s in samples)),
+                "gas_price_gwei_mean": round(statistics.mean(s.effective_gas_price for s in samples) / 1e9, 4),
+                "cost_eth_total": sum(s.cost_wei for s in samples) / 1e18,
+            }
+            for start, samples in sorted(buckets.items())
+        ]
+
+    def compare(self, baseline: str, candidate: str, group_by: Sequence[str] = ("function",)) -> List[Dict]:
+        """
+        Median gas per group in two runs. Gas (not cost) is compared, so gas
+        price changes between the runs do not show up as regressions.
+        """
+        before = {tuple(r[g] for g in group_by): r for r in self.report(group_by, runs=[baseline])}
+        after = {tuple(r[g] for g in group_by): r for r in self.report(group_by, runs=[candidate])}
+        rows = []
+        for key in sorted(set(before) | set(after), key=str):
+            b, a = before.get(key), after.get(key)
+            b_gas = b["gas_used"]["p50"] if b else None
+            a_gas = a["gas_used"]["p50"] if a else None
+            rows.append({
+                **dict(zip(group_by, key)),
+                "baseline_p50": b_gas,
+                "candidate_p50": a_gas,
+                "change_pct": round((a_gas - b_gas) / b_gas * 100, 2) if b_gas and a_gas is not None else None,
+                "baseline_count": b["count"] if b else 0,
+                "candidate_count": a["count"] if a else 0,
+            })
+        return rows
+
+    def runs(self) -> List[str]:
+        """Run labels in history, in first-seen order"""
+        seen: Dict[str, None] = {}
+        for s in self.select():
+            seen.setdefault(s.run, None)
+        return list(seen)
+
+
+def _field(sample: GasSample, name: str) -> Any:
+    if name in sample.tags:
+        return sample.tags[name]
+    return getattr(sample, name, None)
+
+
+def load_history(path: str) -> List[GasSample]:
+    """Samples from an NDJSON history file (malformed lines are skipped)"""
+    samples = []
+    with open(path, "r") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                samples.append(GasSample.from_dict(json.loads(line)))
+            except (ValueError, TypeError):
+                continue
+    return samples
+
+
+def tags_for_call(arg_names: Iterable[str], args: Iterable[Any]) -> Dict[str, Any]:
+    """Tags taken from a contract call's arguments"""
+    return {ARG_TAGS[name]: value for name, value in zip(arg_names, args) if name in ARG_TAGS}
+
+
+def tags_for_events(events: Iterable[Tuple[str, Dict]]) -> Dict[str, Any]:
+    """Tags taken from a receipt's decoded (event name, args) pairs"""
+    tags: Dict[str, Any] = {}
+    for name, args in events:
+        if name in EVENT_TAGS:
+            tags[EVENT_TAGS[name]] = tags.get(EVENT_TAGS[name], 0) + 1
+        elif name == "RewardsDistributed":
+            tags["rewarded_judges"] = args["judgeCount"]
+        elif name == "MarketCreatedWithCourt":
+            tags["court_id"] = args["courtId"]
+            tags["market_id"] = args["marketId"]
+    return tags
+
+
+# ==================== CLI ====================
+
+def _print_report(rows: List[Dict], group_by: Sequence[str]):
+    header = " ".join(f"{g:<22}" for g in group_by)
+    print(f"{header} {'n':>5} {'p50 gas':>10} {'p90 gas':>10} {'p99 gas':>10} {'gwei p50':>9} "
+          f"{'mean ETH':>12} {'total ETH':>12} {'calldata':>9}")
+    for r in rows:
+        key = " ".join(f"{str(r[g]):<22}" for g in group_by)
+        print(f"{key} {r['count']:>5} {r['gas_used']['p50']:>10} {r['gas_used']['p90']:>10} "
+              f"{r['gas_used']['p99']:>10} {r['effective_gas_price_gwei']['p50']:>9} "
+              f"{r['cost_eth']['mean']:>12.8f} {r['cost_eth']['total']:>12.8f} {r['calldata_bytes_mean']:>8}B")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report gas usage from profiler history")
+    parser.add_argument("--history", required=True, help="NDJSON history file written by GasProfiler")
+    parser.add_argument("--group-by", default="function",
+                        help="Comma-separated fields/tags (function, run, court_id, selected_judges, ...)")
+    parser.add_argument("--function", help="Only this contract function")
+    parser.add_argument("--run", action="append", help="Only this run label (repeatable)")
+    parser.add_argument("--compare", nargs=2, metavar=("BASELINE", "CANDIDATE"), help="Compare two runs")
+    parser.add_argument("--trend", nargs="?", const="", metavar="FUNCTION",
+                        help="Cost trend over time (optionally for one function)")
+    parser.add_argument("--bucket", choices=sorted(BUCKETS), default="day", help="Trend bucket (default: day)")
+    parser.add_argument("--max-regression", type=float,
+                        help="With --compare: exit 1 if any group's median gas rose by more than this percent")
+    parser.add_argument("--json", action="store_true", help="Print JSON")
+
+    args = parser.parse_args()
+
+    if not os.path.exists(args.history):
+        print(f"❌ Error: history file not found: {args.history}")
+        sys.exit(1)
+
+    profiler = GasProfiler()
+    profiler.samples = load_history(args.history)
+    group_by = [g.strip() for g in args.group_by.split(",") if g.strip()]
+
+    if args.compare:
+        result = profiler.compare(args.compare[0], args.compare[1], group_by)
+    elif args.trend is not None:
+        result = profiler.trend(args.trend or args.function, args.bucket)
+    else:
+        result = profiler.report(group_by, args.function, args.run)
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        print("\n" + "=" * 60)
+        print(f"⛽ Gas Profile ({len(profiler.samples)} samples, runs: {', '.join(profiler.runs()) or '-'})")
+        print("=" * 60)
+        if args.compare:
+            print(f"{'group':<40} {args.compare[0]:>12} {args.compare[1]:>12} {'change':>9}")
+            for r in result:
+                key = " / ".join(str(r[g]) for g in group_by)
+                change = f"{r['change_pct']:+.2f}%" if r["change_pct"] is not None else "-"
+                print(f"{key:<40} {str(r['baseline_p50']):>12} {str(r['candidate_p50']):>12} {change:>9}")
+        elif args.trend is not None:
+            for r in result:
+                print(f"{r['start']}  {r['count']:>5} txs  {r['gas_used_mean']:>9} gas  "
+                      f"{r['gas_price_gwei_mean']:>9} gwei  {r['cost_eth_total']:.8f} ETH")
+        else:
+            _print_report(result, group_by)
+        print("=" * 60)
+
+    if args.compare and args.max_regression is not None:
+        regressions = [r for r in result if r["change_pct"] is not None and r["change_pct"] > args.max_regression]
+        if regressions:
+            print(f"❌ {len(regressions)} group(s) regressed by more than {args.max_regression}%")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
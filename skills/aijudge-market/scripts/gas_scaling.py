@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+"""
+Gas scaling harness for judge selection and reward distribution
+
+Measures how the contract's loops scale on a LOCAL node:
+  - selectJudgesForMarket   loops over activeJudgesList        -> O(activeJudges)
+  - finalizeResolution      _distributeRewards over selected   -> O(requiredJudges)
+  - resolveChallenge        _slashIncorrectJudges + rewards    -> O(requiredJudges)
+
+Judges are onboarded incrementally up to each count in --judge-counts. Each
+--court-mix entry `court:fraction` puts that fraction of judges into the
+court, so selection is measured at different qualified/active ratios. For
+every grid point the harness records receipt gasUsed, fits a linear curve
+and projects where the block gas limit would be hit.
+
+Transactions are sent with gas = block gas limit so the measurement is not
+capped by the client's default gas limit. Local node requirements are the
+same as load_test.py (mintable mock USDC, anvil cheat RPCs, admin roles).
+
+Usage:
+    python3 gas_scaling.py --contract 0x... --usdc 0x... --judge-counts 10,50,100,200
+    python3 gas_scaling.py --contract 0x... --usdc 0x... --court-mix 0:1.0,1:0.5,7:0.1 --required-judges 3,11,21
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+from typing import Dict, List, Optional, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from load_test import ANVIL_ADMIN_KEY, MINT_ABI, OUTCOME_NO, OUTCOME_YES, Actor
+from aijudge_client import AIJudgeClient
+from web3 import Web3
+
+
+def fit_linear(xs: List[float], ys: List[float]) -> Tuple[float, float, float]:
+    """
+    Least-squares fit y = a + b*x
+
+    Returns:
+        (a, b, r_squared)
+    """
+    n = len(xs)
+    if n == 0:
+        return 0.0, 0.0, 0.0
+    mean_x = sum(xs) / n
+    mean_y = sum(ys) / n
+    sxx = sum((x - mean_x) ** 2 for x in xs)
+    if sxx == 0:
+        return mean_y, 0.0, 0.0
+    sxy = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+    b = sxy / sxx
+    a = mean_y - b * mean_x
+    ss_tot = sum((y - mean_y) ** 2 for y in ys)
+    ss_res = sum((y - (a + b * x)) ** 2 for x, y in zip(xs, ys))
+    r2 = 1 - ss_res / ss_tot if ss_tot > 0 else 1.0
+    return a, b, r2
+
+
+class GasScalingHarness:
+    """Onboards judges step by step and measures gas at each grid point"""
+
+    def __init__(self, args):
+        self.args = args
+        self.mixes = self._parse_mixes(args.court_mix)
+        self.admin = self._actor(args.admin_key)
+        self.challenger = self._actor(self._derive_key("challenger"))
+        self.judges: Dict[str, Actor] = {}
+        self.measurements: List[Dict] = []
+        self.block_gas_limit = self.admin.client.w3.eth.get_block("latest")["gasLimit"]
+
+    @staticmethod
+    def _parse_mixes(spec: str) -> List[Tuple[int, float]]:
+        mixes = []
+        for entry in spec.split(","):
+            court, _, fraction = entry.partition(":")
+            mixes.append((int(court), float(fraction or 1.0)))
+        return mixes
+
+    def _derive_key(self, label: str) -> str:
+        return "0x" + bytes(Web3.keccak(text=f"{self.args.seed}:{label}")).hex()
+
+    def _actor(self, private_key: str) -> Actor:
+        return Actor(AIJudgeClient(
+            private_key=private_key,
+            rpc_url=self.args.rpc_url,
+            contract_address=self.args.contract,
+            usdc_address=self.args.usdc
+        ))
+
+    def _rpc(self, method: str, params: list):
+        return self.admin.client.w3.provider.make_request(method, params)
+
+    def _transact(self, actor: Actor, function) -> Dict:
+        return actor.transact(function, gas=self.block_gas_limit)
+
+    def _measure(self, actor: Actor, function, name: str, **params) -> Optional[Dict]:
+        """Send at the block gas limit and record gasUsed (or the limit being hit)"""
+        with actor.lock:
+            tx_hash = actor.client._send_transaction(function, gas=self.block_gas_limit)
+            receipt = actor.client.wait_for_transaction(tx_hash)
+        exceeded = receipt["status"] != 1 and receipt["gasUsed"] >= self.block_gas_limit * 0.99
+        if receipt["status"] != 1 and not exceeded:
+            raise RuntimeError(f"{name} reverted: {tx_hash}")
+        self.measurements.append({
+            "function": name,
+            "gas_used": receipt["gasUsed"],
+            "exceeded_block_gas_limit": exceeded,
+            **params
+        })
+        return None if exceeded else receipt
+
+    # ==================== SETUP ====================
+
+    def setup(self):
+        contract = self.admin.client.contract
+        stake = contract.functions.getConfig().call()[0]
+        self.stake = stake
+        self._transact(self.admin, contract.functions.setChallengeWindow(1))
+        self._fund(self.challenger, stake * 1000)
+
+    def _fund(self, actor: Actor, usdc_amount: int):
+        self._rpc("anvil_setBalance", [actor.address, hex(10**20)])
+        usdc = self.admin.client.w3.eth.contract(address=self.admin.client.usdc_address, abi=MINT_ABI)
+        self._transact(self.admin, usdc.functions.mint(actor.address, usdc_amount))
+        self._transact(actor, actor.client.usdc.functions.approve(actor.client.contract.address, 2**256 - 1))
+
+    def onboard(self, target: int):
+        """Register judges until `target` accounts exist, joining courts per the mix"""
+        contract = self.admin.client.contract
+        for i in range(len(self.judges), target):
+            judge = self._actor(self._derive_key(f"judge:{i}"))
+            self._fund(judge, self.stake)
+            if contract.functions.getJudge(judge.address).call()[3] == 0:
+                self._transact(judge, contract.functions.registerAsJudge(self.stake))
+            current = judge.client.get_judge()["court_ids"]
+            for court, fraction in self.mixes:
+                in_court = random.Random(f"{self.args.seed}:{i}:{court}").random() < fraction
+                if court != 0 and in_court and court not in current:
+                    self._transact(judge, judge.client.contract.functions.joinCourt(court))
+            self.judges[judge.address] = judge
+
+    # ==================== MEASUREMENT ====================
+
+    def _create_and_select(self, court: int, required: int, params: Dict) -> Optional[int]:
+        contract = self.admin.client.contract
+        now = self.admin.client.w3.eth.get_block("latest")["timestamp"]
+        receipt = self._transact(self.admin, contract.functions.createMarket(
+            "Gas scaling market", now + 3600, required, court
+        ))
+        market_id = contract.events.MarketCreatedWithCourt().process_receipt(receipt)[0]["args"]["marketId"]
+        if self._measure(self.admin, contract.functions.selectJudgesForMarket(market_id),
+                         "selectJudgesForMarket", **params) is None:
+            return None
+        return market_id
+
+    def _vote(self, market_id: int, yes_count: int) -> bool:
+        """
+        Commit and reveal: the first `yes_count` selected judges vote YES, the
+        rest NO. Returns False without voting if a selected judge was not
+        onboarded by this harness (e.g. left over on a reused node).
+        """
+        selected = self.admin.client.get_selected_judges(market_id)
+        unknown = [address for address in selected if address not in self.judges]
+        if unknown:
+            print(f"   ⏭️  market {market_id}: {len(unknown)} of {len(selected)} selected judges "
+                  f"were not onboarded by this run, skipping")
+            return False
+        for i, address in enumerate(selected):
+            judge = self.judges[address]
+            outcome = OUTCOME_YES if i < yes_count else OUTCOME_NO
+            salt = os.urandom(32)
+            commit_hash = Web3.solidity_keccak(["uint8", "bytes32"], [outcome, salt])
+            self._transact(judge, judge.client.contract.functions.commitVote(market_id, commit_hash))
+            self._transact(judge, judge.client.contract.functions.revealVote(
+                market_id, outcome, salt, b"\x00" * 32, b"\x00" * 32
+            ))
+        return True
+
+    def _warp_past_deadline(self, market_id: int):
+        deadline = self.admin.client.get_market(market_id)["challenge_deadline"]
+        now = self.admin.client.w3.eth.get_block("latest")["timestamp"]
+        if now <= deadline:
+            self._rpc("evm_increaseTime", [deadline - now + 1])
+            self._rpc("evm_mine", [])
+
+    def _reinstate_suspended(self, receipt: Dict):
+        """Keep the active set stable: slashing can suspend repeat offenders"""
+        contract = self.admin.client.contract
+        for event in contract.events.JudgeSuspended().process_receipt(receipt):
+            self._transact(self.admin, contract.functions.reinstateSuspendedJudge(event["args"]["judge"]))
+
+    def measure_point(self, court: int, fraction: float, required: int):
+        contract = self.admin.client.contract
+        active = contract.functions.getActiveJudgesCount().call()
+        qualified = contract.functions.getCourtJudgesCount(court).call()
+        if qualified < required:
+            print(f"   ⏭️  court {court}: {qualified} qualified < {required} required, skipping")
+            return
+        params = {
+            "active_judges": active,
+            "qualified_judges": qualified,
+            "court_id": court,
+            "court_fraction": fraction,
+            "required_judges": required,
+        }
+
+        # Unanimous market -> finalizeResolution measures _distributeRewards alone
+        market_id = self._create_and_select(court, required, params)
+        if market_id is None or self.args.skip_rewards:
+            return
+        if self._vote(market_id, yes_count=required):
+            self._warp_past_deadline(market_id)
+            self._measure(self.admin, contract.functions.finalizeResolution(market_id),
+                          "finalizeResolution", **params)
+
+        # Split market overturned by a challenge -> _slashIncorrectJudges on the
+        # majority plus USDC rewards for the minority in _distributeRewards
+        market_id = self._create_and_select(court, required, params)
+        if market_id is None or not self._vote(market_id, yes_count=required // 2 + 1):
+            return
+        self._transact(self.challenger, self.challenger.client.contract.functions.challengeResolution(
+            market_id, OUTCOME_NO
+        ))
+        receipt = self._measure(self.admin, contract.functions.resolveChallenge(market_id, True),
+                                "resolveChallenge", **params)
+        if receipt is not None:
+            self._reinstate_suspended(receipt)
+
+    def run(self):
+        for count in sorted(int(c) for c in self.args.judge_counts.split(",")):
+            print(f"\n👥 Onboarding up to {count} judges...")
+            self.onboard(count)
+            for court, fraction in self.mixes:
+                for required in sorted(int(r) for r in self.args.required_judges.split(",")):
+                    print(f"   📏 court {court} ({fraction:.0%}) | requiredJudges {required}")
+                    self.measure_point(court, fraction, required)
+
+    # ==================== ANALYSIS ====================
+
+    def analyse(self) -> Dict:
+        """Fit gas curves and project where each hits the block gas limit"""
+        limit = self.block_gas_limit
+        curves = []
+
+        # Selection scales with the active list for a given court mix and requiredJudges
+        groups: Dict[Tuple, List[Dict]] = {}
+        for m in self.measurements:
+            if m["function"] == "selectJudgesForMarket":
+                groups.setdefault((m["court_id"], m["required_judges"]), []).append(m)
+        for (court, required), rows in sorted(groups.items()):
+            curves.append(self._curve("selectJudgesForMarket", "active_judges", rows, limit,
+                                      court_id=court, required_judges=required))
+
+        # Reward distribution and slashing scale with the selected judge count
+        for name in ("finalizeResolution", "resolveChallenge"):
+            rows = [m for m in self.measurements if m["function"] == name]
+            if rows:
+                curves.append(self._curve(name, "required_judges", rows, limit))
+
+        return {
+            "block_gas_limit": limit,
+            "measurements": self.measurements,
+            "curves": curves,
+        }
+
+    @staticmethod
+    def _curve(name: str, x_key: str, rows: List[Dict], limit: int, **labels) -> Dict:
+        ok = [r for r in rows if not r["exceeded_block_gas_limit"]]
+        a, b, r2 = fit_linear([r[x_key] for r in ok], [r["gas_used"] for r in ok])
+        exceeded = [r[x_key] for r in rows if r["exceeded_block_gas_limit"]]
+        projected = int((limit - a) / b) if b > 0 else None
+        return {
+            "function": name,
+            "x": x_key,
+            **labels,
+            "intercept": round(a),
+            "gas_per_unit": round(b, 1),
+            "r_squared": round(r2, 4),
+            "projected_limit_at": projected,
+            "first_measured_exceed": min(exceeded) if exceeded else None,
+        }
+
+
+def print_report(report: Dict):
+    print("\n" + "=" * 72)
+    print(f"⛽ Gas Scaling Report (block gas limit {report['block_gas_limit']:,})")
+    print("=" * 72)
+    for c in report["curves"]:
+        label = c["function"]
+        if "court_id" in c:
+            label += f" [court {c['court_id']}, R={c['required_judges']}]"
+        print(f"\n{label}")
+        print(f"   gas ≈ {c['intercept']:,} + {c['gas_per_unit']:,} × {c['x']}  (R² {c['r_squared']})")
+        if c["first_measured_exceed"] is not None:
+            print(f"   ❌ Block gas limit hit at {c['x']} = {c['first_measured_exceed']}")
+        elif c["projected_limit_at"] is not None:
+            print(f"   ⚠️  Projected to hit block gas limit at {c['x']} ≈ {c['projected_limit_at']:,}")
+    print("=" * 72)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure gas scaling of selection and reward loops")
+    parser.add_argument("--rpc-url", default="http://127.0.0.1:8545", help="Local node RPC endpoint")
+    parser.add_argument("--contract", help="AIJudgeMarket proxy address (or set CONTRACT_ADDRESS env var)")
+    parser.add_argument("--usdc", help="Mintable mock USDC address (or set USDC_ADDRESS env var)")
+    parser.add_argument("--admin-key", help="Admin/manager private key (default: anvil account #0)")
+    parser.add_argument("--judge-counts", default="10,25,50,100",
+                       help="Comma-separated active judge counts (default: 10,25,50,100)")
+    parser.add_argument("--court-mix", default="0:1.0",
+                       help="Comma-separated court:fraction pairs (default: 0:1.0)")
+    parser.add_argument("--required-judges", default="3,7,11",
+                       help="Comma-separated requiredJudges values (default: 3,7,11)")
+    parser.add_argument("--skip-rewards", action="store_true",
+                       help="Only measure selection (skip finalize/challenge runs)")
+    parser.add_argument("--seed", default="aijudge-gas", help="Seed for judge accounts and court mix")
+    parser.add_argument("--output", help="Write the JSON report to this file")
+
+    args = parser.parse_args()
+
+    args.contract = args.contract or os.environ.get("CONTRACT_ADDRESS")
+    args.usdc = args.usdc or os.environ.get("USDC_ADDRESS")
+    args.admin_key = args.admin_key or os.environ.get("PRIVATE_KEY") or ANVIL_ADMIN_KEY
+
+    if not args.contract or not args.usdc:
+        print("❌ Error: Contract and mock USDC addresses required")
+        sys.exit(1)
+
+    print("⛽ AIJudgeMarket Gas Scaling Harness")
+    print("=" * 50)
+    print(f"Node: {args.rpc_url}")
+    print(f"Judge counts: {args.judge_counts}")
+    print(f"Court mix: {args.court_mix}")
+    print(f"Required judges: {args.required_judges}")
+    print("=" * 50)
+
+    try:
+        harness = GasScalingHarness(args)
+        harness.setup()
+        harness.run()
+        report = harness.analyse()
+    except KeyboardInterrupt:
+        print("\n\n👋 Stopped")
+        sys.exit(1)
+    except Exception as e:
+        print(f"\n❌ Error: {e}")
+        sys.exit(1)
+
+    print_report(report)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Report saved to: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,7 @@ Get judge information from AIJudgeMarket
 Usage:
     python3 get_judge.py
     python3 get_judge.py --address 0x...
+    python3 get_judge.py --addresses-from judges.txt > judges.ndjson  # Bulk NDJSON
 """
 
 import argparse
@@ -13,6 +14,7 @@ import sys
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from aijudge_client import AIJudgeClient
+from bulk import add_bulk_arguments, read_keys, stream_ndjson
 
 
 def main():
@@ -22,6 +24,7 @@ def main():
     parser.add_argument("--rpc-url", default="https://sepolia.base.org",
                        help="RPC endpoint")
     parser.add_argument("--contract", help="Contract address")
+    add_bulk_arguments(parser, "--addresses-from", "Read judge addresses from FILE")
     
     args = parser.parse_args()
     
@@ -29,12 +32,12 @@ def main():
     contract_address = args.contract or os.environ.get("CONTRACT_ADDRESS")
     
     if not contract_address:
-        print("❌ Error: Contract address required")
+        print("❌ Error: Contract address required", file=sys.stderr)
         sys.exit(1)
     
     # Use dummy key for read-only if not provided
     if not private_key:
-        private_key = "0x" + "00" * 32
+        private_key = AIJudgeClient.READ_ONLY_KEY
     
     court_names = [
         "General", "Finance", "Sports", "Politics",
@@ -48,6 +51,18 @@ def main():
             contract_address=contract_address
         )
         
+        if args.addresses_from:
+            from rate_limiter import Priority
+
+            def fetch(address):
+                with client.priority(Priority.BULK):
+                    return client.get_judge(client.w3.to_checksum_address(address))
+
+            counts = stream_ndjson(read_keys(args.addresses_from, str), fetch, 'address',
+                                   batch_size=args.batch_size, workers=args.workers)
+            print(f"✅ {counts['records']} judges, {counts['errors']} errors", file=sys.stderr)
+            return
+        
         target_address = args.address or client.address
         
         judge_info = client.get_judge(target_address)
@@ -67,7 +82,7 @@ def main():
         print("=" * 60)
         
     except Exception as e:
-        print(f"\n❌ Error: {e}")
+        print(f"\n❌ Error: {e}", file=sys.stderr)
         import traceback
         traceback.print_exc()
         sys.exit(1)
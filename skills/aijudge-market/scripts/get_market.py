@@ -5,6 +5,7 @@ Get market details from AIJudgeMarket
 Usage:
     python3 get_market.py --market-id 0
     python3 get_market.py --market-id 0 --watch  # Poll for updates
+    seq 0 99 | python3 get_market.py --ids-from - > markets.ndjson  # Bulk NDJSON
 """
 
 import argparse
@@ -15,6 +16,7 @@ from datetime import datetime
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from aijudge_client import AIJudgeClient
+from bulk import add_bulk_arguments, read_keys, stream_ndjson
 
 
 def format_market_info(market: dict, court_names: list) -> str:
@@ -48,7 +50,7 @@ def format_market_info(market: dict, court_names: list) -> str:
 
 def main():
     parser = argparse.ArgumentParser(description="Get market details")
-    parser.add_argument("--market-id", type=int, required=True, help="Market ID")
+    parser.add_argument("--market-id", type=int, help="Market ID")
     parser.add_argument("--private-key", help="Private key (optional for read-only)")
     parser.add_argument("--rpc-url", default="https://sepolia.base.org",
                        help="RPC endpoint")
@@ -57,19 +59,24 @@ def main():
                        help="Poll for updates every 10 seconds")
     parser.add_argument("--selected-judges", action="store_true",
                        help="Also show selected judges")
+    add_bulk_arguments(parser, "--ids-from", "Read market IDs (or ranges like 0-99) from FILE")
     
     args = parser.parse_args()
     
+    if (args.market_id is None) == (args.ids_from is None):
+        print("❌ Error: Use exactly one of --market-id or --ids-from", file=sys.stderr)
+        sys.exit(1)
+    
     private_key = args.private_key or os.environ.get("PRIVATE_KEY")
     contract_address = args.contract or os.environ.get("CONTRACT_ADDRESS")
     
     if not contract_address:
-        print("❌ Error: Contract address required")
+        print("❌ Error: Contract address required", file=sys.stderr)
         sys.exit(1)
     
     # Use dummy key for read-only if not provided
     if not private_key:
-        private_key = "0x" + "00" * 32  # Dummy key for view functions
+        private_key = AIJudgeClient.READ_ONLY_KEY  # Placeholder key for view functions
     
     court_names = [
         "General", "Finance", "Sports", "Politics",
@@ -83,7 +90,21 @@ def main():
             contract_address=contract_address
         )
         
-        if args.watch:
+        if args.ids_from:
+            from rate_limiter import Priority
+
+            def fetch(market_id):
+                # Bulk scans yield to time-critical requests when rate limited
+                with client.priority(Priority.BULK):
+                    market = client.get_market(market_id)
+                    if args.selected_judges:
+                        market['selected_judges'] = client.get_selected_judges(market_id)
+                return market
+
+            counts = stream_ndjson(read_keys(args.ids_from, int), fetch, 'market_id',
+                                   batch_size=args.batch_size, workers=args.workers)
+            print(f"✅ {counts['records']} markets, {counts['errors']} errors", file=sys.stderr)
+        elif args.watch:
             print(f"👀 Watching market {args.market_id} for updates...")
             print("Press Ctrl+C to stop\n")
             
@@ -117,7 +138,7 @@ def main():
     except KeyboardInterrupt:
         print("\n\n👋 Stopped watching")
     except Exception as e:
-        print(f"\n❌ Error: {e}")
+        print(f"\n❌ Error: {e}", file=sys.stderr)
         import traceback
         traceback.print_exc()
         sys.exit(1)
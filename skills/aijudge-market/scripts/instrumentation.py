@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+AIJudgeMarket Client Instrumentation
+Latency histograms, call counts, payload sizes and error classes per
+JSON-RPC method, per contract function and per client phase (ABI encoding,
+signing).
+
+Example:
+    metrics = Instrumentation()
+    metrics.add_callback(lambda event: print(event))
+
+    client = AIJudgeClient(..., instrumentation=metrics)
+    client.get_market(0)
+
+    print(metrics.render_prometheus())
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+from web3 import HTTPProvider
+
+# Latency buckets in seconds (upper bounds, Prometheus style)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Label name used for the `name` of each event kind
+KIND_LABELS = {
+    "rpc": "method",         # JSON-RPC method (eth_call, eth_sendRawTransaction, ...)
+    "contract": "function",  # Contract function (getMarket, commitVote, ...)
+    "phase": "phase",        # Client-side work (encode, sign)
+}
+
+
+@dataclass
+class CallEvent:
+    """A single timed operation passed to callbacks"""
+    kind: str  # rpc, contract, phase
+    name: str
+    duration: float
+    endpoint: str = ""
+    request_bytes: int = 0
+    response_bytes: int = 0
+    error: Optional[str] = None
+
+
+@dataclass
+class CallStats:
+    """Aggregated statistics for one (kind, name, endpoint) series"""
+    buckets: Tuple[float, ...]
+    bucket_counts: List[int] = field(default_factory=list)
+    count: int = 0
+    total_seconds: float = 0.0
+    request_bytes: int = 0
+    response_bytes: int = 0
+    errors: Dict[str, int] = field(default_factory=dict)
+
+    def __post_init__(self):
+        if not self.bucket_counts:
+            self.bucket_counts = [0] * len(self.buckets)
+
+    def observe(self, event: CallEvent):
+        self.count += 1
+        self.total_seconds += event.duration
+        self.request_bytes += event.request_bytes
+        self.response_bytes += event.response_bytes
+        for i, bound in enumerate(self.buckets):
+            if event.duration <= bound:
+                self.bucket_counts[i] += 1
+                break
+        if event.error:
+            self.errors[event.error] = self.errors.get(event.error, 0) + 1
+
+
+class Instrumentation:
+    """
+    Thread-safe collector for client timing events.
+
+    Events are aggregated into histograms and forwarded to any registered
+    callbacks. A callback that raises is ignored so exporters can never break
+    the client.
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._stats: Dict[Tuple[str, str, str], CallStats] = {}
+        self._callbacks: List[Callable[[CallEvent], None]] = []
+        self._lock = threading.Lock()
+
+    def add_callback(self, callback: Callable[[CallEvent], None]):
+        """Register a callback invoked with every CallEvent"""
+        self._callbacks.append(callback)
+
+    def record(self, event: CallEvent):
+        """Aggregate an event and forward it to callbacks"""
+        key = (event.kind, event.name, event.endpoint)
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = CallStats(self.buckets)
+            stats.observe(event)
+        for callback in self._callbacks:
+            try:
+                callback(event)
+            except Exception:
+                pass
+
+    @contextmanager
+    def span(self, kind: str, name: str, endpoint: str = ""):
+        """Time a block of work and record it, including the exception class on failure"""
+        start = time.perf_counter()
+        error = None
+        try:
+            yield
+        except Exception as e:
+            error = type(e).__name__
+            raise
+        finally:
+            self.record(CallEvent(
+                kind=kind,
+                name=name,
+                duration=time.perf_counter() - start,
+                endpoint=endpoint,
+                error=error
+            ))
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """Return a plain-dict copy of all series, keyed by 'kind:name[@endpoint]'"""
+        with self._lock:
+            result = {}
+            for (kind, name, endpoint), s in self._stats.items():
+                key = f"{kind}:{name}" + (f"@{endpoint}" if endpoint else "")
+                result[key] = {
+                    "count": s.count,
+                    "total_seconds": s.total_seconds,
+                    "mean_seconds": s.total_seconds / s.count if s.count else 0.0,
+                    "request_bytes": s.request_bytes,
+                    "response_bytes": s.response_bytes,
+                    "errors": dict(s.errors),
+                }
+            return result
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+
+    def render_prometheus(self, prefix: str = "aijudge") -> str:
+        """Render all series in the Prometheus text exposition format"""
+        with self._lock:
+            items = sorted(self._stats.items())
+
+        lines = []
+        for kind in KIND_LABELS:
+            series = [(k, s) for k, s in items if k[0] == kind]
+            if not series:
+                continue
+            label = KIND_LABELS[kind]
+            base = f"{prefix}_{kind}"
+
+            lines.append(f"# HELP {base}_duration_seconds Latency of {kind} operations")
+            lines.append(f"# TYPE {base}_duration_seconds histogram")
+            for (_, name, endpoint), s in series:
+                labels = _labels(label, name, endpoint)
+                cumulative = 0
+                for bound, n in zip(s.buckets, s.bucket_counts):
+                    cumulative += n
+                    lines.append(f'{base}_duration_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+                lines.append(f'{base}_duration_seconds_bucket{{{labels},le="+Inf"}} {s.count}')
+                lines.append(f"{base}_duration_seconds_sum{{{labels}}} {s.total_seconds:.6f}")
+                lines.append(f"{base}_duration_seconds_count{{{labels}}} {s.count}")
+
+            if kind == "rpc":
+                for metric, attr in (("request_bytes", "request_bytes"), ("response_bytes", "response_bytes")):
+                    lines.append(f"# HELP {base}_{metric}_total Total JSON-RPC {metric.replace('_', ' ')}")
+                    lines.append(f"# TYPE {base}_{metric}_total counter")
+                    for (_, name, endpoint), s in series:
+                        lines.append(f"{base}_{metric}_total{{{_labels(label, name, endpoint)}}} {getattr(s, attr)}")
+
+            lines.append(f"# HELP {base}_errors_total Failed {kind} operations by error class")
+            lines.append(f"# TYPE {base}_errors_total counter")
+            for (_, name, endpoint), s in series:
+                for error, n in sorted(s.errors.items()):
+                    labels = _labels(label, name, endpoint)
+                    lines.append(f'{base}_errors_total{{{labels},error="{_escape(error)}"}} {n}')
+
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(label: str, name: str, endpoint: str) -> str:
+    parts = [f'{label}="{_escape(name)}"']
+    if endpoint:
+        parts.append(f'endpoint="{_escape(endpoint)}"')
+    return ",".join(parts)
+
+
+class InstrumentedHTTPProvider(HTTPProvider):
+    """
+    HTTPProvider that records every JSON-RPC request into an Instrumentation.
+
+    Payload sizes are the exact bytes put on and read off the wire, taken
+    from the provider's own encode/decode step rather than re-serialized.
+    """
+
+    def __init__(self, endpoint_uri: str, instrumentation: Instrumentation, **kwargs):
+        super().__init__(endpoint_uri, **kwargs)
+        self.instrumentation = instrumentation
+        self._sizes = threading.local()
+
+    def encode_rpc_request(self, method, params) -> bytes:
+        request_data = super().encode_rpc_request(method, params)
+        self._sizes.request = len(request_data)
+        return request_data
+
+    def decode_rpc_response(self, raw_response: bytes):
+        self._sizes.response = len(raw_response)
+        return super().decode_rpc_response(raw_response)
+
+    def make_request(self, method, params):
+        self._sizes.request = self._sizes.response = 0
+        start = time.perf_counter()
+        error = None
+        try:
+            response = super().make_request(method, params)
+            if isinstance(response, dict) and response.get("error"):
+                code = response["error"].get("code", "unknown") if isinstance(response["error"], dict) else "unknown"
+                error = f"rpc:{code}"
+            return response
+        except Exception as e:
+            error = type(e).__name__
+            raise
+        finally:
+            self.instrumentation.record(CallEvent(
+                kind="rpc",
+                name=str(method),
+                duration=time.perf_counter() - start,
+                endpoint=str(self.endpoint_uri),
+                request_bytes=self._sizes.request,
+                response_bytes=self._sizes.response,
+                error=error
+            ))
@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+"""
+AIJudgeMarket Local IPFS CIDs
+Computes the IPFS CIDs of evidence and rationale files without an IPFS
+daemon, and the bytes32 form revealVote stores (the sha256 digest of the CID).
+
+Two CIDs per file, both streamed in fixed-size chunks:
+- root: the UnixFS DAG root `ipfs add --cid-version=1` returns (256 KiB raw
+  leaves, balanced dag-pb tree of up to 174 links per node), so the bytes32
+  can be resolved back to a CID that gateways serve
+- raw: CIDv1 raw-sha256 of the whole file, i.e. plain sha256(file), the
+  evidence hash the SP1 programs commit
+
+evidence_bytes32 returns the raw bytes32 by default, so a reveal matches the
+proofs. For files of one chunk (256 KiB or less) both are the same digest.
+
+Example:
+    python3 ipfs_cid.py evidence.pdf rationale.md
+    python3 ipfs_cid.py --recursive evidence/ --json
+    python3 ipfs_cid.py --to-bytes32 bafybeig...
+    python3 ipfs_cid.py --from-bytes32 0x... --codec dag-pb
+"""
+
+import argparse
+import base64
+import hashlib
+import json
+import os
+import sys
+from dataclasses import dataclass
+from typing import BinaryIO, Iterator, List, Tuple, Union
+
+RAW_CODEC = 0x55
+DAG_PB_CODEC = 0x70
+SHA2_256 = 0x12
+CODECS = {"raw": RAW_CODEC, "dag-pb": DAG_PB_CODEC}
+# What an evidence file's bytes32 is taken from (see FileCIDs.cid)
+HASHES = ("raw", "unixfs")
+
+# Kubo's defaults for `ipfs add` (size-262144 chunker, balanced layout)
+DEFAULT_CHUNK_SIZE = 262144
+DEFAULT_MAX_LINKS = 174
+
+UNIXFS_FILE = 2
+
+BASE58_ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+
+
+# ==================== ENCODING ====================
+
+def _varint(n: int) -> bytes:
+    out = bytearray()
+    while True:
+        byte = n & 0x7F
+        n >>= 7
+        out.append(byte | 0x80 if n else byte)
+        if not n:
+            return bytes(out)
+
+
+def _read_varint(data: bytes, offset: int) -> Tuple[int, int]:
+    value = shift = 0
+    while True:
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return value, offset
+        shift += 7
+
+
+def _uint_field(number: int, value: int) -> bytes:
+    """Protobuf varint field"""
+    return _varint(number << 3) + _varint(value)
+
+
+def _bytes_field(number: int, value: bytes) -> bytes:
+    """Protobuf length-delimited field"""
+    return _varint(number << 3 | 2) + _varint(len(value)) + value
+
+
+def _b58encode(data: bytes) -> str:
+    n = int.from_bytes(data, "big")
+    out = ""
+    while n:
+        n, r = divmod(n, 58)
+        out = BASE58_ALPHABET[r] + out
+    return "1" * (len(data) - len(data.lstrip(b"\x00"))) + out
+
+
+def _b58decode(text: str) -> bytes:
+    n = 0
+    for char in text:
+        n = n * 58 + BASE58_ALPHABET.index(char)
+    body = n.to_bytes((n.bit_length() + 7) // 8, "big")
+    return b"\x00" * (len(text) - len(text.lstrip("1"))) + body
+
+
+@dataclass(frozen=True)
+class CID:
+    """A sha2-256 CID (v0 is always dag-pb)"""
+    version: int
+    codec: int
+    digest: bytes
+
+    @property
+    def multihash(self) -> bytes:
+        return bytes([SHA2_256, 32]) + self.digest
+
+    def to_bytes(self) -> bytes:
+        """Binary CID, as it appears in dag-pb links"""
+        if self.version == 0:
+            return self.multihash
+        return _varint(1) + _varint(self.codec) + self.multihash
+
+    def __str__(self) -> str:
+        if self.version == 0:
+            return _b58encode(self.multihash)
+        return "b" + base64.b32encode(self.to_bytes()).decode().lower().rstrip("=")
+
+    @property
+    def bytes32(self) -> str:
+        """0x-prefixed digest, the form revealVote stores"""
+        return "0x" + self.digest.hex()
+
+    @classmethod
+    def parse(cls, text: str) -> "CID":
+        """CIDv0 (Qm...) or base32 CIDv1 (b...)"""
+        if text.startswith("Qm"):
+            multihash = _b58decode(text)
+            version, codec = 0, DAG_PB_CODEC
+        elif text.startswith("b"):
+            data = base64.b32decode(text[1:].upper() + "=" * (-len(text[1:]) % 8))
+            version, offset = _read_varint(data, 0)
+            codec, offset = _read_varint(data, offset)
+            multihash = data[offset:]
+        else:
+            raise ValueError(f"Unsupported CID encoding: {text[:8]}... (expected Qm... or b...)")
+        if multihash[:2] != bytes([SHA2_256, 32]) or len(multihash) != 34:
+            raise ValueError(f"{text} is not a sha2-256 CID; it has no bytes32 form")
+        return cls(version, codec, multihash[2:])
+
+    @classmethod
+    def from_bytes32(cls, value: Union[str, bytes], codec: str = "dag-pb", version: int = 1) -> "CID":
+        """CID for a stored bytes32 (the codec is not stored on-chain)"""
+        if isinstance(value, str):
+            value = bytes.fromhex(value[2:] if value.startswith("0x") else value)
+        if len(value) != 32:
+            raise ValueError(f"Expected 32 bytes, got {len(value)}")
+        if version == 0 and codec != "dag-pb":
+            raise ValueError("CIDv0 is always dag-pb")
+        return cls(version, CODECS[codec], bytes(value))
+
+
+# ==================== UNIXFS DAG ====================
+
+@dataclass
+class _Link:
+    cid: CID
+    tsize: int  # bytes of the block and everything below it
+    filesize: int  # file content bytes below it
+
+
+def _file_node(children: List[_Link]) -> _Link:
+    """dag-pb UnixFS file node over children (links are encoded before data)"""
+    filesize = sum(child.filesize for child in children)
+    data = _uint_field(1, UNIXFS_FILE) + _uint_field(3, filesize)
+    data += b"".join(_uint_field(4, child.filesize) for child in children)
+    node = b"".join(
+        _bytes_field(2, _bytes_field(1, child.cid.to_bytes()) + _bytes_field(2, b"") + _uint_field(3, child.tsize))
+        for child in children
+    ) + _bytes_field(1, data)
+    return _Link(CID(1, DAG_PB_CODEC, hashlib.sha256(node).digest()),
+                 len(node) + sum(child.tsize for child in children), filesize)
+
+
+def _read_chunks(stream: BinaryIO, chunk_size: int) -> Iterator[memoryview]:
+    """Full chunk_size chunks (the last may be short) from one reused buffer"""
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+    while True:
+        filled = 0
+        while filled < chunk_size:
+            n = stream.readinto(view[filled:])
+            if not n:
+                break
+            filled += n
+        if not filled:
+            return
+        yield view[:filled]
+        if filled < chunk_size:
+            return
+
+
+@dataclass
+class FileCIDs:
+    """CIDs of one file"""
+    path: str
+    size: int
+    root: CID  # UnixFS DAG root, as `ipfs add --cid-version=1`
+    raw: CID  # CIDv1 raw of the whole file
+    leaves: int
+
+    def to_dict(self) -> dict:
+        return {
+            "path": self.path,
+            "size": self.size,
+            "cid": str(self.root),
+            "bytes32": self.root.bytes32,
+            "raw_cid": str(self.raw),
+            "raw_bytes32": self.raw.bytes32,
+            "leaves": self.leaves,
+        }
+
+    def cid(self, kind: str = "raw") -> CID:
+        """CID revealVote's bytes32 is taken from: "raw" or "unixfs" (the root)"""
+        if kind not in HASHES:
+            raise ValueError(f"unknown hash {kind!r}, expected one of {', '.join(HASHES)}")
+        return self.raw if kind == "raw" else self.root
+
+
+def stream_cids(
+    stream: BinaryIO,
+    path: str = "-",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_links: int = DEFAULT_MAX_LINKS
+) -> FileCIDs:
+    """
+    CIDs of a binary stream, read once in chunk_size chunks. Only one
+    32-byte digest per chunk is kept in memory.
+    """
+    whole = hashlib.sha256()
+    links: List[_Link] = []
+    for chunk in _read_chunks(stream, chunk_size):
+        whole.update(chunk)
+        links.append(_Link(CID(1, RAW_CODEC, hashlib.sha256(chunk).digest()), len(chunk), len(chunk)))
+    if not links:
+        # An empty file is a single empty raw leaf
+        links.append(_Link(CID(1, RAW_CODEC, hashlib.sha256(b"").digest()), 0, 0))
+    leaves = len(links)
+
+    # Balanced layout: full nodes of max_links, filled left to right, all leaves at one depth
+    while len(links) > 1:
+        links = [_file_node(links[i:i + max_links]) for i in range(0, len(links), max_links)]
+
+    return FileCIDs(path=path, size=links[0].filesize, root=links[0].cid,
+                    raw=CID(1, RAW_CODEC, whole.digest()), leaves=leaves)
+
+
+def file_cids(path: str, chunk_size: int = DEFAULT_CHUNK_SIZE, max_links: int = DEFAULT_MAX_LINKS) -> FileCIDs:
+    """CIDs of a file ('-' for stdin)"""
+    if path == "-":
+        return stream_cids(sys.stdin.buffer, path, chunk_size, max_links)
+    with open(path, "rb") as f:
+        return stream_cids(f, path, chunk_size, max_links)
+
+
+def evidence_bytes32(path: str, kind: str = "raw") -> str:
+    """bytes32 for revealVote's evidenceHash / rationaleHash from a file"""
+    return file_cids(path).cid(kind).bytes32
+
+
+def directory_cids(
+    directory: str,
+    recursive: bool = False,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_links: int = DEFAULT_MAX_LINKS
+) -> Iterator[FileCIDs]:
+    """CIDs of every file in a directory, in sorted path order"""
+    if recursive:
+        paths = sorted(os.path.join(root, name) for root, _, names in os.walk(directory) for name in names)
+    else:
+        paths = sorted(entry.path for entry in os.scandir(directory) if entry.is_file())
+    for path in paths:
+        yield file_cids(path, chunk_size, max_links)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compute IPFS CIDs and bytes32 hashes locally")
+    parser.add_argument("paths", nargs="*", help="Files or directories ('-' for stdin)")
+    parser.add_argument("--recursive", "-r", action="store_true", help="Descend into subdirectories")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                       help=f"UnixFS chunk size (default: {DEFAULT_CHUNK_SIZE}, as ipfs add)")
+    parser.add_argument("--max-links", type=int, default=DEFAULT_MAX_LINKS,
+                       help=f"Links per DAG node (default: {DEFAULT_MAX_LINKS}, as ipfs add)")
+    parser.add_argument("--json", action="store_true", help="One JSON object per file")
+    parser.add_argument("--to-bytes32", metavar="CID", help="Print the bytes32 of a CID")
+    parser.add_argument("--from-bytes32", metavar="HEX", help="Print the CID of a stored bytes32")
+    parser.add_argument("--codec", choices=list(CODECS), default="dag-pb",
+                       help="Codec for --from-bytes32 (default: dag-pb, as ipfs add for files over one chunk)")
+
+    args = parser.parse_args()
+
+    try:
+        if args.to_bytes32:
+            print(CID.parse(args.to_bytes32).bytes32)
+            return
+        if args.from_bytes32:
+            print(CID.from_bytes32(args.from_bytes32, args.codec))
+            return
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    if not args.paths:
+        parser.print_help()
+        return
+
+    for path in args.paths:
+        if path != "-" and os.path.isdir(path):
+            results = directory_cids(path, args.recursive, args.chunk_size, args.max_links)
+        else:
+            results = [file_cids(path, args.chunk_size, args.max_links)]
+        for result in results:
+            if args.json:
+                print(json.dumps(result.to_dict()), flush=True)
+            else:
+                print(f"{result.path}")
+                print(f"  CID:     {result.root}  ({result.size:,} bytes, {result.leaves} chunks)")
+                print(f"  bytes32: {result.root.bytes32}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,7 @@ List all available sub-courts on AIJudgeMarket
 
 Usage:
     python3 list_courts.py
+    python3 list_courts.py --ndjson  # One JSON object per court
 """
 
 import argparse
@@ -12,31 +13,26 @@ import sys
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from aijudge_client import AIJudgeClient
+from bulk import to_json
 
 
 def main():
     parser = argparse.ArgumentParser(description="List all available courts")
+    # Court names are off-chain; these are accepted for compatibility but not needed
     parser.add_argument("--rpc-url", default="https://sepolia.base.org",
-                       help="RPC endpoint")
-    parser.add_argument("--contract", help="Contract address")
+                       help="RPC endpoint (unused)")
+    parser.add_argument("--contract", help="Contract address (unused)")
+    parser.add_argument("--ndjson", action="store_true", help="Machine-readable output, one court per line")
     
     args = parser.parse_args()
     
-    contract_address = args.contract or os.environ.get("CONTRACT_ADDRESS")
-    
-    if not contract_address:
-        print("❌ Error: Contract address required")
-        sys.exit(1)
-    
     try:
-        # Use dummy key for read-only
-        client = AIJudgeClient(
-            private_key="0x" + "00" * 32,
-            rpc_url=args.rpc_url,
-            contract_address=contract_address
-        )
+        courts = [{'id': i, 'name': n} for i, n in AIJudgeClient.COURT_NAMES.items()]
         
-        courts = client.get_all_courts()
+        if args.ndjson:
+            for court in courts:
+                print(to_json(court))
+            return
         
         print("\n" + "=" * 60)
         print("⚖️  Available Sub-Courts")
@@ -65,7 +61,7 @@ def main():
         print("=" * 60)
         
     except Exception as e:
-        print(f"\n❌ Error: {e}")
+        print(f"\n❌ Error: {e}", file=sys.stderr)
         sys.exit(1)
 
 
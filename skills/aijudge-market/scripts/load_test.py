@@ -0,0 +1,417 @@
+#!/usr/bin/env python3
+"""
+End-to-end load generator for AIJudgeMarket
+
+Drives many concurrent full market lifecycles against a LOCAL node
+(anvil / hardhat) and reports sustained throughput, commit-to-resolution
+latency and gas spent per lifecycle:
+
+    create -> select -> commit -> reveal -> challenge | finalize
+
+Requirements on the local deployment:
+  - the admin key holds MANAGER_ROLE, CHALLENGE_RESOLVER_ROLE and
+    DEFAULT_ADMIN_ROLE (true for the key passed to `initialize`)
+  - USDC is a mintable mock exposing `mint(address,uint256)`
+    (e.g. MockERC20 from contracts/test)
+  - the node supports `anvil_setBalance`, `evm_increaseTime` and `evm_mine`
+
+Usage:
+    python3 load_test.py --contract 0x... --usdc 0x... --judges 50 --markets 200
+    python3 load_test.py --contract 0x... --usdc 0x... --courts 0,1,6 --concurrency 32 --challenge-rate 0.2
+    python3 load_test.py --contract 0x... --usdc 0x... --gas-history gas_history.ndjson --gas-run v2.1
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import threading
+import time
+import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from aijudge_client import AIJudgeClient
+from gas_profiler import GasProfiler
+from web3 import Web3
+
+# First anvil dev account (well-known test key, never use on a public network)
+ANVIL_ADMIN_KEY = "0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcaf784d7bf4f2ff80"
+
+OUTCOME_YES = 1
+OUTCOME_NO = 2
+
+MINT_ABI = [
+    {"inputs": [{"name": "to", "type": "address"}, {"name": "amount", "type": "uint256"}],
+     "name": "mint", "outputs": [], "stateMutability": "nonpayable", "type": "function"}
+]
+
+
+@dataclass
+class LifecycleResult:
+    """Outcome and measurements of a single market lifecycle"""
+    market_id: Optional[int] = None
+    court_id: int = 0
+    path: str = "finalize"  # finalize or challenge
+    tx_count: int = 0
+    gas_used: int = 0
+    gas_by_step: Dict[str, int] = field(default_factory=dict)
+    commit_to_resolution: float = 0.0
+    error: Optional[str] = None
+
+
+class Actor:
+    """An AIJudgeClient plus a lock so one account never races its own nonce"""
+
+    def __init__(self, client: AIJudgeClient):
+        self.client = client
+        self.lock = threading.Lock()
+
+    @property
+    def address(self) -> str:
+        return self.client.address
+
+    def transact(self, function, gas: int = 500000) -> Dict:
+        """Send a contract call and block until it is mined"""
+        with self.lock:
+            tx_hash = self.client._send_transaction(function, gas=gas)
+            receipt = self.client.wait_for_transaction(tx_hash)
+        if receipt["status"] != 1:
+            raise RuntimeError(f"Transaction reverted: {tx_hash}")
+        return receipt
+
+
+class LoadGenerator:
+    """
+    Sets up judge accounts on a local node and runs lifecycles concurrently.
+    """
+
+    def __init__(self, args):
+        self.args = args
+        self.courts = [int(c) for c in args.courts.split(",")]
+        self.gas_profiler = GasProfiler(args.gas_history, run=args.gas_run) if args.gas_history else None
+        self.admin = self._actor(args.admin_key)
+        self.challenger = self._actor(self._derive_key("challenger"))
+        self.judges: List[Actor] = []
+        self.time_lock = threading.Lock()
+        self.tx_count = 0
+        self.tx_count_lock = threading.Lock()
+
+    # ==================== SETUP ====================
+
+    def _derive_key(self, label: str) -> str:
+        """Deterministic per-run account key so reruns reuse registered judges"""
+        return "0x" + bytes(Web3.keccak(text=f"{self.args.seed}:{label}")).hex()
+
+    def _actor(self, private_key: str) -> Actor:
+        return Actor(AIJudgeClient(
+            private_key=private_key,
+            rpc_url=self.args.rpc_url,
+            contract_address=self.args.contract,
+            usdc_address=self.args.usdc,
+            gas_profiler=self.gas_profiler
+        ))
+
+    def _rpc(self, method: str, params: list):
+        return self.admin.client.w3.provider.make_request(method, params)
+
+    def _fund(self, actor: Actor, usdc_amount: int):
+        """Give an account ETH for gas, mint it USDC and approve the market"""
+        self._rpc("anvil_setBalance", [actor.address, hex(10**20)])
+        usdc = self.admin.client.w3.eth.contract(address=self.admin.client.usdc_address, abi=MINT_ABI)
+        self.admin.transact(usdc.functions.mint(actor.address, usdc_amount))
+        actor.transact(actor.client.usdc.functions.approve(actor.client.contract.address, 2**256 - 1))
+
+    def setup(self):
+        """Configure short windows, then register and court-assign judges"""
+        args = self.args
+        contract = self.admin.client.contract
+        stake = contract.functions.getConfig().call()[0]
+
+        print(f"⚙️  Setting challenge window to {args.challenge_window}s")
+        self.admin.transact(contract.functions.setChallengeWindow(args.challenge_window))
+        self.admin.transact(contract.functions.setChallengeStake(stake))
+
+        self._fund(self.challenger, stake * args.markets)
+
+        print(f"👥 Registering {args.judges} judges across courts {self.courts}...")
+
+        def register(i: int) -> Actor:
+            judge = self._actor(self._derive_key(f"judge:{i}"))
+            self._fund(judge, stake)
+            if contract.functions.getJudge(judge.address).call()[3] == 0:
+                judge.transact(judge.client.contract.functions.registerAsJudge(stake))
+            # Round-robin court membership so every court gets judges
+            court = self.courts[i % len(self.courts)]
+            if court != 0 and court not in judge.client.get_judge()["court_ids"]:
+                judge.transact(judge.client.contract.functions.joinCourt(court))
+            return judge
+
+        with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+            self.judges = list(pool.map(register, range(args.judges)))
+
+        active = contract.functions.getActiveJudgesCount().call()
+        print(f"✅ {active} active judges on-chain")
+
+    # ==================== LIFECYCLE ====================
+
+    def _record(self, result: LifecycleResult, step: str, receipt: Dict):
+        result.tx_count += 1
+        result.gas_used += receipt["gasUsed"]
+        result.gas_by_step[step] = result.gas_by_step.get(step, 0) + receipt["gasUsed"]
+        with self.tx_count_lock:
+            self.tx_count += 1
+
+    def _warp_past(self, deadline: int):
+        """Advance local chain time past a deadline (only moves forward)"""
+        w3 = self.admin.client.w3
+        with self.time_lock:
+            now = w3.eth.get_block("latest")["timestamp"]
+            if now <= deadline:
+                self._rpc("evm_increaseTime", [deadline - now + 1])
+                self._rpc("evm_mine", [])
+
+    def run_lifecycle(self, index: int) -> LifecycleResult:
+        args = self.args
+        rng = random.Random(f"{args.seed}:{index}")
+        court_id = rng.choice(self.courts)
+        result = LifecycleResult(court_id=court_id)
+        contract = self.admin.client.contract
+
+        try:
+            # 1. Create
+            now = self.admin.client.w3.eth.get_block("latest")["timestamp"]
+            receipt = self.admin.transact(contract.functions.createMarket(
+                f"Load test market #{index}", now + 3600, args.required_judges, court_id
+            ))
+            self._record(result, "createMarket", receipt)
+            event = contract.events.MarketCreatedWithCourt().process_receipt(receipt)[0]
+            market_id = event["args"]["marketId"]
+            result.market_id = market_id
+
+            # 2. Select
+            receipt = self.admin.transact(contract.functions.selectJudgesForMarket(market_id))
+            self._record(result, "selectJudgesForMarket", receipt)
+            selected = set(self.admin.client.get_selected_judges(market_id))
+            judges = [j for j in self.judges if j.address in selected]
+
+            # Mix outcomes: each judge leans towards the market's "true" answer
+            truth = OUTCOME_YES if rng.random() < args.yes_rate else OUTCOME_NO
+            votes = {}
+            for judge in judges:
+                agree = rng.random() < args.agreement
+                votes[judge.address] = truth if agree else (OUTCOME_NO if truth == OUTCOME_YES else OUTCOME_YES)
+            salts = {j.address: "0x" + os.urandom(32).hex() for j in judges}
+
+            # 3. Commit
+            commit_start = time.perf_counter()
+            for judge in judges:
+                commit_hash = judge.client.compute_commit_hash(votes[judge.address], salts[judge.address])
+                receipt = judge.transact(judge.client.contract.functions.commitVote(
+                    market_id, bytes.fromhex(commit_hash.replace("0x", ""))
+                ))
+                self._record(result, "commitVote", receipt)
+
+            # 4. Reveal (the last reveal that reaches the quorum resolves the market)
+            for judge in judges:
+                receipt = judge.transact(judge.client.contract.functions.revealVote(
+                    market_id, votes[judge.address], bytes.fromhex(salts[judge.address][2:]),
+                    b"\x00" * 32, b"\x00" * 32
+                ))
+                self._record(result, "revealVote", receipt)
+
+            market = self.admin.client.get_market(market_id)
+            if market["challenge_deadline"] == 0:
+                raise RuntimeError("Market did not resolve after all reveals")
+
+            # 5. Challenge or finalize
+            if rng.random() < args.challenge_rate:
+                result.path = "challenge"
+                claimed = OUTCOME_NO if market["outcome"] == OUTCOME_YES else OUTCOME_YES
+                receipt = self.challenger.transact(
+                    self.challenger.client.contract.functions.challengeResolution(market_id, claimed)
+                )
+                self._record(result, "challengeResolution", receipt)
+                receipt = self.admin.transact(
+                    contract.functions.resolveChallenge(market_id, rng.random() < 0.5)
+                )
+                self._record(result, "resolveChallenge", receipt)
+            else:
+                self._warp_past(market["challenge_deadline"])
+                receipt = self.admin.transact(contract.functions.finalizeResolution(market_id))
+                self._record(result, "finalizeResolution", receipt)
+
+            result.commit_to_resolution = time.perf_counter() - commit_start
+
+        except Exception as e:
+            result.error = str(e)
+
+        return result
+
+    def run(self) -> Dict:
+        args = self.args
+        results: List[LifecycleResult] = []
+
+        print(f"\n🚀 Running {args.markets} lifecycles with concurrency {args.concurrency}...")
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+            futures = [pool.submit(self.run_lifecycle, i) for i in range(args.markets)]
+            for done, future in enumerate(as_completed(futures), 1):
+                results.append(future.result())
+                if done % max(1, args.markets // 10) == 0:
+                    print(f"   {done}/{args.markets} lifecycles complete")
+        elapsed = time.perf_counter() - start
+
+        active = self.admin.client.contract.functions.getActiveJudgesCount().call()
+        return build_report(results, elapsed, self.tx_count, active)
+
+
+# ==================== REPORTING ====================
+
+def _percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    idx = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[idx]
+
+
+def build_report(results: List[LifecycleResult], elapsed: float, tx_count: int, active_judges: int) -> Dict:
+    """Aggregate lifecycle results into a JSON-serialisable report"""
+    ok = [r for r in results if r.error is None]
+    failed = [r for r in results if r.error is not None]
+    latencies = [r.commit_to_resolution for r in ok]
+    gas = [r.gas_used for r in ok]
+
+    steps: Dict[str, List[int]] = {}
+    for r in ok:
+        for step, used in r.gas_by_step.items():
+            steps.setdefault(step, []).append(used)
+
+    errors: Dict[str, int] = {}
+    for r in failed:
+        key = r.error.split("\n")[0][:120]
+        errors[key] = errors.get(key, 0) + 1
+
+    return {
+        "lifecycles": len(results),
+        "succeeded": len(ok),
+        "failed": len(failed),
+        "challenged": sum(1 for r in ok if r.path == "challenge"),
+        "active_judges": active_judges,
+        "elapsed_s": round(elapsed, 3),
+        "transactions": tx_count,
+        "tps": round(tx_count / elapsed, 2) if elapsed > 0 else 0.0,
+        "commit_to_resolution_s": {
+            "p50": round(_percentile(latencies, 50), 3),
+            "p95": round(_percentile(latencies, 95), 3),
+            "p99": round(_percentile(latencies, 99), 3),
+            "max": round(max(latencies), 3) if latencies else 0.0,
+        },
+        "gas_per_lifecycle": {
+            "mean": int(statistics.mean(gas)) if gas else 0,
+            "p95": int(_percentile(gas, 95)),
+            "max": max(gas) if gas else 0,
+        },
+        "gas_by_step_mean": {step: int(statistics.mean(v)) for step, v in sorted(steps.items())},
+        "errors": errors,
+    }
+
+
+def print_report(report: Dict):
+    print("\n" + "=" * 60)
+    print("📈 Load Test Report")
+    print("=" * 60)
+    print(f"Lifecycles: {report['succeeded']}/{report['lifecycles']} succeeded "
+          f"({report['challenged']} challenged)")
+    print(f"Active judges: {report['active_judges']}")
+    print(f"Transactions: {report['transactions']} in {report['elapsed_s']}s "
+          f"→ {report['tps']} tx/s sustained")
+    lat = report["commit_to_resolution_s"]
+    print(f"\nCommit → resolution: p50 {lat['p50']}s | p95 {lat['p95']}s | p99 {lat['p99']}s | max {lat['max']}s")
+    gas = report["gas_per_lifecycle"]
+    print(f"Gas per lifecycle: mean {gas['mean']:,} | p95 {gas['p95']:,} | max {gas['max']:,}")
+    print("\nMean gas by step:")
+    for step, used in report["gas_by_step_mean"].items():
+        print(f"   {step:<24} {used:>12,}")
+    if report["errors"]:
+        print("\n❌ Errors:")
+        for err, count in report["errors"].items():
+            print(f"   {count}× {err}")
+    print("=" * 60)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test full market lifecycles against a local node")
+    parser.add_argument("--rpc-url", default="http://127.0.0.1:8545", help="Local node RPC endpoint")
+    parser.add_argument("--contract", help="AIJudgeMarket proxy address (or set CONTRACT_ADDRESS env var)")
+    parser.add_argument("--usdc", help="Mintable mock USDC address (or set USDC_ADDRESS env var)")
+    parser.add_argument("--admin-key", help="Admin/manager private key (default: anvil account #0)")
+    parser.add_argument("--judges", type=int, default=10, help="Number of judge accounts (default: 10)")
+    parser.add_argument("--courts", default="0",
+                       help="Comma-separated court IDs to spread judges and markets over (default: 0)")
+    parser.add_argument("--markets", type=int, default=20, help="Number of lifecycles to run (default: 20)")
+    parser.add_argument("--required-judges", type=int, default=3, help="Judges per market (default: 3)")
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent lifecycles (default: 8)")
+    parser.add_argument("--yes-rate", type=float, default=0.5,
+                       help="Fraction of markets whose majority answer is YES (default: 0.5)")
+    parser.add_argument("--agreement", type=float, default=0.8,
+                       help="Probability a judge votes with the majority answer (default: 0.8)")
+    parser.add_argument("--challenge-rate", type=float, default=0.1,
+                       help="Fraction of resolutions that get challenged (default: 0.1)")
+    parser.add_argument("--challenge-window", type=int, default=1,
+                       help="Challenge window in seconds set during setup (default: 1)")
+    parser.add_argument("--seed", default="aijudge-load", help="Seed for accounts and outcome mix")
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    parser.add_argument("--gas-history", help="Append per-transaction gas samples to this NDJSON file (see gas_profiler.py)")
+    parser.add_argument("--gas-run", help="Run label for the gas samples (e.g. the contract version)")
+
+    args = parser.parse_args()
+
+    args.contract = args.contract or os.environ.get("CONTRACT_ADDRESS")
+    args.usdc = args.usdc or os.environ.get("USDC_ADDRESS")
+    args.admin_key = args.admin_key or os.environ.get("PRIVATE_KEY") or ANVIL_ADMIN_KEY
+
+    if not args.contract or not args.usdc:
+        print("❌ Error: Contract and mock USDC addresses required")
+        sys.exit(1)
+
+    if args.required_judges % 2 == 0 or not 3 <= args.required_judges <= 21:
+        print("❌ Error: required-judges must be odd and between 3 and 21")
+        sys.exit(1)
+
+    if args.judges < args.required_judges:
+        print("❌ Error: Need at least as many judges as required-judges")
+        sys.exit(1)
+
+    print("🏋️  AIJudgeMarket Load Test")
+    print("=" * 50)
+    print(f"Node: {args.rpc_url}")
+    print(f"Judges: {args.judges} | Courts: {args.courts} | Markets: {args.markets}")
+    print(f"Required judges: {args.required_judges} | Concurrency: {args.concurrency}")
+    print("=" * 50)
+
+    try:
+        generator = LoadGenerator(args)
+        generator.setup()
+        report = generator.run()
+    except KeyboardInterrupt:
+        print("\n\n👋 Stopped")
+        sys.exit(1)
+    except Exception as e:
+        print(f"\n❌ Error: {e}")
+        sys.exit(1)
+
+    print_report(report)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Report saved to: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
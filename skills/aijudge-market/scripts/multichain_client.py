@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+AIJudgeMarket Multi-Chain Client
+Fans queries out to every chain the contract is deployed on (same CREATE3
+address everywhere) and merges the results, each tagged with its chain.
+
+Example:
+    multi = MultiChainClient()
+    for cfg in multi.get_config():
+        print(cfg['chain'], cfg.get('challenge_window'), cfg.get('error'))
+
+    markets = multi.get_markets()          # every market on every chain
+    judge = multi.get_judge("0x...")       # one entry per chain
+
+Usage:
+    python3 multichain_client.py config
+    python3 multichain_client.py judge --address 0x...
+    python3 multichain_client.py markets --chains eth-sepolia,arc-testnet
+"""
+
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from aijudge_client import AIJudgeClient
+
+
+class MultiChainClient:
+    """
+    One AIJudgeClient (and HTTP connection pool) per chain, queried concurrently.
+
+    Every fan-out method returns a list of dicts carrying a 'chain' key. A chain
+    that fails yields {'chain': name, 'error': message} instead of raising, so
+    one slow or broken RPC never hides the other chains.
+    """
+
+    def __init__(
+        self,
+        private_key: Optional[str] = None,
+        chains: Optional[Dict[str, Union[str, Sequence[str]]]] = None,
+        contract_address: str = AIJudgeClient.DEFAULT_CONTRACT_ADDRESS,
+        max_workers: int = 16,
+        **client_kwargs
+    ):
+        """
+        Args:
+            private_key: Key used for all chains (default: read-only placeholder)
+            chains: chain name -> RPC URL(s); defaults to AIJudgeClient.RPC_URLS
+            contract_address: Contract address (same on all chains via CREATE3)
+            max_workers: Size of the shared query thread pool
+            client_kwargs: Passed through to each AIJudgeClient (instrumentation, rate_limit, ...)
+        """
+        private_key = private_key or AIJudgeClient.READ_ONLY_KEY
+        chains = chains or dict(AIJudgeClient.RPC_URLS)
+        self._pool = ThreadPoolExecutor(max_workers=max_workers)
+
+        def build(name: str) -> AIJudgeClient:
+            # Known chains get their USDC address up front, which skips the chain-ID RPC
+            return AIJudgeClient(
+                private_key=private_key,
+                rpc_url=chains[name],
+                contract_address=contract_address,
+                usdc_address=AIJudgeClient.USDC_ADDRESSES.get(name),
+                **client_kwargs
+            )
+
+        self.clients: Dict[str, AIJudgeClient] = {}
+        self.errors: Dict[str, str] = {}
+        futures = {name: self._pool.submit(build, name) for name in chains}
+        for name, future in futures.items():
+            try:
+                self.clients[name] = future.result()
+            except Exception as e:
+                self.errors[name] = str(e)
+
+    def close(self):
+        self._pool.shutdown(wait=False)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @property
+    def chains(self) -> List[str]:
+        return list(self.clients)
+
+    def _fan_out(self, fn: Callable[[AIJudgeClient], Any], chains: Optional[Sequence[str]] = None) -> Dict[str, Any]:
+        """Run fn against each chain's client concurrently; exceptions are returned, not raised"""
+        names = [c for c in (chains or self.clients) if c in self.clients]
+        futures = {name: self._pool.submit(fn, self.clients[name]) for name in names}
+        results = {}
+        for name, future in futures.items():
+            try:
+                results[name] = future.result()
+            except Exception as e:
+                results[name] = e
+        return results
+
+    @staticmethod
+    def _tag(chain: str, value: Any) -> Dict:
+        if isinstance(value, Exception):
+            return {'chain': chain, 'error': str(value)}
+        return {'chain': chain, **value}
+
+    # ==================== QUERIES ====================
+
+    def get_config(self, chains: Optional[Sequence[str]] = None) -> List[Dict]:
+        """Protocol parameters per chain"""
+        results = self._fan_out(lambda c: c.get_config(), chains)
+        return [self._tag(chain, value) for chain, value in results.items()]
+
+    def get_judge(self, address: str, chains: Optional[Sequence[str]] = None) -> List[Dict]:
+        """Judge record per chain"""
+        results = self._fan_out(lambda c: c.get_judge(address), chains)
+        return [self._tag(chain, value) for chain, value in results.items()]
+
+    def get_market_counts(self, chains: Optional[Sequence[str]] = None) -> List[Dict]:
+        results = self._fan_out(lambda c: {'market_count': c.get_market_count()}, chains)
+        return [self._tag(chain, value) for chain, value in results.items()]
+
+    def get_markets(
+        self,
+        market_ids: Optional[Sequence[int]] = None,
+        chains: Optional[Sequence[str]] = None
+    ) -> List[Dict]:
+        """
+        Markets from every chain, merged into one list.
+
+        Args:
+            market_ids: IDs to fetch on each chain (default: all markets on each chain)
+        """
+        if market_ids is None:
+            counts = self.get_market_counts(chains)
+            targets = {r['chain']: range(r['market_count']) for r in counts if 'error' not in r}
+            merged = [r for r in counts if 'error' in r]
+        else:
+            targets = {c: market_ids for c in (chains or self.clients) if c in self.clients}
+            merged = []
+
+        # Every (chain, market) read is its own task so chains and markets overlap
+        futures = [
+            (chain, market_id, self._pool.submit(self.clients[chain].get_market, market_id))
+            for chain, ids in targets.items()
+            for market_id in ids
+        ]
+        for chain, market_id, future in futures:
+            try:
+                merged.append({'chain': chain, 'market_id': market_id, **future.result()})
+            except Exception as e:
+                merged.append({'chain': chain, 'market_id': market_id, 'error': str(e)})
+        return merged
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Query AIJudgeMarket across all chains concurrently")
+    parser.add_argument("command", choices=["config", "judge", "markets"], help="What to query")
+    parser.add_argument("--address", help="Judge address (for 'judge')")
+    parser.add_argument("--market-ids", help="Comma-separated market IDs (for 'markets', default: all)")
+    parser.add_argument("--chains", help="Comma-separated chain names (default: all known chains)")
+    parser.add_argument("--contract", help="Contract address (default: CREATE3 address)")
+
+    args = parser.parse_args()
+
+    chains = None
+    if args.chains:
+        names = args.chains.split(",")
+        unknown = [n for n in names if n not in AIJudgeClient.RPC_URLS]
+        if unknown:
+            print(f"❌ Error: Unknown chains: {', '.join(unknown)}")
+            sys.exit(1)
+        chains = {n: AIJudgeClient.RPC_URLS[n] for n in names}
+
+    contract_address = args.contract or os.environ.get("CONTRACT_ADDRESS") or AIJudgeClient.DEFAULT_CONTRACT_ADDRESS
+
+    with MultiChainClient(chains=chains, contract_address=contract_address) as multi:
+        if args.command == "config":
+            results = multi.get_config()
+        elif args.command == "judge":
+            if not args.address:
+                print("❌ Error: --address required")
+                sys.exit(1)
+            results = multi.get_judge(args.address)
+        else:
+            ids = [int(i) for i in args.market_ids.split(",")] if args.market_ids else None
+            results = multi.get_markets(ids)
+
+        for chain, error in multi.errors.items():
+            results.append({'chain': chain, 'error': error})
+
+    print(json.dumps(results, indent=2, default=lambda o: o.hex() if isinstance(o, bytes) else str(o)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,572 @@
+#!/usr/bin/env python3
+"""
+AIJudgeMarket Pre-signed Reveals
+Prepare and sign revealVote transactions ahead of time and broadcast them the
+moment each market's reveal phase opens, so nonce lookup, gas pricing,
+encoding and signing all happen outside the reveal window.
+
+A market's reveal phase opens when its commit phase ends
+(resolutionTime + commitRevealWindow) and closes one window later.
+
+- Nonces are reserved in reveal-opening order, starting at the account's
+  pending nonce.
+- Fees are capped: maxFeePerGas = base fee x --fee-multiplier + tip on
+  EIP-1559 chains, gasPrice x --fee-multiplier otherwise.
+- The broadcaster re-checks the account nonce and fees on every poll and
+  re-signs the pending reveals when they drift: another transaction took a
+  reserved nonce, a reveal expired, or the fee cap fell below the market.
+- Broadcast reveals are followed until a receipt arrives. One the node
+  dropped is re-sent, and one whose fee cap the base fee outgrew is replaced
+  at the same nonce with bumped fees. Before anything is re-signed with a new
+  nonce, the receipts and the on-chain vote are checked, so a reveal that
+  already landed is never sent twice.
+
+The reveals (including salts) and their signed transactions are kept in an
+encrypted vault file (scrypt + AES-GCM), keyed by --password or, by
+default, the judge's private key.
+
+Example:
+    vault = RevealVault("reveals.vault", password)
+    broadcaster = RevealBroadcaster(client, vault)
+    broadcaster.prepare(market_id=7, outcome=1, salt="0x...")
+    broadcaster.run()   # blocks, broadcasting each reveal when its window opens
+
+Usage:
+    python3 presigned_reveals.py prepare --market-id 7 --outcome yes --salt 0x...
+    python3 presigned_reveals.py prepare --market-id 7 --outcome yes --salt 0x... --evidence-file evidence.pdf
+    python3 presigned_reveals.py list
+    python3 presigned_reveals.py run --poll 2
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Dict, List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from aijudge_client import AIJudgeClient
+from calldata import encode_reveal_vote, to_bytes32
+from ipfs_cid import HASHES, evidence_bytes32
+from skill_config import default_cache_dir
+
+ZERO_HASH = "0x" + "00" * 32
+
+# scrypt cost for the vault key (same parameters as the Ethereum keystore default)
+SCRYPT_N = 2 ** 18
+SCRYPT_R = 8
+SCRYPT_P = 1
+
+# Minimum fee increase for a same-nonce replacement (geth / reth require 10%)
+REPLACEMENT_BUMP = 1.125
+
+
+@dataclass
+class PresignedReveal:
+    """One prepared reveal and its currently signed transaction"""
+    market_id: int
+    outcome: int
+    salt: str
+    evidence_hash: str
+    rationale_hash: str
+    reveal_opens: int  # unix time
+    reveal_closes: int
+    gas: int
+    nonce: Optional[int] = None
+    max_fee_per_gas: Optional[int] = None  # gasPrice on legacy chains
+    max_priority_fee_per_gas: Optional[int] = None  # None for legacy transactions
+    raw_tx: Optional[str] = None
+    tx_hash: Optional[str] = None
+    signed_at: Optional[float] = None
+    status: str = "signed"  # signed, broadcast, mined, reverted, revealed, expired
+    error: Optional[str] = None
+    sent_hashes: List[str] = field(default_factory=list)  # every broadcast signature at `nonce`
+
+    def summary(self) -> Dict:
+        """Everything except the salt and the signed transaction"""
+        data = asdict(self)
+        data.pop("salt")
+        data.pop("raw_tx")
+        return data
+
+
+# ==================== ENCRYPTED VAULT ====================
+
+class RevealVault:
+    """
+    Encrypted JSON list of PresignedReveal on disk.
+
+    Args:
+        path: Vault file (written with mode 0600)
+        password: Passphrase; the key is derived with scrypt
+    """
+
+    def __init__(self, path: str, password: str):
+        self.path = path
+        self._password = password.encode()
+        # (kdf salt, key): scrypt runs once per vault, a fresh GCM nonce per save
+        self._derived: Optional[tuple] = None
+
+    def _key(self, salt: bytes) -> bytes:
+        if self._derived is None or self._derived[0] != salt:
+            from Crypto.Protocol.KDF import scrypt
+            self._derived = (salt, scrypt(self._password, salt, 32, N=SCRYPT_N, r=SCRYPT_R, p=SCRYPT_P))
+        return self._derived[1]
+
+    def load(self) -> List[PresignedReveal]:
+        if not os.path.exists(self.path):
+            return []
+        from Crypto.Cipher import AES
+
+        with open(self.path, "r") as f:
+            envelope = json.load(f)
+        cipher = AES.new(self._key(bytes.fromhex(envelope["kdf_salt"])), AES.MODE_GCM,
+                         nonce=bytes.fromhex(envelope["nonce"]))
+        try:
+            plaintext = cipher.decrypt_and_verify(bytes.fromhex(envelope["ciphertext"]),
+                                                  bytes.fromhex(envelope["tag"]))
+        except ValueError:
+            raise ValueError(f"Cannot decrypt {self.path}: wrong password or corrupted vault")
+        return [PresignedReveal(**r) for r in json.loads(plaintext)]
+
+    def save(self, reveals: List[PresignedReveal]):
+        from Crypto.Cipher import AES
+
+        kdf_salt = self._derived[0] if self._derived else os.urandom(16)
+        cipher = AES.new(self._key(kdf_salt), AES.MODE_GCM)
+        ciphertext, tag = cipher.encrypt_and_digest(json.dumps([asdict(r) for r in reveals]).encode())
+        envelope = {
+            "version": 1,
+            "kdf": "scrypt",
+            "kdf_params": {"n": SCRYPT_N, "r": SCRYPT_R, "p": SCRYPT_P},
+            "kdf_salt": kdf_salt.hex(),
+            "nonce": cipher.nonce.hex(),
+            "ciphertext": ciphertext.hex(),
+            "tag": tag.hex(),
+        }
+        tmp = self.path + ".tmp"
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            json.dump(envelope, f)
+        os.replace(tmp, self.path)
+
+
+# ==================== BROADCASTER ====================
+
+class RevealBroadcaster:
+    """
+    Signs reveals with reserved nonces and fee caps and broadcasts them when
+    their reveal phase opens.
+
+    Args:
+        client: AIJudgeClient for the judge account
+        vault: Where the reveals are kept between runs
+        fee_multiplier: Fee cap as a multiple of the current base fee / gas price
+        priority_fee: Fixed tip in wei (default: eth_maxPriorityFeePerGas)
+        lead_seconds: Broadcast this long before the window opens (by latest block time)
+    """
+
+    def __init__(
+        self,
+        client: AIJudgeClient,
+        vault: RevealVault,
+        fee_multiplier: float = 2.0,
+        priority_fee: Optional[int] = None,
+        lead_seconds: int = 0
+    ):
+        self.client = client
+        self.vault = vault
+        self.fee_multiplier = fee_multiplier
+        self.priority_fee = priority_fee
+        self.lead_seconds = lead_seconds
+        self.reveals = vault.load()
+        self._chain_id: Optional[int] = None
+        self._window: Optional[int] = None
+
+    def pending(self) -> List[PresignedReveal]:
+        """Signed but not yet broadcast, in reserved-nonce order"""
+        waiting = [r for r in self.reveals if r.status == "signed"]
+        return sorted(waiting, key=lambda r: (r.reveal_opens, r.market_id))
+
+    def in_flight(self) -> List[PresignedReveal]:
+        """Broadcast, no receipt yet"""
+        return [r for r in self.reveals if r.status == "broadcast"]
+
+    def prepare(
+        self,
+        market_id: int,
+        outcome: int,
+        salt: str,
+        evidence_hash: str = ZERO_HASH,
+        rationale_hash: str = ZERO_HASH,
+        gas: int = 500000
+    ) -> PresignedReveal:
+        """Add a reveal, (re)sign every pending reveal and save the vault"""
+        if any(r.market_id == market_id and r.status in ("signed", "broadcast") for r in self.reveals):
+            raise ValueError(f"A reveal for market {market_id} is already prepared")
+        # Fail now, not inside the window, on malformed hashes
+        encode_reveal_vote(market_id, outcome, salt, evidence_hash, rationale_hash)
+
+        if self._window is None:
+            self._window = self.client.get_config()['commit_reveal_window']
+        resolution_time = self.client.get_market(market_id)['resolution_time']
+        reveal = PresignedReveal(
+            market_id=market_id,
+            outcome=outcome,
+            salt="0x" + to_bytes32(salt).hex(),
+            evidence_hash="0x" + to_bytes32(evidence_hash).hex(),
+            rationale_hash="0x" + to_bytes32(rationale_hash).hex(),
+            reveal_opens=resolution_time + self._window,
+            reveal_closes=resolution_time + 2 * self._window,
+            gas=gas,
+        )
+        self.reveals.append(reveal)
+        self.rebuild()
+        if reveal.status == "expired":
+            raise ValueError(f"Reveal window for market {market_id} has already closed")
+        return reveal
+
+    # ==================== SIGNING ====================
+
+    def _next_nonce(self) -> int:
+        """First nonce free for pending reveals: after the account's pending
+        transactions and after every in-flight reveal (even one the node dropped)"""
+        account_nonce = self.client.w3.eth.get_transaction_count(self.client.address, 'pending')
+        return max([account_nonce] + [r.nonce + 1 for r in self.in_flight()])
+
+    def _fees(self, block) -> Dict[str, int]:
+        """Fee fields for a new signature, from the latest block"""
+        base_fee = block.get('baseFeePerGas')
+        if base_fee is None:
+            return {'gasPrice': int(self.client.w3.eth.gas_price * self.fee_multiplier)}
+        tip = self.priority_fee if self.priority_fee is not None else self.client.w3.eth.max_priority_fee
+        return {'maxFeePerGas': int(base_fee * self.fee_multiplier) + tip, 'maxPriorityFeePerGas': tip}
+
+    def _sign(self, reveal: PresignedReveal, nonce: int, fees: Dict[str, int]):
+        if self._chain_id is None:
+            self._chain_id = self.client.w3.eth.chain_id
+        tx = {
+            'to': self.client.contract.address,
+            'data': '0x' + encode_reveal_vote(reveal.market_id, reveal.outcome, reveal.salt,
+                                              reveal.evidence_hash, reveal.rationale_hash).hex(),
+            'nonce': nonce,
+            'gas': reveal.gas,
+            'value': 0,
+            'chainId': self._chain_id,
+            **fees,
+        }
+        if 'maxFeePerGas' in fees:
+            tx['type'] = 2
+        signed = self.client.account.sign_transaction(tx)
+        raw = getattr(signed, 'raw_transaction', None) or signed.rawTransaction
+        reveal.nonce = nonce
+        reveal.max_fee_per_gas = fees.get('maxFeePerGas', fees.get('gasPrice'))
+        reveal.max_priority_fee_per_gas = fees.get('maxPriorityFeePerGas')
+        reveal.raw_tx = self.client.w3.to_hex(raw)
+        reveal.tx_hash = self.client.w3.to_hex(signed.hash)
+        reveal.signed_at = time.time()
+
+    def drift(self, account_nonce: int, block) -> Optional[str]:
+        """
+        Why the pending signatures are no longer usable, or None.
+
+        Args:
+            account_nonce: The account's pending transaction count
+            block: Latest block (for baseFeePerGas)
+        """
+        pending = self.pending()
+        if not pending:
+            return None
+        if [r.nonce for r in pending] != list(range(account_nonce, account_nonce + len(pending))):
+            return f"nonce (account at {account_nonce}, reserved from {pending[0].nonce})"
+        base_fee = block.get('baseFeePerGas')
+        if base_fee is not None:
+            if any(r.max_priority_fee_per_gas is None for r in pending):
+                return "fee (chain switched to EIP-1559)"
+            needed = base_fee + min(r.max_priority_fee_per_gas for r in pending)
+        else:
+            needed = self.client.w3.eth.gas_price
+        cap = min(r.max_fee_per_gas for r in pending)
+        if cap < needed:
+            return f"fee (cap {cap} wei < {needed} wei)"
+        if base_fee is None and cap > needed * self.fee_multiplier * 2:
+            return f"fee (gasPrice {cap} wei overpays {needed} wei)"
+        return None
+
+    def rebuild(self, force: bool = False) -> Optional[str]:
+        """
+        Re-sign pending reveals if nonces or fees drifted (or always with
+        force); expired reveals are dropped from the nonce sequence first.
+
+        Returns:
+            The drift reason if the reveals were re-signed
+        """
+        block = self.client.w3.eth.get_block('latest')
+        for r in self.reveals:
+            if r.status == "signed" and block['timestamp'] > r.reveal_closes:
+                r.status = "expired"
+        account_nonce = self._next_nonce()
+        unsigned = any(r.raw_tx is None for r in self.pending())
+        reason = "unsigned reveal" if unsigned else ("forced" if force else self.drift(account_nonce, block))
+        if reason is None:
+            return None
+        fees = self._fees(block)
+        for offset, reveal in enumerate(self.pending()):
+            self._sign(reveal, account_nonce + offset, fees)
+        self.vault.save(self.reveals)
+        return reason
+
+    # ==================== BROADCASTING ====================
+
+    def _send(self, reveal: PresignedReveal) -> Optional[Exception]:
+        """Broadcast the current signature; returns the error unless accepted or already known"""
+        try:
+            self.client.w3.eth.send_raw_transaction(reveal.raw_tx)
+        except Exception as e:
+            if "already known" not in str(e).lower():
+                return e
+        if reveal.tx_hash not in reveal.sent_hashes:
+            reveal.sent_hashes.append(reveal.tx_hash)
+        return None
+
+    def _receipt(self, reveal: PresignedReveal) -> bool:
+        """Settle the reveal if any signature sent at its nonce was mined"""
+        from web3.exceptions import TransactionNotFound
+
+        for tx_hash in reversed(reveal.sent_hashes or [reveal.tx_hash]):
+            try:
+                receipt = self.client.w3.eth.get_transaction_receipt(tx_hash)
+            except TransactionNotFound:
+                continue
+            if receipt is None:
+                continue
+            reveal.status = "mined" if receipt['status'] == 1 else "reverted"
+            reveal.tx_hash = tx_hash
+            return True
+        return False
+
+    def _settled(self, reveal: PresignedReveal) -> bool:
+        """Our receipt or the on-chain vote shows the reveal already landed"""
+        if self._receipt(reveal):
+            return True
+        if self.client.get_vote(reveal.market_id)['revealed']:
+            reveal.status = "revealed"
+            return True
+        return False
+
+    def _stuck(self, reveal: PresignedReveal, block) -> Optional[str]:
+        """Why an in-flight reveal will not be mined as is, or None"""
+        from web3.exceptions import TransactionNotFound
+
+        base_fee = block.get('baseFeePerGas')
+        if base_fee is not None:
+            needed = base_fee + (reveal.max_priority_fee_per_gas or 0)
+        else:
+            needed = self.client.w3.eth.gas_price
+        if reveal.max_fee_per_gas < needed:
+            return f"fee (cap {reveal.max_fee_per_gas} wei < {needed} wei)"
+        try:
+            self.client.w3.eth.get_transaction(reveal.tx_hash)
+        except TransactionNotFound:
+            return "dropped"
+        return None
+
+    def _bumped_fees(self, reveal: PresignedReveal, block) -> Dict[str, int]:
+        """Current fees, raised to at least REPLACEMENT_BUMP x the signature being replaced"""
+        def bump(value: int) -> int:
+            return int(value * REPLACEMENT_BUMP) + 1
+
+        fees = self._fees(block)
+        if 'maxFeePerGas' in fees and reveal.max_priority_fee_per_gas is not None:
+            return {'maxFeePerGas': max(fees['maxFeePerGas'], bump(reveal.max_fee_per_gas)),
+                    'maxPriorityFeePerGas': max(fees['maxPriorityFeePerGas'],
+                                                bump(reveal.max_priority_fee_per_gas))}
+        if 'gasPrice' in fees:
+            return {'gasPrice': max(fees['gasPrice'], bump(reveal.max_fee_per_gas))}
+        return fees
+
+    def track(self) -> List[PresignedReveal]:
+        """
+        Follow broadcast reveals until a receipt arrives. Returns the reveals
+        whose state changed: settled, expired, re-queued because another
+        transaction took their nonce, or re-sent / replaced at the same
+        nonce because the node dropped them or the base fee outgrew their cap.
+        """
+        in_flight = self.in_flight()
+        if not in_flight:
+            return []
+        # Mined nonce first: a receipt for it is then guaranteed to be visible below
+        mined_nonce = self.client.w3.eth.get_transaction_count(self.client.address, 'latest')
+        block = self.client.w3.eth.get_block('latest')
+        updated = []
+        for reveal in in_flight:
+            if self._receipt(reveal):
+                pass
+            elif reveal.nonce < mined_nonce:
+                if not self._settled(reveal):
+                    # Another transaction took the nonce; re-signed by rebuild()
+                    reveal.status, reveal.raw_tx, reveal.sent_hashes = "signed", None, []
+                    reveal.error = f"nonce {reveal.nonce} used by another transaction"
+            elif block['timestamp'] > reveal.reveal_closes:
+                reveal.status = "expired"
+            else:
+                reason = self._stuck(reveal, block)
+                if reason is None:
+                    continue
+                if reason != "dropped":
+                    # Same nonce, higher fees: replaces the stuck signature
+                    self._sign(reveal, reveal.nonce, self._bumped_fees(reveal, block))
+                error = self._send(reveal)
+                reveal.error = f"{reason}: {type(error).__name__}: {error}" if error else None
+            updated.append(reveal)
+        if updated:
+            self.vault.save(self.reveals)
+        return updated
+
+    def broadcast_due(self) -> List[PresignedReveal]:
+        """
+        Send every pending reveal whose window has opened (by latest block
+        time). Returns the reveals attempted; a rejected one stays 'signed'
+        with its error set, unless its receipt or the on-chain vote shows it
+        already landed.
+        """
+        now = self.client.w3.eth.get_block('latest')['timestamp'] + self.lead_seconds
+        sent = []
+        for reveal in self.pending():
+            if reveal.reveal_opens > now:
+                break  # later nonces cannot be mined before this one anyway
+            error = self._send(reveal)
+            if error is not None:
+                reveal.error = f"{type(error).__name__}: {error}"
+                sent.append(reveal)
+                # e.g. "nonce too low" after an earlier run's broadcast was mined
+                if self._settled(reveal):
+                    continue
+                # Re-sign with fresh nonce and fees; retried on the next pass
+                self.rebuild(force=True)
+                break
+            reveal.status = "broadcast"
+            reveal.error = None
+            sent.append(reveal)
+        if sent:
+            self.vault.save(self.reveals)
+        return sent
+
+    def run(self, poll_interval: float = 2.0, once: bool = False, on_update=None):
+        """
+        Keep signatures fresh, broadcast reveals as their windows open and
+        follow them until mined, until nothing is pending or in flight (or
+        after one pass with once=True). on_update is called with every
+        reveal that was sent, replaced or settled.
+        """
+        while True:
+            updated = self.track()
+            self.rebuild()
+            updated += self.broadcast_due()
+            if on_update:
+                for reveal in {id(r): r for r in updated}.values():
+                    on_update(reveal)
+            if once or not (self.pending() or self.in_flight()):
+                return
+            time.sleep(poll_interval)
+
+
+# ==================== CLI ====================
+
+def main():
+    parser = argparse.ArgumentParser(description="Pre-sign reveals and broadcast them when the reveal phase opens")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    prepare = sub.add_parser("prepare", help="Sign a reveal ahead of time")
+    prepare.add_argument("--market-id", type=int, required=True, help="Market ID")
+    prepare.add_argument("--outcome", required=True, choices=["yes", "no"], help="Committed outcome")
+    prepare.add_argument("--salt", required=True, help="bytes32 hex salt used for the commit")
+    prepare.add_argument("--evidence-hash", default=ZERO_HASH, help="bytes32 evidence hash")
+    prepare.add_argument("--rationale-hash", default=ZERO_HASH, help="bytes32 rationale hash")
+    prepare.add_argument("--evidence-file", help="Evidence hash from this file's IPFS CID")
+    prepare.add_argument("--rationale-file", help="Rationale hash from this file's IPFS CID")
+    prepare.add_argument("--hash", choices=HASHES, default="raw",
+                         help="File hash: raw sha256, as the SP1 proofs commit (default), or the UnixFS root")
+    prepare.add_argument("--gas", type=int, default=500000, help="Gas limit (default: 500000)")
+
+    sub.add_parser("list", help="Show prepared reveals (without salts)")
+
+    run = sub.add_parser("run", help="Broadcast reveals as their windows open")
+    run.add_argument("--poll", type=float, default=2.0, help="Seconds between drift checks (default: 2)")
+    run.add_argument("--once", action="store_true", help="Single pass instead of waiting")
+    run.add_argument("--lead", type=int, default=0, help="Broadcast this many seconds before the window opens")
+
+    for p in (prepare, run):
+        p.add_argument("--fee-multiplier", type=float, default=2.0,
+                       help="Fee cap as a multiple of base fee / gas price (default: 2)")
+        p.add_argument("--priority-fee-gwei", type=float, help="Fixed tip (default: node suggestion)")
+
+    parser.add_argument("--vault", default=os.path.join(default_cache_dir(), "reveals.vault"),
+                        help="Encrypted vault file")
+    parser.add_argument("--password", help="Vault passphrase (or set AIJUDGE_VAULT_PASSWORD; "
+                                           "default: derived from the private key)")
+    parser.add_argument("--private-key", help="Judge private key (or set PRIVATE_KEY env var)")
+    parser.add_argument("--rpc-url", default="https://sepolia.base.org", help="RPC endpoint")
+    parser.add_argument("--contract", help="Contract address")
+
+    args = parser.parse_args()
+
+    private_key = args.private_key or os.environ.get("PRIVATE_KEY")
+    if not private_key:
+        print("❌ Error: Private key required (--private-key or PRIVATE_KEY env var)")
+        sys.exit(1)
+    contract_address = args.contract or os.environ.get("CONTRACT_ADDRESS") or AIJudgeClient.DEFAULT_CONTRACT_ADDRESS
+    password = args.password or os.environ.get("AIJUDGE_VAULT_PASSWORD") or private_key
+    os.makedirs(os.path.dirname(os.path.abspath(args.vault)), exist_ok=True)
+
+    try:
+        client = AIJudgeClient(private_key=private_key, rpc_url=args.rpc_url, contract_address=contract_address)
+        priority_fee = getattr(args, "priority_fee_gwei", None)
+        broadcaster = RevealBroadcaster(
+            client,
+            RevealVault(args.vault, password),
+            fee_multiplier=getattr(args, "fee_multiplier", 2.0),
+            priority_fee=int(priority_fee * 10**9) if priority_fee is not None else None,
+            lead_seconds=getattr(args, "lead", 0)
+        )
+
+        if args.command == "prepare":
+            if args.evidence_file:
+                args.evidence_hash = evidence_bytes32(args.evidence_file, args.hash)
+            if args.rationale_file:
+                args.rationale_hash = evidence_bytes32(args.rationale_file, args.hash)
+            reveal = broadcaster.prepare(
+                args.market_id, 1 if args.outcome == "yes" else 2, args.salt,
+                args.evidence_hash, args.rationale_hash, args.gas
+            )
+            print(f"✅ Reveal for market {reveal.market_id} signed (nonce {reveal.nonce})")
+            print(f"   Opens:  {time.strftime('%Y-%m-%d %H:%M:%S UTC', time.gmtime(reveal.reveal_opens))}")
+            print(f"   Closes: {time.strftime('%Y-%m-%d %H:%M:%S UTC', time.gmtime(reveal.reveal_closes))}")
+            print(f"💾 Vault: {args.vault}")
+        elif args.command == "list":
+            print(json.dumps([r.summary() for r in broadcaster.reveals], indent=2))
+        else:
+            def report(r: PresignedReveal):
+                if r.status == "broadcast" and not r.error:
+                    print(f"📤 Market {r.market_id}: {r.tx_hash}")
+                elif r.status in ("mined", "revealed"):
+                    print(f"✅ Market {r.market_id}: revealed" + (f" ({r.tx_hash})" if r.status == "mined" else ""))
+                elif r.status == "reverted":
+                    print(f"❌ Market {r.market_id}: reverted ({r.tx_hash})")
+                else:
+                    print(f"⚠️  Market {r.market_id}: {r.error or r.status}")
+
+            print(f"⏳ Watching {len(broadcaster.pending()) + len(broadcaster.in_flight())} reveal(s)...")
+            broadcaster.run(poll_interval=args.poll, once=args.once, on_update=report)
+            print("✅ No reveals pending")
+    except KeyboardInterrupt:
+        print("\n⚠️  Stopped; signed reveals stay in the vault")
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+AIJudgeMarket Client-Side Rate Limiting
+Per-endpoint token-bucket scheduler for JSON-RPC requests.
+
+  - Separate budgets for requests/s and compute units/s (CU weights per method)
+  - Strict priority: transaction submission > reveal-critical reads > normal > bulk scans
+  - Adaptive (AIMD) backoff on HTTP 429 and JSON-RPC -32005 "limit exceeded":
+    halve the rate and pause on throttling, creep back up on sustained success
+
+Example:
+    client = AIJudgeClient(..., rate_limit=RateLimit(requests_per_second=10,
+                                                     compute_units_per_second=330))
+
+    with client.priority(Priority.CRITICAL):
+        vote = client.get_vote(market_id)     # jumps ahead of bulk scans
+
+    with client.priority(Priority.BULK):
+        markets = [client.get_market(i) for i in range(1000)]
+"""
+
+import contextvars
+import heapq
+import itertools
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Optional
+
+from web3.providers.base import BaseProvider
+
+
+class Priority:
+    """Request priorities (lower value is served first)"""
+    TX = 0        # Transaction submission and nonce/gas lookups
+    CRITICAL = 1  # Time-critical reads (reveal window, deadlines)
+    NORMAL = 2
+    BULK = 3      # Market / judge scans
+
+
+# Default compute-unit weights per JSON-RPC method (roughly what hosted
+# providers charge; anything unlisted costs DEFAULT_CU)
+COMPUTE_UNITS = {
+    "eth_chainId": 0,
+    "eth_blockNumber": 10,
+    "eth_gasPrice": 20,
+    "eth_getTransactionCount": 26,
+    "eth_getBalance": 19,
+    "eth_call": 26,
+    "eth_estimateGas": 87,
+    "eth_getBlockByNumber": 16,
+    "eth_getTransactionReceipt": 15,
+    "eth_getLogs": 75,
+    "eth_sendRawTransaction": 250,
+}
+DEFAULT_CU = 20
+
+# Methods that are always scheduled at transaction priority
+TX_METHODS = {"eth_sendRawTransaction", "eth_sendTransaction", "eth_getTransactionCount"}
+
+# JSON-RPC error codes providers use for rate limiting
+THROTTLE_CODES = {-32005, 429}
+
+_current_priority = contextvars.ContextVar("aijudge_request_priority", default=Priority.NORMAL)
+
+
+@contextmanager
+def request_priority(priority: int):
+    """Run the enclosed requests at the given priority"""
+    token = _current_priority.set(priority)
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+def current_priority() -> int:
+    return _current_priority.get()
+
+
+@dataclass
+class RateLimit:
+    """Per-endpoint budget"""
+    requests_per_second: float = 10.0
+    compute_units_per_second: Optional[float] = None
+    burst_seconds: float = 1.0  # Bucket capacity in seconds of budget
+    max_retries: int = 5
+    min_rate_factor: float = 0.05  # Never throttle below 5% of the configured rate
+
+
+class TokenBucket:
+    """Classic token bucket; not thread-safe on its own (the scheduler holds the lock)"""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def time_until(self, amount: float, now: float) -> float:
+        self._refill(now)
+        amount = min(amount, self.capacity)
+        if self.tokens >= amount:
+            return 0.0
+        return (amount - self.tokens) / self.rate
+
+    def consume(self, amount: float):
+        self.tokens -= min(amount, self.capacity)
+
+
+class EndpointScheduler:
+    """
+    Admits requests for one endpoint in priority order within its token budgets,
+    and adapts the rate to throttling feedback.
+    """
+
+    RECOVERY_SUCCESSES = 20  # Successes before stepping the rate back up
+    RECOVERY_STEP = 0.1
+
+    def __init__(self, limit: RateLimit):
+        self.limit = limit
+        self.rate_factor = 1.0
+        self.requests = TokenBucket(limit.requests_per_second,
+                                    max(1.0, limit.requests_per_second * limit.burst_seconds))
+        self.compute_units = None
+        if limit.compute_units_per_second:
+            self.compute_units = TokenBucket(limit.compute_units_per_second,
+                                             max(1.0, limit.compute_units_per_second * limit.burst_seconds))
+        self.paused_until = 0.0
+        self.backoff = 0.5
+        self.successes = 0
+        self.throttled = 0
+        self._cond = threading.Condition()
+        self._waiters = []
+        self._counter = itertools.count()
+
+    def acquire(self, method: str, priority: int):
+        """Block until this request may be sent"""
+        cost = COMPUTE_UNITS.get(method, DEFAULT_CU)
+        ticket = (priority, next(self._counter))
+        with self._cond:
+            heapq.heappush(self._waiters, ticket)
+            try:
+                while True:
+                    timeout = None
+                    if self._waiters[0] == ticket:
+                        now = time.monotonic()
+                        timeout = max(
+                            self.paused_until - now,
+                            self.requests.time_until(1, now),
+                            self.compute_units.time_until(cost, now) if self.compute_units else 0.0,
+                        )
+                        if timeout <= 0:
+                            self.requests.consume(1)
+                            if self.compute_units:
+                                self.compute_units.consume(cost)
+                            heapq.heappop(self._waiters)
+                            self._cond.notify_all()
+                            return
+                    self._cond.wait(timeout)
+            except BaseException:
+                if ticket in self._waiters:
+                    self._waiters.remove(ticket)
+                    heapq.heapify(self._waiters)
+                    self._cond.notify_all()
+                raise
+
+    def _apply_rate(self):
+        self.requests.rate = self.limit.requests_per_second * self.rate_factor
+        if self.compute_units:
+            self.compute_units.rate = self.limit.compute_units_per_second * self.rate_factor
+
+    def on_throttle(self, retry_after: Optional[float] = None):
+        """Multiplicative decrease plus a pause (Retry-After if the server sent one)"""
+        with self._cond:
+            now = time.monotonic()
+            self.throttled += 1
+            self.successes = 0
+            # Requests already in flight when we got throttled report the same
+            # event; only cut the rate once per pause
+            if now >= self.paused_until:
+                self.rate_factor = max(self.limit.min_rate_factor, self.rate_factor / 2)
+                self._apply_rate()
+                self.backoff = min(self.backoff * 2, 30.0)
+            pause = retry_after if retry_after is not None else self.backoff
+            self.paused_until = max(self.paused_until, now + pause)
+            self._cond.notify_all()
+
+    def on_success(self):
+        """Additive increase back towards the configured rate"""
+        with self._cond:
+            self.backoff = 0.5
+            if self.rate_factor >= 1.0:
+                return
+            self.successes += 1
+            if self.successes >= self.RECOVERY_SUCCESSES:
+                self.successes = 0
+                self.rate_factor = min(1.0, self.rate_factor + self.RECOVERY_STEP)
+                self._apply_rate()
+
+
+def _retry_after(exc: Exception) -> Optional[float]:
+    response = getattr(exc, "response", None)
+    value = getattr(response, "headers", {}).get("Retry-After") if response is not None else None
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+def is_throttle_exception(exc: Exception) -> bool:
+    response = getattr(exc, "response", None)
+    return getattr(response, "status_code", None) == 429
+
+
+def is_throttle_response(response) -> bool:
+    if not isinstance(response, dict):
+        return False
+    error = response.get("error")
+    return isinstance(error, dict) and error.get("code") in THROTTLE_CODES
+
+
+class RateLimitedProvider(BaseProvider):
+    """Provider wrapper that schedules every request through an EndpointScheduler"""
+
+    def __init__(self, provider: BaseProvider, limit: RateLimit):
+        super().__init__()
+        self.provider = provider
+        self.endpoint_uri = getattr(provider, "endpoint_uri", None)
+        self.limit = limit
+        self.scheduler = EndpointScheduler(limit)
+
+    def make_request(self, method, params):
+        priority = Priority.TX if method in TX_METHODS else current_priority()
+        for attempt in range(self.limit.max_retries + 1):
+            self.scheduler.acquire(method, priority)
+            last = attempt == self.limit.max_retries
+            try:
+                response = self.provider.make_request(method, params)
+            except Exception as e:
+                if not is_throttle_exception(e):
+                    raise
+                self.scheduler.on_throttle(_retry_after(e))
+                if last:
+                    raise
+                continue
+            if is_throttle_response(response):
+                self.scheduler.on_throttle()
+                if last:
+                    return response
+                continue
+            self.scheduler.on_success()
+            return response
+
+    def is_connected(self, show_traceback: bool = False) -> bool:
+        return self.provider.is_connected()
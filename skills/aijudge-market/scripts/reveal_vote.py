@@ -4,6 +4,7 @@ Reveal a committed vote on AIJudgeMarket
 
 Usage:
     python3 reveal_vote.py --market-id 0 --outcome yes --salt "my_secret_salt_123"
+    python3 reveal_vote.py --market-id 0 --outcome yes --salt "..." --evidence-file evidence.pdf --rationale-file rationale.md
 """
 
 import argparse
@@ -12,6 +13,7 @@ import sys
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from aijudge_client import AIJudgeClient
+from ipfs_cid import HASHES, file_cids
 
 
 def main():
@@ -24,6 +26,10 @@ def main():
                        help="IPFS hash of evidence (optional)")
     parser.add_argument("--rationale-hash", default="0x" + "0" * 64,
                        help="IPFS hash of AI rationale (optional)")
+    parser.add_argument("--evidence-file", help="Compute --evidence-hash from this file's IPFS CID (no daemon)")
+    parser.add_argument("--rationale-file", help="Compute --rationale-hash from this file's IPFS CID (no daemon)")
+    parser.add_argument("--hash", choices=HASHES, default="raw",
+                       help="File hash: raw sha256, as the SP1 proofs commit (default), or the UnixFS root")
     parser.add_argument("--private-key", help="Private key (or set PRIVATE_KEY env var)")
     parser.add_argument("--rpc-url", default="https://sepolia.base.org",
                        help="RPC endpoint")
@@ -40,6 +46,13 @@ def main():
     else:
         outcome = int(args.outcome)
     
+    for name in ("evidence", "rationale"):
+        path = getattr(args, f"{name}_file")
+        if path:
+            cid = file_cids(path).cid(args.hash)
+            setattr(args, f"{name}_hash", cid.bytes32)
+            print(f"📎 {name.capitalize()} CID: {cid}")
+    
     private_key = args.private_key or os.environ.get("PRIVATE_KEY")
     contract_address = args.contract or os.environ.get("CONTRACT_ADDRESS")
     
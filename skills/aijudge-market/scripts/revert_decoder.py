@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+AIJudgeMarket Revert Decoding
+Turns raw revert data into the contract's custom error names.
+
+The selector -> error map is built once per ABI file from
+references/contract_abi.json (plus the built-in Error(string) and
+Panic(uint256)), so decoding a revert is a dict lookup.
+
+Example:
+    revert = decode_revert(bytes.fromhex("fa7bc547"))
+    print(revert.name)        # ChallengeWindowOpen
+"""
+
+import json
+import os
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+DEFAULT_ABI_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'references', 'contract_abi.json')
+
+# Solidity built-ins
+ERROR_STRING_SELECTOR = bytes.fromhex("08c379a0")  # Error(string)
+PANIC_SELECTOR = bytes.fromhex("4e487b71")         # Panic(uint256)
+
+PANIC_CODES = {
+    0x01: "assert failed",
+    0x11: "arithmetic overflow/underflow",
+    0x12: "division by zero",
+    0x21: "invalid enum value",
+    0x31: "pop on empty array",
+    0x32: "array index out of bounds",
+    0x41: "out of memory",
+}
+
+
+@dataclass
+class DecodedRevert:
+    """A decoded revert reason"""
+    name: str  # Custom error name, 'Error', 'Panic' or 'Unknown'
+    selector: str  # 0x-prefixed 4-byte selector ('' for empty revert data)
+    args: Dict[str, Any] = field(default_factory=dict)
+
+    def __str__(self) -> str:
+        if not self.args:
+            return self.name
+        return f"{self.name}({', '.join(f'{k}={v}' for k, v in self.args.items())})"
+
+
+class TransactionWouldRevert(Exception):
+    """Pre-flight simulation showed the transaction would revert; nothing was broadcast"""
+
+    def __init__(self, function: str, revert: DecodedRevert):
+        super().__init__(f"{function} would revert: {revert}")
+        self.function = function
+        self.revert = revert
+
+
+def _canonical_type(param: Dict) -> str:
+    if param["type"].startswith("tuple"):
+        inner = ",".join(_canonical_type(c) for c in param.get("components", []))
+        return f"({inner}){param['type'][len('tuple'):]}"
+    return param["type"]
+
+
+@lru_cache(maxsize=4)
+def error_map(abi_path: str = DEFAULT_ABI_PATH) -> Dict[bytes, Tuple[str, List[str], List[str]]]:
+    """selector -> (error name, input types, input names) for every custom error in the ABI"""
+    from eth_hash.auto import keccak
+
+    with open(abi_path, "r") as f:
+        abi = json.load(f)
+    errors = {}
+    for entry in abi:
+        if entry.get("type") != "error":
+            continue
+        types = [_canonical_type(i) for i in entry.get("inputs", [])]
+        names = [i.get("name") or f"arg{n}" for n, i in enumerate(entry.get("inputs", []))]
+        selector = keccak(f"{entry['name']}({','.join(types)})".encode())[:4]
+        errors[selector] = (entry["name"], types, names)
+    return errors
+
+
+def decode_revert(data: bytes, abi_path: str = DEFAULT_ABI_PATH) -> DecodedRevert:
+    """Decode revert data (selector + ABI-encoded args)"""
+    if len(data) < 4:
+        return DecodedRevert("Unknown", "")
+    selector, payload = data[:4], data[4:]
+    selector_hex = "0x" + selector.hex()
+
+    if selector == ERROR_STRING_SELECTOR:
+        from eth_abi import decode
+        try:
+            return DecodedRevert("Error", selector_hex, {"reason": decode(["string"], payload)[0]})
+        except Exception:
+            return DecodedRevert("Error", selector_hex)
+    if selector == PANIC_SELECTOR:
+        from eth_abi import decode
+        try:
+            code = decode(["uint256"], payload)[0]
+        except Exception:
+            return DecodedRevert("Panic", selector_hex)
+        return DecodedRevert("Panic", selector_hex, {"code": hex(code), "reason": PANIC_CODES.get(code, "unknown")})
+
+    known = error_map(abi_path).get(selector)
+    if known is None:
+        return DecodedRevert("Unknown", selector_hex, {"data": "0x" + data.hex()})
+    name, types, names = known
+    if not types:
+        return DecodedRevert(name, selector_hex)
+    from eth_abi import decode
+    try:
+        values = decode(types, payload)
+    except Exception:
+        return DecodedRevert(name, selector_hex, {"data": "0x" + payload.hex()})
+    return DecodedRevert(name, selector_hex, {
+        n: ("0x" + v.hex() if isinstance(v, bytes) else v) for n, v in zip(names, values)
+    })
+
+
+def revert_data_from_exception(exc: Exception) -> Optional[bytes]:
+    """
+    Raw revert data from a web3 call exception (ContractCustomError,
+    ContractLogicError, ContractPanicError or a raw JSON-RPC error dict),
+    or None if the exception carries none.
+    """
+    candidates = [getattr(exc, "data", None)]
+    candidates.extend(a for a in getattr(exc, "args", ()) if isinstance(a, (str, dict)))
+    for value in candidates:
+        if isinstance(value, dict):
+            value = value.get("data")
+        if isinstance(value, (bytes, bytearray)):
+            return bytes(value)
+        if isinstance(value, str) and value.startswith("0x"):
+            try:
+                return bytes.fromhex(value[2:])
+            except ValueError:
+                continue
+    return None
+
+
+def decode_exception(exc: Exception, abi_path: str = DEFAULT_ABI_PATH) -> Optional[DecodedRevert]:
+    """Decoded revert for a failed eth_call, or None if it was not a revert (network error, ...)"""
+    data = revert_data_from_exception(exc)
+    if data is not None:
+        return decode_revert(data, abi_path)
+    message = str(exc)
+    if "revert" in message.lower():
+        return DecodedRevert("Error", "", {"reason": message})
+    return None
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+AIJudgeMarket Multi-Endpoint RPC Routing
+Web3 provider that spreads reads over several JSON-RPC endpoints and hedges
+slow requests.
+
+  - Per-endpoint rolling latency and error rate; JSON-RPC error responses
+    (rate limits, "header not found", ...) count as failures and fail over,
+    except execution reverts, which every node answers the same way
+  - Reads go to the fastest healthy endpoint
+  - If the primary has not answered within its p95 latency, a duplicate
+    (hedged) request is sent to the next-best endpoint; first answer wins
+  - Writes and nonce lookups always use the first (write) endpoint so
+    nonces are never read from a node that has not seen our last send
+
+Example:
+    provider = RoutingProvider([
+        "https://sepolia.base.org",
+        "https://base-sepolia.example-rpc.com",
+    ])
+    w3 = Web3(provider)
+"""
+
+import contextvars
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Dict, List, Optional, Sequence
+
+from web3 import HTTPProvider
+from web3.providers.base import BaseProvider
+
+# Methods that must hit a single endpoint to keep nonce handling consistent
+WRITE_METHODS = {
+    "eth_sendRawTransaction",
+    "eth_sendTransaction",
+    "eth_getTransactionCount",
+}
+
+
+class EndpointError(Exception):
+    """A JSON-RPC error response from one endpoint; another may answer"""
+
+    def __init__(self, response: dict):
+        super().__init__(response["error"].get("message", "JSON-RPC error")
+                         if isinstance(response["error"], dict) else str(response["error"]))
+        self.response = response
+
+
+def is_endpoint_error(response) -> bool:
+    """
+    True for an error response that says something about the endpoint rather
+    than the request. Reverts (code 3, "execution reverted") are answers.
+    """
+    if not isinstance(response, dict) or "error" not in response:
+        return False
+    error = response["error"]
+    if not isinstance(error, dict):
+        return True
+    return error.get("code") != 3 and "revert" not in str(error.get("message", "")).lower()
+
+
+def make_http_provider(endpoint_uri: str, provider_class=HTTPProvider, **kwargs) -> BaseProvider:
+    """
+    Build an HTTP provider with web3's own retry loop disabled (web3 >= 7),
+    since the router fails over to another endpoint instead of retrying.
+    """
+    try:
+        return provider_class(endpoint_uri, exception_retry_configuration=None, **kwargs)
+    except TypeError:
+        return provider_class(endpoint_uri, **kwargs)
+
+
+class EndpointStats:
+    """Rolling latency / error window for one endpoint"""
+
+    def __init__(self, window: int = 100):
+        self.latencies = deque(maxlen=window)
+        self.outcomes = deque(maxlen=window)  # True = success
+        self._lock = threading.Lock()
+
+    def observe(self, latency: float, ok: bool):
+        with self._lock:
+            self.outcomes.append(ok)
+            if ok:
+                self.latencies.append(latency)
+
+    @property
+    def error_rate(self) -> float:
+        with self._lock:
+            if not self.outcomes:
+                return 0.0
+            return 1 - sum(self.outcomes) / len(self.outcomes)
+
+    def percentile(self, pct: float) -> Optional[float]:
+        with self._lock:
+            if not self.latencies:
+                return None
+            ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(pct / 100 * len(ordered)))]
+
+    @property
+    def samples(self) -> int:
+        return len(self.outcomes)
+
+
+class RoutingProvider(BaseProvider):
+    """
+    Provider routing JSON-RPC requests across several HTTP endpoints.
+
+    Args:
+        endpoint_uris: RPC URLs; the first one is the write endpoint
+        providers: Optional pre-built providers (same order), e.g. instrumented ones
+        hedge_percentile: Latency percentile of the primary after which to hedge
+        min_hedge_delay: Lower bound on the hedge delay in seconds
+        default_hedge_delay: Hedge delay used until an endpoint has enough samples
+        max_error_rate: Endpoints above this rolling error rate are treated as unhealthy
+        window: Number of recent requests kept per endpoint
+    """
+
+    def __init__(
+        self,
+        endpoint_uris: Sequence[str],
+        providers: Optional[Sequence[BaseProvider]] = None,
+        hedge_percentile: float = 95,
+        min_hedge_delay: float = 0.05,
+        default_hedge_delay: float = 1.0,
+        max_error_rate: float = 0.5,
+        window: int = 100
+    ):
+        super().__init__()
+        if not endpoint_uris:
+            raise ValueError("At least one RPC endpoint is required")
+        self.endpoint_uris = list(endpoint_uris)
+        self.endpoint_uri = self.endpoint_uris[0]
+        self.providers = list(providers) if providers else [make_http_provider(u) for u in self.endpoint_uris]
+        self.stats = {uri: EndpointStats(window) for uri in self.endpoint_uris}
+        self.hedge_percentile = hedge_percentile
+        self.min_hedge_delay = min_hedge_delay
+        self.default_hedge_delay = default_hedge_delay
+        self.max_error_rate = max_error_rate
+        self._pool = ThreadPoolExecutor(max_workers=max(4, len(self.endpoint_uris) * 4))
+
+    # ==================== SELECTION ====================
+
+    def ranked_endpoints(self) -> List[int]:
+        """Endpoint indices ordered best-first: healthy before unhealthy, then by median latency"""
+        def key(i: int):
+            stats = self.stats[self.endpoint_uris[i]]
+            unhealthy = stats.samples >= 5 and stats.error_rate > self.max_error_rate
+            # Unmeasured endpoints sort first so every endpoint gets probed
+            median = stats.percentile(50)
+            return (unhealthy, median if median is not None else 0.0, i)
+        return sorted(range(len(self.endpoint_uris)), key=key)
+
+    def hedge_delay(self, index: int) -> float:
+        stats = self.stats[self.endpoint_uris[index]]
+        if stats.samples < 20:
+            return self.default_hedge_delay
+        return max(self.min_hedge_delay, stats.percentile(self.hedge_percentile) or 0.0)
+
+    # ==================== REQUESTS ====================
+
+    def _request(self, index: int, method, params, failover: bool = True):
+        uri = self.endpoint_uris[index]
+        start = time.perf_counter()
+        try:
+            response = self.providers[index].make_request(method, params)
+        except Exception:
+            self.stats[uri].observe(time.perf_counter() - start, False)
+            raise
+        if failover and is_endpoint_error(response):
+            # Fails fast, but is no answer: must not win the race or look healthy
+            self.stats[uri].observe(time.perf_counter() - start, False)
+            raise EndpointError(response)
+        self.stats[uri].observe(time.perf_counter() - start, True)
+        return response
+
+    def _submit(self, index: int, method, params):
+        # Carry context variables (e.g. request priority) into the worker thread
+        context = contextvars.copy_context()
+        return self._pool.submit(context.run, self._request, index, method, params)
+
+    def make_request(self, method, params):
+        try:
+            return self._route(method, params)
+        except EndpointError as e:
+            # Every endpoint failed: hand web3 the last error response to raise on
+            return e.response
+
+    def _route(self, method, params):
+        if method in WRITE_METHODS:
+            # Send errors ("nonce too low", "already known") are answers, not endpoint failures
+            return self._request(0, method, params, failover=False)
+        if len(self.providers) == 1:
+            return self._request(0, method, params)
+
+        ranked = self.ranked_endpoints()
+        pending = {self._submit(ranked[0], method, params)}
+        next_idx = 1
+        delay = self.hedge_delay(ranked[0])
+        last_error = None
+
+        while pending:
+            done, pending = wait(pending, timeout=delay, return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    return future.result()
+                except Exception as e:
+                    last_error = e
+            # Primary slow (timeout) or failed: hedge/fail over to the next-best endpoint
+            if next_idx < len(ranked):
+                pending.add(self._submit(ranked[next_idx], method, params))
+                delay = self.hedge_delay(ranked[next_idx])
+                next_idx += 1
+            elif not done:
+                # Every endpoint is in flight, just wait for the first answer
+                delay = None
+
+        raise last_error
+
+    def is_connected(self, show_traceback: bool = False) -> bool:
+        return any(p.is_connected() for p in self.providers)
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """Rolling health per endpoint"""
+        return {
+            uri: {
+                "samples": s.samples,
+                "error_rate": s.error_rate,
+                "p50": s.percentile(50),
+                "p95": s.percentile(95),
+            }
+            for uri, s in self.stats.items()
+        }
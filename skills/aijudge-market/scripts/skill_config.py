@@ -0,0 +1,377 @@
+#!/usr/bin/env python3
+"""
+AIJudgeMarket Live Skill Config
+Disk-cached fetch of the live skill.md and a parser that turns it into a
+structured config (contract address, chains, USDC addresses, parameters).
+
+  - Cached copy is served while fresh (max_age), no network at all
+  - Once stale it is revalidated with If-None-Match / If-Modified-Since;
+    a 304 just refreshes the timestamp
+  - stale_while_revalidate=True returns the stale copy immediately and
+    revalidates in a background thread, so agent cold starts never block
+    on the network once a copy exists
+  - If the server is unreachable the last good copy is used
+
+Example:
+    cache = SkillConfigCache()
+    config = parse_skill_config(cache.fetch(stale_while_revalidate=True))
+
+    chain = config.chain("eth-sepolia")
+    print(chain.chain_id, chain.rpc_url, chain.usdc_address)
+
+Usage:
+    python3 skill_config.py
+    python3 skill_config.py --url http://localhost:8000/skill.md --max-age 0
+"""
+
+import argparse
+import copy
+import hashlib
+import json
+import os
+import re
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from dataclasses import asdict, dataclass, field
+from functools import lru_cache
+from typing import Dict, List, Optional, Union
+
+SKILL_CONFIG_URL = "https://departmentofpredictions.com/skill.md"
+
+# Short chain names used throughout the client, by chain ID
+CHAIN_NAMES = {
+    11155111: "eth-sepolia",
+    84532: "base-sepolia",
+    5042002: "arc-testnet",
+}
+
+ADDRESS_RE = re.compile(r"0x[0-9a-fA-F]{40}")
+
+
+def default_cache_dir() -> str:
+    """$AIJUDGE_CACHE_DIR, else $XDG_CACHE_HOME/aijudge, else ~/.cache/aijudge"""
+    if os.environ.get("AIJUDGE_CACHE_DIR"):
+        return os.environ["AIJUDGE_CACHE_DIR"]
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "aijudge")
+
+
+# ==================== PARSED CONFIG ====================
+
+@dataclass
+class ChainConfig:
+    """One row of the Chain Configuration table"""
+    name: str  # Short name (eth-sepolia, ...) or slug of the display name
+    display_name: str
+    chain_id: int
+    rpc_url: str
+    usdc_address: str
+    status: str  # Active, Planned, ...
+
+    @property
+    def active(self) -> bool:
+        return self.status.lower() == "active"
+
+
+@dataclass
+class SkillConfig:
+    """Structured view of skill.md"""
+    contract_address: Optional[str] = None
+    admin_address: Optional[str] = None
+    chains: List[ChainConfig] = field(default_factory=list)
+    parameters: Dict[str, str] = field(default_factory=dict)  # e.g. challenge_window -> "24 hours"
+    courts: Dict[int, str] = field(default_factory=dict)
+    verifiers: Dict[str, str] = field(default_factory=dict)  # groth16 / plonk gateway addresses
+
+    def chain(self, key: Union[str, int]) -> Optional[ChainConfig]:
+        """Look up a chain by short name, display name or chain ID"""
+        for chain in self.chains:
+            if key in (chain.name, chain.chain_id) or str(key).lower() == chain.display_name.lower():
+                return chain
+        return None
+
+    @property
+    def chain_ids(self) -> Dict[str, int]:
+        return {c.name: c.chain_id for c in self.chains}
+
+    @property
+    def usdc_addresses(self) -> Dict[str, str]:
+        return {c.name: c.usdc_address for c in self.chains if c.usdc_address}
+
+    @property
+    def rpc_urls(self) -> Dict[str, str]:
+        return {c.name: c.rpc_url for c in self.chains if c.rpc_url}
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+
+def _sections(markdown: str) -> Dict[str, str]:
+    """Split markdown into {heading text: body} for ## and ### headings"""
+    sections = {}
+    heading = ""
+    lines: List[str] = []
+    for line in markdown.splitlines():
+        match = re.match(r"^#{2,3}\s+(.*?)\s*$", line)
+        if match:
+            sections[heading] = "\n".join(lines)
+            heading, lines = match.group(1), []
+        else:
+            lines.append(line)
+    sections[heading] = "\n".join(lines)
+    return sections
+
+
+def _find_section(sections: Dict[str, str], prefix: str) -> str:
+    for heading, body in sections.items():
+        if heading.lower().startswith(prefix.lower()):
+            return body
+    return ""
+
+
+def _table(body: str) -> List[Dict[str, str]]:
+    """Rows of the first markdown table in body, keyed by lower-cased header"""
+    rows = [line.strip() for line in body.splitlines() if line.strip().startswith("|")]
+    if len(rows) < 2:
+        return []
+
+    def cells(row: str) -> List[str]:
+        return [c.strip().strip("`").strip() for c in row.strip("|").split("|")]
+
+    headers = [h.lower() for h in cells(rows[0])]
+    return [dict(zip(headers, cells(row))) for row in rows[2:]]
+
+
+def _slug(name: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-")
+
+
+def parse_skill_config(markdown: str) -> SkillConfig:
+    """
+    Parse skill.md into a SkillConfig. Missing sections are left empty, so a
+    partial or reformatted document never raises.
+
+    Parsing is memoized per document; each caller gets its own copy, so
+    changing the returned config never leaks into other callers.
+    """
+    return copy.deepcopy(_parse_skill_config(markdown))
+
+
+@lru_cache(maxsize=8)
+def _parse_skill_config(markdown: str) -> SkillConfig:
+    config = SkillConfig()
+    if not markdown:
+        return config
+    sections = _sections(markdown)
+
+    match = ADDRESS_RE.search(_find_section(sections, "Contract Address"))
+    if match:
+        config.contract_address = match.group(0)
+    admin = re.search(r"Admin:\s*`?(0x[0-9a-fA-F]{40})", markdown)
+    if admin:
+        config.admin_address = admin.group(1)
+
+    for row in _table(_find_section(sections, "Chain Configuration")):
+        try:
+            chain_id = int(row.get("chain id", ""))
+        except ValueError:
+            continue
+        display = row.get("chain", "")
+        config.chains.append(ChainConfig(
+            name=CHAIN_NAMES.get(chain_id) or _slug(display),
+            display_name=display,
+            chain_id=chain_id,
+            rpc_url=row.get("rpc", ""),
+            usdc_address=row.get("usdc address", ""),
+            status=row.get("status", "")
+        ))
+
+    for match in re.finditer(r"^\s*-\s*\*\*(.+?)\*\*:\s*(.+?)\s*$",
+                             _find_section(sections, "Current Protocol Parameters"), re.M):
+        config.parameters[_slug(match.group(1)).replace("-", "_")] = match.group(2)
+
+    for row in _table(_find_section(sections, "Sub-Courts")):
+        try:
+            config.courts[int(row.get("id", ""))] = row.get("name", "")
+        except ValueError:
+            continue
+
+    for kind in ("Groth16", "PLONK"):
+        match = ADDRESS_RE.search(_find_section(sections, f"{kind} Verifier Gateway"))
+        if match:
+            config.verifiers[kind.lower()] = match.group(0)
+
+    return config
+
+
+# ==================== DISK CACHE ====================
+
+class SkillConfigCache:
+    """
+    On-disk HTTP cache for skill.md with conditional revalidation.
+
+    Each URL is stored as <key>.md (body) plus <key>.json (ETag,
+    Last-Modified, fetch time). Only validators the server sent are replayed;
+    a missing Last-Modified is never synthesized from the local clock, which
+    could produce false 304s under clock skew. Writes go through a temp file
+    and rename, so concurrent agents sharing a cache directory never see a
+    torn file.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, timeout: float = 10.0):
+        self.cache_dir = cache_dir or default_cache_dir()
+        self.timeout = timeout
+        self._refreshing: Dict[str, threading.Thread] = {}
+        self._lock = threading.Lock()
+
+    def _paths(self, url: str):
+        key = hashlib.sha256(url.encode()).hexdigest()[:16]
+        base = os.path.join(self.cache_dir, f"skill-{key}")
+        return base + ".md", base + ".json"
+
+    def _load(self, url: str) -> Optional[Dict]:
+        body_path, meta_path = self._paths(url)
+        try:
+            with open(meta_path, "r") as f:
+                meta = json.load(f)
+            with open(body_path, "r", encoding="utf-8") as f:
+                meta["body"] = f.read()
+            return meta
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _write(path: str, data: str):
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(data)
+        os.replace(tmp, path)
+
+    def _store(self, url: str, body: Optional[str], meta: Dict):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        body_path, meta_path = self._paths(url)
+        if body is not None:
+            self._write(body_path, body)
+        self._write(meta_path, json.dumps(meta))
+
+    def age(self, url: str = SKILL_CONFIG_URL) -> Optional[float]:
+        """Seconds since the cached copy was last fetched or revalidated"""
+        entry = self._load(url)
+        return time.time() - entry["fetched_at"] if entry else None
+
+    def revalidate(self, url: str = SKILL_CONFIG_URL) -> str:
+        """
+        Conditional GET against the server. Returns the current body; on
+        network failure returns the last cached body (or "" if none).
+        """
+        entry = self._load(url)
+        headers = {"User-Agent": "AIJudgeClient/1.0"}
+        if entry and entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry and entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+
+        try:
+            req = urllib.request.Request(url, headers=headers)
+            with urllib.request.urlopen(req, timeout=self.timeout) as resp:
+                body = resp.read().decode("utf-8")
+                meta = {
+                    "url": url,
+                    "etag": resp.headers.get("ETag"),
+                    "last_modified": resp.headers.get("Last-Modified"),
+                    "fetched_at": time.time(),
+                }
+            self._store(url, body, meta)
+            return body
+        except urllib.error.HTTPError as e:
+            if e.code == 304 and entry:
+                body = entry.pop("body")
+                entry["fetched_at"] = time.time()
+                self._store(url, None, entry)
+                return body
+            error = e
+        except Exception as e:
+            error = e
+
+        if entry:
+            print(f"Warning: Could not refresh live config from {url} ({error}); using cached copy")
+            return entry["body"]
+        print(f"Warning: Could not fetch live config from {url}: {error}")
+        return ""
+
+    def _revalidate_in_background(self, url: str):
+        with self._lock:
+            thread = self._refreshing.get(url)
+            if thread is not None and thread.is_alive():
+                return
+            thread = threading.Thread(target=self.revalidate, args=(url,), daemon=True)
+            self._refreshing[url] = thread
+        thread.start()
+
+    def wait(self, timeout: Optional[float] = None):
+        """Wait for background revalidations to finish"""
+        with self._lock:
+            threads = list(self._refreshing.values())
+        for thread in threads:
+            thread.join(timeout)
+
+    def fetch(
+        self,
+        url: str = SKILL_CONFIG_URL,
+        max_age: float = 300,
+        stale_while_revalidate: bool = False
+    ) -> str:
+        """
+        Return skill.md, using the disk cache where possible.
+
+        Args:
+            url: Config URL
+            max_age: Seconds a cached copy is served without revalidation
+            stale_while_revalidate: Return a stale copy immediately and refresh it
+                in the background instead of waiting on the network
+        """
+        entry = self._load(url)
+        if entry:
+            if time.time() - entry["fetched_at"] < max_age:
+                return entry["body"]
+            if stale_while_revalidate:
+                self._revalidate_in_background(url)
+                return entry["body"]
+        return self.revalidate(url)
+
+
+_default_caches: Dict[str, SkillConfigCache] = {}
+
+
+def get_cache(cache_dir: Optional[str] = None) -> SkillConfigCache:
+    """Shared SkillConfigCache per directory (so background refreshes are deduplicated)"""
+    cache_dir = cache_dir or default_cache_dir()
+    if cache_dir not in _default_caches:
+        _default_caches[cache_dir] = SkillConfigCache(cache_dir)
+    return _default_caches[cache_dir]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fetch and parse the live AIJudgeMarket skill config")
+    parser.add_argument("--url", default=SKILL_CONFIG_URL, help="Config URL")
+    parser.add_argument("--cache-dir", help="Cache directory (default: ~/.cache/aijudge)")
+    parser.add_argument("--max-age", type=float, default=300, help="Serve cached copy for this many seconds")
+    parser.add_argument("--raw", action="store_true", help="Print the markdown instead of the parsed config")
+
+    args = parser.parse_args()
+
+    body = get_cache(args.cache_dir).fetch(args.url, max_age=args.max_age)
+    if not body:
+        print("❌ Error: No config available")
+        sys.exit(1)
+    if args.raw:
+        print(body)
+    else:
+        print(json.dumps(parse_skill_config(body).to_dict(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+AIJudgeMarket CLI Startup Benchmark
+Times fresh interpreter start-up for offline commands and checks that they
+never import the heavy dependencies (web3, eth_account, eth_abi).
+
+Each case runs in a new process, like an agent invocation. The command fails
+(exit 1) if an offline case loads a heavy module or exceeds --max-ms, so it
+can gate CI.
+
+Usage:
+    python3 startup_benchmark.py
+    python3 startup_benchmark.py --runs 20 --max-ms 250 --output startup.json
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+HEAVY_MODULES = ("web3", "eth_account", "eth_abi")
+
+SALT = "0x" + "11" * 32
+
+# (name, argv after the interpreter, must stay offline)
+CASES = [
+    ("python (baseline)", ["-c", "pass"], True),
+    ("import aijudge_client", ["-c", "import aijudge_client"], True),
+    ("list_courts.py", ["list_courts.py"], True),
+    ("aijudge.py courts", ["aijudge.py", "courts"], True),
+    ("aijudge.py commit-hash", ["aijudge.py", "commit-hash", "--outcome", "yes", "--salt", SALT], True),
+    ("aijudge.py --help", ["aijudge.py", "--help"], True),
+    ("create_market.py --help", ["create_market.py", "--help"], True),
+    ("import web3 (reference)", ["-c", "import web3, eth_account"], False),
+]
+
+
+def heavy_imports(argv: List[str]) -> List[str]:
+    """Top-level heavy packages imported by a run, from -X importtime output"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime"] + argv,
+        cwd=SCRIPTS_DIR, capture_output=True, text=True
+    )
+    loaded = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        module = line.rsplit("|", 1)[-1].strip()
+        if module.split(".")[0] in HEAVY_MODULES:
+            loaded.add(module.split(".")[0])
+    return sorted(loaded)
+
+
+def time_case(argv: List[str], runs: int) -> List[float]:
+    """Wall-clock milliseconds per run"""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable] + argv, cwd=SCRIPTS_DIR,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def run_benchmark(runs: int) -> List[Dict]:
+    results = []
+    for name, argv, offline in CASES:
+        timings = time_case(argv, runs)
+        results.append({
+            "case": name,
+            "offline": offline,
+            "min_ms": min(timings),
+            "median_ms": statistics.median(timings),
+            "heavy_imports": heavy_imports(argv),
+        })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark CLI start-up time")
+    parser.add_argument("--runs", type=int, default=10, help="Runs per case (default: 10)")
+    parser.add_argument("--max-ms", type=float, help="Fail if an offline case's median exceeds this")
+    parser.add_argument("--output", help="Write results as JSON")
+
+    args = parser.parse_args()
+
+    print("⏱️  CLI Startup Benchmark")
+    print("=" * 70)
+    print(f"Python: {sys.version.split()[0]}  Runs per case: {args.runs}")
+    print("=" * 70)
+
+    results = run_benchmark(args.runs)
+    failures = []
+
+    print(f"\n{'Case':<28} {'min ms':>8} {'median ms':>10}  heavy imports")
+    for r in results:
+        heavy = ", ".join(r["heavy_imports"]) or "-"
+        print(f"{r['case']:<28} {r['min_ms']:>8.0f} {r['median_ms']:>10.0f}  {heavy}")
+        if not r["offline"]:
+            continue
+        if r["heavy_imports"]:
+            failures.append(f"{r['case']} imports {heavy}")
+        if args.max_ms is not None and r["median_ms"] > args.max_ms:
+            failures.append(f"{r['case']} median {r['median_ms']:.0f} ms > {args.max_ms:.0f} ms")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"\n💾 Results written to {args.output}")
+
+    print("=" * 70)
+    if failures:
+        for failure in failures:
+            print(f"❌ {failure}")
+        sys.exit(1)
+    print("✅ Offline commands start without web3 / eth_account / eth_abi")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Tests for skill_config.py against a local http.server stand-in.
+
+Usage:
+    python3 -m unittest test_skill_config
+"""
+
+import http.server
+import os
+import sys
+import tempfile
+import threading
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from skill_config import SkillConfigCache, parse_skill_config
+
+SKILL_MD = """# AIJudgeMarket
+
+## Contract Address
+
+`0x{}`
+
+## Chain Configuration
+
+| Chain | Chain ID | RPC | USDC Address | Status |
+|-------|----------|-----|--------------|--------|
+| Ethereum Sepolia | 11155111 | https://rpc.example | `0x{}` | Active |
+"""
+
+
+def skill_md(contract: str) -> str:
+    return SKILL_MD.format(contract * 40, "2" * 40)
+
+
+class SkillServer(http.server.BaseHTTPRequestHandler):
+    """Serves `body` with `etag`; answers 304 when If-None-Match matches"""
+    body = ""
+    etag = ""
+    requests = []
+
+    def do_GET(self):
+        SkillServer.requests.append(dict(self.headers))
+        if self.headers.get("If-None-Match") == self.etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+        data = self.body.encode()
+        self.send_response(200)
+        self.send_header("ETag", self.etag)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+class SkillConfigCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        SkillServer.body, SkillServer.etag, SkillServer.requests = skill_md("1"), '"v1"', []
+        self.server = http.server.HTTPServer(("127.0.0.1", 0), SkillServer)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.server.server_port}/skill.md"
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = SkillConfigCache(self.tmp.name)
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.tmp.cleanup()
+
+    def test_200_then_304_then_changed_etag(self):
+        body = self.cache.fetch(self.url, max_age=0)
+        self.assertEqual(parse_skill_config(body).contract_address, "0x" + "1" * 40)
+        self.assertNotIn("If-None-Match", SkillServer.requests[-1])
+
+        # Unchanged: revalidated with the stored ETag, served from disk
+        self.assertEqual(self.cache.fetch(self.url, max_age=0), body)
+        self.assertEqual(SkillServer.requests[-1].get("If-None-Match"), '"v1"')
+
+        # Changed: new body and ETag are stored and used for the next request
+        SkillServer.body, SkillServer.etag = skill_md("3"), '"v2"'
+        body = self.cache.fetch(self.url, max_age=0)
+        self.assertEqual(parse_skill_config(body).contract_address, "0x" + "3" * 40)
+        self.assertEqual(SkillServer.requests[-1].get("If-None-Match"), '"v1"')
+        self.cache.fetch(self.url, max_age=0)
+        self.assertEqual(SkillServer.requests[-1].get("If-None-Match"), '"v2"')
+        self.assertEqual(len(SkillServer.requests), 4)
+
+    def test_fresh_copy_skips_network(self):
+        self.cache.fetch(self.url, max_age=0)
+        self.cache.fetch(self.url, max_age=300)
+        self.assertEqual(len(SkillServer.requests), 1)
+
+    def test_no_synthesized_last_modified(self):
+        self.cache.fetch(self.url, max_age=0)
+        self.cache.fetch(self.url, max_age=0)
+        self.assertNotIn("If-Modified-Since", SkillServer.requests[-1])
+
+
+class ParseSkillConfigTest(unittest.TestCase):
+
+    def test_parsed_config_is_not_shared(self):
+        config = parse_skill_config(skill_md("1"))
+        config.contract_address = None
+        config.chains.clear()
+
+        config = parse_skill_config(skill_md("1"))
+        self.assertEqual(config.contract_address, "0x" + "1" * 40)
+        self.assertEqual(config.chain("eth-sepolia").usdc_address, "0x" + "2" * 40)
+
+
+if __name__ == "__main__":
+    unittest.main()